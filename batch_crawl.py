@@ -0,0 +1,263 @@
+"""
+여러 채널(YouTube/KakaoTV/NaverTV 혼합)을 프로세스 풀로 나눠 수집하는 배치 진입점.
+
+워커 프로세스마다 headless 브라우저 하나를 띄워 재사용하고, 채널마다 기존 collect_* 함수를 호출합니다.
+채널별 소요 시간과 실패를 따로 기록하므로 한 채널이 실패해도 나머지 배치는 계속 진행됩니다.
+워커 프로세스가 비정상 종료되면 끝나지 않은 채널만 새 풀에서 다시 시도합니다.
+채널 하나가 channel_timeout초를 넘기면 워커가 그 브라우저를 종료해 실패로 기록하고 다음 채널로 넘어갑니다.
+(워커가 그래도 응답하지 않으면 배치 쪽에서 워커 프로세스를 종료합니다)
+풀 워커는 atexit 처리기를 실행하지 않고 종료되므로, 브라우저는 multiprocessing 종료 처리(Finalize)로 닫습니다.
+
+채널 목록 파일(CSV, 헤더 필수, '#'으로 시작하는 줄은 무시):
+  platform,name,url
+  youtube,조선대학교 SW중심사업단,
+  kakao,조선대학교 SW중심사업단,https://tv.kakao.com/channel/10114190/video
+  naver,조선대학교 SW중심사업단,https://tv.naver.com/chosunswuniv?tab=clip
+
+실행 예:
+  python batch_crawl.py channels.csv --workers 4 --out batch_catalog.csv
+  python batch_crawl.py channels.csv --workers 2 --store crawl.db --show-browser
+"""
+
+import argparse
+import csv
+import multiprocessing as mp
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from multiprocessing import util
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from browser import create_collection_driver, lightweight_collection
+from csv_output import atomic_write_text
+from platforms import PLATFORMS, collect_videos
+from storage import open_store, save_round
+
+
+CHANNEL_TIMEOUT = 600
+# 워커 안의 시간 초과 처리도 듣지 않을 때, 결과 없이 이만큼 더 기다리면 워커 프로세스를 종료
+STALL_GRACE = 60
+
+# 워커 프로세스 전역 상태 (프로세스마다 브라우저 1개)
+_worker_driver = None
+_worker_options: Dict = {}
+_start_lock = None
+
+
+def load_channel_list(path: str) -> List[Dict]:
+    """
+    platform,name,url 형식의 채널 목록 CSV를 읽습니다.
+    """
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        rows = [line for line in f if line.strip() and not line.lstrip().startswith("#")]
+    channels = []
+    for row in csv.DictReader(rows):
+        platform = (row.get("platform") or "").strip().lower()
+        name = (row.get("name") or "").strip()
+        if platform not in PLATFORMS or not name:
+            print(f"채널 목록 항목 건너뜀 (플랫폼/이름 확인): {row}")
+            continue
+        channels.append({"platform": platform, "name": name, "url": (row.get("url") or "").strip() or None})
+    return channels
+
+
+def init_worker(start_lock, headless: bool, lightweight: bool):
+    global _start_lock, _worker_options
+    _start_lock = start_lock
+    _worker_options = {"headless": headless, "lightweight": lightweight}
+    # 풀/Process 워커는 os._exit로 끝나 atexit가 실행되지 않지만, exitpriority가 있는 Finalize는 종료 직전에 실행됩니다.
+    util.Finalize(None, close_worker_driver, exitpriority=10)
+
+
+def get_worker_driver():
+    global _worker_driver
+    if _worker_driver is None:
+        # undetected_chromedriver가 드라이버 파일을 패치하므로 동시에 시작하지 않도록 직렬화
+        with _start_lock:
+            started = time.perf_counter()
+            _worker_driver = create_collection_driver(headless=_worker_options.get("headless", True))
+            print(f"[워커 {os.getpid()}] 브라우저 시작 {time.perf_counter() - started:.1f}초")
+    return _worker_driver
+
+
+def close_worker_driver():
+    global _worker_driver
+    if _worker_driver is not None:
+        try:
+            _worker_driver.quit()
+        except Exception:
+            pass
+        _worker_driver = None
+
+
+def crawl_channel(job: Dict, timeout: Optional[float] = None) -> Dict:
+    """
+    워커에서 채널 하나를 수집합니다. 예외는 결과의 error로 돌려주고, 브라우저는 다음 채널을 위해 새로 만듭니다.
+    timeout(초)을 넘기면 브라우저를 종료해 진행 중인 수집을 끊고 시간 초과로 기록합니다.
+    """
+    started = time.perf_counter()
+    result = {**job, "ok": False, "records": [], "error": None, "pid": os.getpid()}
+    expired = threading.Event()
+
+    def expire():
+        expired.set()
+        print(f"[워커 {os.getpid()}] 시간 초과 ({timeout:.0f}초) → 브라우저 종료: {job['platform']} | {job['name']}")
+        close_worker_driver()
+
+    timer = threading.Timer(timeout, expire) if timeout else None
+    try:
+        driver = get_worker_driver()
+        if timer is not None:
+            timer.daemon = True
+            timer.start()
+        with lightweight_collection(driver, enabled=_worker_options.get("lightweight", True)):
+            result["records"] = collect_videos(driver, job["platform"], job["name"], channel_url=job.get("url"))
+        result["ok"] = True
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        close_worker_driver()
+    finally:
+        if timer is not None:
+            timer.cancel()
+    if expired.is_set():
+        # 브라우저 종료 후 수집기가 부분 결과를 반환했더라도 실패로 처리
+        result.update(ok=False, records=[], error=f"시간 초과 ({timeout:.0f}초)")
+    result["elapsed"] = time.perf_counter() - started
+    return result
+
+
+def terminate_workers(pool: ProcessPoolExecutor):
+    """
+    응답하지 않는 워커 프로세스를 강제로 종료합니다. (종료 처리가 실행되지 않으므로 최후 수단)
+    """
+    procs = list((getattr(pool, "_processes", None) or {}).values())  # shutdown()이 목록을 비우므로 먼저 확보
+    pool.shutdown(wait=False, cancel_futures=True)
+    for proc in procs:
+        if proc.is_alive():
+            proc.terminate()
+
+
+def run_batch(channels: List[Dict], workers: int = 4, headless: bool = True, lightweight: bool = True,
+              retries: int = 1, channel_timeout: Optional[float] = CHANNEL_TIMEOUT) -> List[Dict]:
+    """
+    채널 목록을 최대 workers개 프로세스로 나눠 수집합니다. 반환 순서는 채널 목록 순서와 같습니다.
+    channel_timeout(초)을 넘긴 채널은 시간 초과 실패로 기록합니다. (None이면 제한 없음)
+    """
+    results: Dict[int, Dict] = {}
+    pending = list(enumerate(channels))
+    stall_timeout = channel_timeout + STALL_GRACE if channel_timeout else None
+    attempt = 0
+    with mp.Manager() as manager:
+        start_lock = manager.Lock()
+        while pending and attempt <= retries:
+            attempt += 1
+            broken = []
+            with ProcessPoolExecutor(max_workers=max(1, min(workers, len(pending))), initializer=init_worker,
+                                     initargs=(start_lock, headless, lightweight)) as pool:
+                futures = {pool.submit(crawl_channel, job, channel_timeout): (i, job) for i, job in pending}
+                waiting = set(futures)
+                while waiting:
+                    done, waiting = wait(waiting, timeout=stall_timeout, return_when=FIRST_COMPLETED)
+                    if not done:
+                        # 워커 안의 시간 초과 처리도 듣지 않음 → 실행 중인 채널은 실패, 시작 전 채널은 새 풀에서 재시도
+                        print(f"{stall_timeout:.0f}초 동안 결과 없음 → 워커 프로세스 종료")
+                        for fut in waiting:
+                            i, job = futures[fut]
+                            if fut.running():
+                                results[i] = {**job, "ok": False, "records": [], "elapsed": stall_timeout,
+                                              "error": f"시간 초과 (워커 응답 없음, {stall_timeout:.0f}초)"}
+                            else:
+                                broken.append((i, job))
+                        terminate_workers(pool)
+                        break
+                    for fut in done:
+                        i, job = futures[fut]
+                        try:
+                            res = fut.result()
+                        except BrokenProcessPool:
+                            broken.append((i, job))
+                            continue
+                        except Exception as e:
+                            res = {**job, "ok": False, "records": [], "error": f"{type(e).__name__}: {e}",
+                                   "elapsed": 0.0}
+                        results[i] = res
+                        status = f"{len(res['records'])}개" if res["ok"] else f"실패 ({res['error']})"
+                        print(f"[{len(results)}/{len(channels)}] {job['platform']} | {job['name']} | {status} | "
+                              f"{res['elapsed']:.1f}초")
+            if broken:
+                print(f"워커 프로세스 비정상 종료 → 미완료 채널 {len(broken)}개 재시도")
+            pending = broken
+    for i, job in pending:
+        results[i] = {**job, "ok": False, "records": [], "error": "워커 프로세스 비정상 종료", "elapsed": 0.0}
+    return [results[i] for i in sorted(results)]
+
+
+def merge_catalog(results: List[Dict], saved_at: str) -> pd.DataFrame:
+    """
+    성공한 채널의 레코드를 platform/channel 컬럼을 붙여 하나의 카탈로그로 합칩니다.
+    """
+    rows = [
+        {"platform": res["platform"], "channel": res["name"], **rec}
+        for res in results if res["ok"] for rec in res["records"]
+    ]
+    df = pd.DataFrame(rows, columns=["platform", "channel", "index", "title", "views", "url", "duration",
+                                     "duration_seconds"])
+    for col in ("index", "views", "duration_seconds"):
+        df[col] = df[col].astype("Int64")
+    df["saved_at"] = saved_at
+    return df
+
+
+def print_summary(results: List[Dict], wall: float):
+    print(f"\n{'플랫폼':<8}{'영상':>6}{'시간(s)':>9}  채널")
+    for res in results:
+        count = len(res["records"]) if res["ok"] else "실패"
+        print(f"{res['platform']:<8}{count:>6}{res['elapsed']:>9.1f}  {res['name']}" + ("" if res["ok"] else f"  ({res['error']})"))
+    ok = [r for r in results if r["ok"]]
+    serial = sum(r["elapsed"] for r in results)
+    print(f"\n성공 {len(ok)}/{len(results)}개 채널, 영상 {sum(len(r['records']) for r in ok)}개 | "
+          f"전체 {wall:.1f}초 (채널별 합계 {serial:.1f}초, {serial / wall if wall else 0:.1f}배)")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="여러 채널을 프로세스 풀로 수집")
+    parser.add_argument("channels", help="platform,name,url 형식의 채널 목록 CSV")
+    parser.add_argument("--workers", type=int, default=4, help="동시에 띄울 브라우저(프로세스) 수")
+    parser.add_argument("--out", default="batch_catalog.csv", help="합친 카탈로그 CSV 경로")
+    parser.add_argument("--store", default=None, help="SQLite 저장소 경로 (지정 시 채널별 스냅샷 기록)")
+    parser.add_argument("--show-browser", action="store_true", help="headless 대신 창을 띄워 실행")
+    parser.add_argument("--channel-timeout", type=float, default=CHANNEL_TIMEOUT,
+                        help="채널 하나의 최대 수집 시간(초, 0이면 제한 없음)")
+    parser.add_argument("--no-lightweight", action="store_true", help="이미지/미디어/폰트 차단 끄기")
+    args = parser.parse_args(argv)
+
+    channels = load_channel_list(args.channels)
+    print(f"채널 {len(channels)}개, 워커 {args.workers}개로 수집을 시작합니다.")
+    started = time.perf_counter()
+    results = run_batch(channels, workers=args.workers, headless=not args.show_browser,
+                        lightweight=not args.no_lightweight, channel_timeout=args.channel_timeout or None)
+    wall = time.perf_counter() - started
+
+    saved_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    df = merge_catalog(results, saved_at)
+    atomic_write_text(args.out, lambda f: df.to_csv(f, index=False), encoding="utf-8-sig")
+    print(f"카탈로그 저장: {args.out} | {len(df)}개")
+    if args.store:
+        store = open_store(args.store)
+        try:
+            for res in results:
+                if res["ok"]:
+                    save_round(store, res["platform"], res["name"], res["records"], saved_at)
+        finally:
+            store.close()
+        print(f"저장소 기록: {args.store}")
+    print_summary(results, wall)
+
+
+if __name__ == "__main__":
+    main()
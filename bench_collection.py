@@ -0,0 +1,55 @@
+"""
+경량 수집 모드 측정 스크립트.
+
+같은 채널을 (1) 기본 브라우저와 (2) 이미지/미디어/폰트 차단 브라우저로 각각 수집하여
+전송 바이트, 완료/차단 요청 수, 수집 소요 시간, 수집 영상 수를 비교합니다.
+
+실행 예:
+  python bench_collection.py --platform youtube --channel "조선대학교 SW중심사업단"
+  python bench_collection.py --platform kakao --url https://tv.kakao.com/channel/10114190/video --headless
+"""
+
+import argparse
+
+from browser import create_driver, lightweight_collection, measure_transfer
+from platforms import collect_videos
+
+
+def run_once(platform: str, channel: str, url: str, lightweight: bool, headless: bool) -> dict:
+    driver = create_driver(headless=headless, performance_log=True)
+    try:
+        with lightweight_collection(driver, enabled=lightweight):
+            res = measure_transfer(driver, collect_videos, driver, platform, channel, url)
+    finally:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    res["videos"] = len(res.pop("result") or [])
+    return res
+
+
+def main():
+    parser = argparse.ArgumentParser(description="경량 수집 모드 전송량/시간 비교")
+    parser.add_argument("--platform", choices=["youtube", "kakao", "naver"], required=True)
+    parser.add_argument("--channel", default="조선대학교 SW중심사업단")
+    parser.add_argument("--url", default=None, help="채널 URL (YouTube는 지정 시 검색 생략)")
+    parser.add_argument("--headless", action="store_true", help="두 실행 모두 headless로 측정")
+    args = parser.parse_args()
+
+    results = {}
+    for label, lightweight in (("기본", False), ("경량", True)):
+        print(f"\n=== {label} 모드 수집 ===")
+        results[label] = run_once(args.platform, args.channel, args.url, lightweight, args.headless)
+
+    print(f"\n{'모드':<6}{'전송(MB)':>10}{'요청':>8}{'차단':>8}{'시간(s)':>10}{'영상':>8}")
+    for label, r in results.items():
+        print(f"{label:<6}{r['bytes'] / 1_048_576:>10.2f}{r['requests']:>8}{r['blocked']:>8}{r['elapsed']:>10.1f}{r['videos']:>8}")
+    base, light = results["기본"], results["경량"]
+    if base["bytes"] and base["elapsed"]:
+        print(f"\n전송량 {100 * (1 - light['bytes'] / base['bytes']):.1f}% 감소, "
+              f"수집 시간 {100 * (1 - light['elapsed'] / base['elapsed']):.1f}% 감소")
+
+
+if __name__ == "__main__":
+    main()
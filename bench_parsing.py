@@ -0,0 +1,193 @@
+"""
+조회수/재생 길이 파서 마이크로 벤치마크.
+
+대량의 합성 조회수/길이 문자열에 대해 다음 세 가지를 비교합니다.
+- legacy: 분리 전 kakao/naver 스크립트에 있던 단건 함수 그대로 (호출마다 정규식 조회)
+- scalar: parsing 모듈의 단건 함수 (사전 컴파일 정규식)
+- batch:  parsing 모듈의 일괄 함수 (pandas 벡터화)
+
+실행: python bench_parsing.py [--size 200000] [--repeat 3]
+"""
+
+import argparse
+import random
+import re
+import time
+from typing import Callable, List, Optional
+
+from parsing import (
+    parse_duration_to_seconds,
+    parse_durations_batch,
+    parse_views_batch,
+    parse_views_generic,
+)
+
+
+# 아래 세 함수는 분리 전 kakao_auto_crawl.py / naver_auto_crawl.py에 있던 코드를 이름만 바꿔 그대로 옮긴 것입니다.
+def legacy_parse_duration_to_seconds(text: str) -> Optional[int]:
+    if not text:
+        return None
+    t = re.sub(r"\s+", "", text).upper()
+    if any(k in t for k in ["LIVE", "실시간", "스트리밍", "PREMIERE", "예정"]):
+        return None
+    m = re.match(r"^(?:(\d+):)?(\d{1,2}):(\d{2})$", t)
+    if not m:
+        return None
+    h = int(m.group(1) or 0)
+    m_ = int(m.group(2))
+    s = int(m.group(3))
+    return h * 3600 + m_ * 60 + s
+
+
+def legacy_parse_korean_views(text: str) -> Optional[int]:
+    if not text:
+        return None
+    raw = text.strip()
+    lower = raw.lower()
+    if any(k in lower for k in ["no views", "조회수 없음", "조회수없음"]):
+        return 0
+    t = raw.replace("조회수", "").replace("조회", "").replace("재생", "").replace("회", "")
+    t = re.sub(r"\s+", "", t)
+    m = re.match(r"^([0-9]+(?:\.[0-9]+)?)(억|만|천)?$", t)
+    if m:
+        num = float(m.group(1))
+        unit = m.group(2)
+        if unit == "억":
+            num *= 100_000_000
+        elif unit == "만":
+            num *= 10_000
+        elif unit == "천":
+            num *= 1_000
+        return int(num)
+    m_en = re.match(r"^([0-9]+(?:\.[0-9]+)?)([KMBkmb])?$", re.sub(r"[^0-9KMBkmb\.]", "", lower))
+    if m_en:
+        num = float(m_en.group(1))
+        unit = (m_en.group(2) or '').upper()
+        if unit == 'K':
+            num *= 1_000
+        elif unit == 'M':
+            num *= 1_000_000
+        elif unit == 'B':
+            num *= 1_000_000_000
+        return int(num)
+    m2 = re.search(r"([0-9][0-9,]*)", raw)
+    if m2:
+        return int(m2.group(1).replace(",", ""))
+    return None
+
+
+def legacy_parse_views_generic(text: str) -> Optional[int]:
+    if not text:
+        return None
+    t = text.strip()
+    t_clean = re.sub(r"(조회수|조회|재생수|재생|views|view)", "", t, flags=re.IGNORECASE)
+    t_clean = t_clean.replace("회", "").strip()
+    v = legacy_parse_korean_views(t_clean)
+    if v is not None:
+        return v
+    m = re.search(r"([0-9][0-9,]*)", t)
+    if m:
+        return int(m.group(1).replace(",", ""))
+    return None
+
+
+def make_views_corpus(size: int, rng: random.Random) -> List[Optional[str]]:
+    def one() -> Optional[str]:
+        n = rng.randint(0, 9_999_999)
+        small = f"{rng.randint(1, 999)}.{rng.randint(0, 9)}"
+        form = rng.randrange(13)
+        if form == 0:
+            return f"조회수 {n:,}회"
+        if form == 1:
+            return f"조회수 {small}만회"
+        if form == 2:
+            return f"조회수 {rng.randint(1, 9)}.{rng.randint(0, 9)}억회"
+        if form == 3:
+            return f"{rng.randint(1, 9)}.{rng.randint(0, 9)}천회"
+        if form == 4:
+            return f"{n:,} views"
+        if form == 5:
+            return f"{small}K views"
+        if form == 6:
+            return f"{rng.randint(1, 99)}.{rng.randint(0, 9)}M views"
+        if form == 7:
+            return f"{rng.randint(1, 3)}.{rng.randint(0, 9)}B views"
+        if form == 8:
+            return f"재생수 {n:,}"
+        if form == 9:
+            return f"재생 {small}만"
+        if form == 10:
+            return rng.choice(["No views", "조회수 없음", "", None])
+        if form == 11:
+            return f"{n}"
+        return "조회수 정보 없음"
+    return [one() for _ in range(size)]
+
+
+def make_duration_corpus(size: int, rng: random.Random) -> List[Optional[str]]:
+    def one() -> Optional[str]:
+        form = rng.randrange(6)
+        if form == 0:
+            return f"{rng.randint(1, 9)}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}"
+        if form in (1, 2):
+            return f"{rng.randint(0, 59)}:{rng.randint(0, 59):02d}"
+        if form == 3:
+            return f" \n {rng.randint(0, 59)}:{rng.randint(0, 59):02d} \n"
+        if form == 4:
+            return rng.choice(["LIVE", "실시간", "Premiere", "예정", "SHORTS"])
+        return rng.choice(["", None])
+    return [one() for _ in range(size)]
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def verify(name: str, scalar: Callable, batch: Callable, corpus: List[Optional[str]]):
+    expected = [scalar(x) for x in corpus]
+    got = [None if v is None or v != v else int(v) for v in batch(corpus).astype(object).where(lambda s: s.notna(), None)]
+    mismatches = [(x, e, g) for x, e, g in zip(corpus, expected, got) if e != g]
+    if mismatches:
+        for x, e, g in mismatches[:10]:
+            print(f"  불일치 {name}: {x!r} → scalar={e} batch={g}")
+        raise SystemExit(f"{name}: 일괄 결과가 단건 결과와 다릅니다 ({len(mismatches)}건)")
+    print(f"{name}: 단건/일괄 결과 일치 ({len(corpus):,}건)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="조회수/길이 파서 벤치마크")
+    parser.add_argument("--size", type=int, default=200_000, help="문자열 개수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    views = make_views_corpus(args.size, rng)
+    durations = make_duration_corpus(args.size, rng)
+
+    verify("views", parse_views_generic, parse_views_batch, views)
+    verify("duration", parse_duration_to_seconds, parse_durations_batch, durations)
+
+    rows = [
+        ("views", "legacy", lambda: [legacy_parse_views_generic(x) for x in views]),
+        ("views", "scalar", lambda: [parse_views_generic(x) for x in views]),
+        ("views", "batch", lambda: parse_views_batch(views)),
+        ("duration", "legacy", lambda: [legacy_parse_duration_to_seconds(x) for x in durations]),
+        ("duration", "scalar", lambda: [parse_duration_to_seconds(x) for x in durations]),
+        ("duration", "batch", lambda: parse_durations_batch(durations)),
+    ]
+    print(f"\n{'대상':<10}{'방식':<8}{'시간(s)':>10}{'건/초':>14}{'legacy 대비':>12}")
+    baseline = {}
+    for kind, label, fn in rows:
+        sec = best_of(fn, args.repeat)
+        baseline.setdefault(kind, sec)
+        print(f"{kind:<10}{label:<8}{sec:>10.3f}{args.size / sec:>14,.0f}{baseline[kind] / sec:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
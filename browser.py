@@ -0,0 +1,162 @@
+"""
+브라우저 생성/수집 전용 프로필 도우미.
+
+- build_chrome_options: 세 스크립트가 공통으로 쓰던 uc.ChromeOptions 설정(창 크기 고정, 백그라운드 스로틀링 완화)
+- lightweight_collection: 수집하는 동안 DevTools(Network.setBlockedURLs)로 이미지/미디어/폰트 요청을 차단
+- measure_transfer: performance 로그의 Network.loadingFinished를 합산해 전송 바이트를 측정
+- capture_response_bodies: performance 로그에서 특정 URL의 응답을 찾아 본문(JSON)을 가져옴
+"""
+
+import base64
+import json
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import undetected_chromedriver as uc
+
+
+# 수집(메타데이터)에는 필요 없는 리소스: 썸네일/이미지, 웹 폰트, 미리보기 영상/오디오
+BLOCKED_URL_PATTERNS: List[str] = [
+    # 이미지
+    "*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.avif*", "*.svg*", "*.ico*",
+    "*://i.ytimg.com/*", "*://i9.ytimg.com/*", "*://yt3.ggpht.com/*", "*://phinf.pstatic.net/*",
+    # 폰트
+    "*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*://fonts.gstatic.com/*",
+    # 미디어
+    "*.mp4*", "*.webm*", "*.m3u8*", "*.m4s*", "*.mp3*", "*://*.googlevideo.com/*",
+]
+
+
+def build_chrome_options(headless: bool = False, performance_log: bool = False) -> uc.ChromeOptions:
+    """
+    크롤러 공통 브라우저 옵션을 만듭니다.
+
+    :param headless: True이면 창 없이 실행 (수집 전용 브라우저에 사용)
+    :param performance_log: True이면 DevTools 네트워크 이벤트를 performance 로그로 수집
+    """
+    options = uc.ChromeOptions()
+    options.add_argument("--window-size=1600,1000")
+    options.add_argument("--disable-background-timer-throttling")
+    options.add_argument("--disable-backgrounding-occluded-windows")
+    options.add_argument("--disable-renderer-backgrounding")
+    if headless:
+        options.add_argument("--headless=new")
+    if performance_log:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+
+def create_driver(headless: bool = False, performance_log: bool = False, **kwargs):
+    """
+    build_chrome_options 설정으로 uc.Chrome 인스턴스를 생성합니다.
+    """
+    return uc.Chrome(options=build_chrome_options(headless=headless, performance_log=performance_log),
+                     headless=headless, **kwargs)
+
+
+def create_collection_driver(headless: bool = True, performance_log: bool = False, **kwargs):
+    """
+    수집 전용 브라우저: 기본 headless이며, 수집 시 lightweight_collection과 함께 사용합니다.
+    """
+    return create_driver(headless=headless, performance_log=performance_log, **kwargs)
+
+
+def enable_lightweight_collection(driver, patterns: Optional[List[str]] = None):
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns if patterns is not None else BLOCKED_URL_PATTERNS)})
+
+
+def disable_lightweight_collection(driver):
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+
+
+@contextmanager
+def lightweight_collection(driver, enabled: bool = True, patterns: Optional[List[str]] = None):
+    """
+    with 블록 동안 이미지/미디어/폰트 요청을 차단합니다. 블록을 나가면 차단을 해제하므로
+    같은 브라우저로 이어서 영상을 재생해도 됩니다. CDP를 쓸 수 없으면 차단 없이 진행합니다.
+    """
+    active = False
+    if enabled:
+        try:
+            enable_lightweight_collection(driver, patterns)
+            active = True
+            print("경량 수집 모드: 이미지/미디어/폰트 요청을 차단합니다.")
+        except Exception as e:
+            print(f"경량 수집 모드 설정 실패 (차단 없이 진행): {e}")
+    try:
+        yield
+    finally:
+        if active:
+            try:
+                disable_lightweight_collection(driver)
+            except Exception:
+                pass
+
+
+def drain_network_stats(driver) -> Dict[str, int]:
+    """
+    지금까지 쌓인 performance 로그를 비우면서 전송 바이트/요청 수/차단 요청 수를 집계합니다.
+    (build_chrome_options(performance_log=True)로 만든 브라우저에서만 동작)
+    """
+    stats = {"bytes": 0, "requests": 0, "blocked": 0}
+    for entry in driver.get_log("performance"):
+        try:
+            msg = json.loads(entry["message"])["message"]
+        except (KeyError, ValueError):
+            continue
+        method = msg.get("method")
+        if method == "Network.loadingFinished":
+            stats["bytes"] += int(msg.get("params", {}).get("encodedDataLength") or 0)
+            stats["requests"] += 1
+        elif method == "Network.loadingFailed" and msg.get("params", {}).get("blockedReason"):
+            stats["blocked"] += 1
+    return stats
+
+
+def measure_transfer(driver, fn, *args, **kwargs) -> Dict:
+    """
+    fn(*args, **kwargs)을 실행하면서 전송 바이트/요청 수와 소요 시간을 측정합니다.
+    반환: {'result', 'bytes', 'requests', 'blocked', 'elapsed'}
+    """
+    drain_network_stats(driver)
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    elapsed = time.perf_counter() - started
+    stats = drain_network_stats(driver)
+    return {"result": result, "elapsed": elapsed, **stats}
+
+
+def capture_response_bodies(driver, url_part: str) -> List[Dict]:
+    """
+    지금까지 쌓인 performance 로그를 비우면서 URL에 url_part가 포함된 응답의 JSON 본문을 수신 순서대로 반환합니다.
+    (build_chrome_options(performance_log=True)로 만든 브라우저에서만 동작, 본문을 읽지 못한 응답은 건너뜀)
+    """
+    wanted: List[str] = []
+    finished = set()
+    for entry in driver.get_log("performance"):
+        try:
+            msg = json.loads(entry["message"])["message"]
+        except (KeyError, ValueError):
+            continue
+        method = msg.get("method")
+        params = msg.get("params", {})
+        if method == "Network.responseReceived" and url_part in (params.get("response", {}).get("url") or ""):
+            wanted.append(params.get("requestId"))
+        elif method == "Network.loadingFinished":
+            finished.add(params.get("requestId"))
+
+    bodies: List[Dict] = []
+    for request_id in wanted:
+        if request_id not in finished:
+            continue
+        try:
+            res = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+            body = res.get("body") or ""
+            if res.get("base64Encoded"):
+                body = base64.b64decode(body).decode("utf-8", errors="replace")
+            bodies.append(json.loads(body))
+        except Exception as e:
+            print(f"응답 본문 읽기 실패 (건너뜀): {request_id} | {e}")
+    return bodies
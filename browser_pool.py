@@ -0,0 +1,344 @@
+"""
+미리 띄워 두고 재사용하는 브라우저 풀 (영구 프로필 + 상태 검사 + 장애 시 교체).
+
+- 슬롯마다 고정 프로필 폴더(user-data-dir, 예: chrome_profiles/youtube-0)를 사용하므로 HTTP/디스크 캐시와
+  쿠키(동의 처리 등)가 재시작 후에도 유지됩니다. 같은 프로필 폴더를 동시에 두 프로세스가 쓰면 안 됩니다.
+- start()는 백그라운드 스레드에서 브라우저를 미리 띄우고, acquire()는 준비된 브라우저를 넘겨줍니다.
+- run(fn)은 넘겨주기 전에 상태를 검사(응답 없으면 교체)하고, fn 실행 중 브라우저가 죽으면
+  새 브라우저로 교체한 뒤 같은 단계를 다시 실행합니다. (브라우저가 살아 있는 오류는 그대로 전달)
+- 슬롯별 시작 시간(초)과 교체 횟수를 기록해 report()로 출력합니다.
+
+실행 예:
+  python browser_pool.py --size 2 --profile-root chrome_profiles              # 시작 시간 측정 (두 번째 실행부터 영구 프로필)
+  python browser_pool.py --size 2 --channels channels.csv --crash-test        # 채널 수집 + 브라우저 강제 종료 후 복구 확인
+"""
+
+import argparse
+import os
+import queue
+import signal
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+from browser import create_driver
+
+
+# 비정상 종료 후 남는 프로필 잠금 파일 (남아 있으면 다음 실행이 "프로필 사용 중"으로 실패)
+PROFILE_LOCK_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie")
+# 교체 시 이전 브라우저가 스스로 종료하기를 기다리는 시간(초). 넘기면 SIGKILL
+BROWSER_EXIT_TIMEOUT = 5.0
+
+
+def profile_lock_holder(profile_dir: str) -> Optional[str]:
+    """
+    SingletonLock(심볼릭 링크 '<호스트>-<PID>')을 잡은 Chrome이 아직 살아 있으면 링크 대상을, 남은 잠금이면 None을 반환합니다.
+    다른 호스트의 잠금은 확인할 수 없으므로 사용 중으로 봅니다.
+    """
+    try:
+        target = os.readlink(os.path.join(profile_dir, "SingletonLock"))
+    except OSError:
+        return None
+    host, _, pid = target.rpartition("-")
+    if not pid.isdigit():
+        return None
+    if host != socket.gethostname():
+        return target
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return None
+    except PermissionError:
+        return target
+    except OSError:
+        return None
+    try:
+        # PID가 다른 프로세스에 재사용된 경우는 남은 잠금으로 처리
+        with open(f"/proc/{pid}/comm", encoding="utf-8") as f:
+            if "chrom" not in f.read().lower():
+                return None
+    except OSError:
+        pass
+    return target
+
+
+def clear_profile_locks(profile_dir: str):
+    """
+    비정상 종료로 남은 잠금 파일을 지웁니다. 잠금을 잡은 Chrome이 살아 있으면 지우지 않고 RuntimeError를 냅니다.
+    """
+    holder = profile_lock_holder(profile_dir)
+    if holder:
+        raise RuntimeError(f"프로필 폴더를 다른 Chrome이 사용 중입니다({holder}): {profile_dir} "
+                           f"→ 실행을 하나만 두거나 다른 프로필 폴더를 지정하세요.")
+    for name in PROFILE_LOCK_FILES:
+        path = os.path.join(profile_dir, name)
+        if os.path.lexists(path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def process_running(pid: int) -> bool:
+    try:
+        # 직접 띄운 자식 프로세스면 종료 상태를 거둬 좀비로 남지 않게 함
+        if os.waitpid(pid, os.WNOHANG)[0] == pid:
+            return False
+    except OSError:
+        pass
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def wait_browser_exit(driver, timeout: Optional[float] = None) -> bool:
+    """
+    quit() 후 브라우저 프로세스(browser_pid)가 끝날 때까지 기다리고, timeout(기본 BROWSER_EXIT_TIMEOUT) 안에
+    끝나지 않으면 SIGKILL합니다. uc.Chrome.quit()은 SIGTERM만 보내고 바로 반환하므로, 기다리지 않고 같은 프로필로
+    다시 띄우면 종료 중인 브라우저가 잠금을 잡고 있어 실패합니다. 반환: 제때 스스로 종료했는지
+    """
+    pid = getattr(driver, "browser_pid", None)
+    if not pid:
+        return True
+    deadline = time.monotonic() + (BROWSER_EXIT_TIMEOUT if timeout is None else timeout)
+    while process_running(pid):
+        if time.monotonic() >= deadline:
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                pass
+            for _ in range(50):
+                if not process_running(pid):
+                    break
+                time.sleep(0.1)
+            return False
+        time.sleep(0.1)
+    return True
+
+
+def is_alive(driver) -> bool:
+    """
+    브라우저가 명령에 응답하는지 확인합니다.
+    """
+    if driver is None:
+        return False
+    try:
+        driver.execute_script("return 1")
+        return True
+    except Exception:
+        return False
+
+
+class BrowserPool:
+    def __init__(self, size: int = 1, profile_root: Optional[str] = None, name: str = "browser",
+                 headless: bool = False, performance_log: bool = False, retries: int = 1,
+                 factory: Optional[Callable[..., Any]] = None):
+        """
+        :param profile_root: 영구 프로필 상위 폴더 (None이면 기존처럼 실행마다 임시 프로필)
+        :param retries: 브라우저가 죽어 중단된 단계를 새 브라우저로 다시 실행할 횟수
+        :param factory: 브라우저 생성 함수 (기본 browser.create_driver, headless/performance_log/user_data_dir 인자)
+        """
+        self.profile_root = profile_root
+        self.headless = headless
+        self.performance_log = performance_log
+        self.retries = retries
+        self.factory = factory or create_driver
+        self.slots: List[Dict] = []
+        for i in range(max(1, size)):
+            profile = os.path.abspath(os.path.join(profile_root, f"{name}-{i}")) if profile_root else None
+            self.slots.append({"slot": i, "driver": None, "profile": profile, "startups": [], "replaced": 0})
+        self.idle: "queue.Queue[Dict]" = queue.Queue()
+        # undetected_chromedriver가 드라이버 파일을 패치하므로 동시에 시작하지 않도록 직렬화
+        self.launch_lock = threading.Lock()
+
+    def launch(self, slot: Dict):
+        kwargs = {"headless": self.headless, "performance_log": self.performance_log}
+        profile = "임시 프로필"
+        if slot["profile"]:
+            os.makedirs(slot["profile"], exist_ok=True)
+            clear_profile_locks(slot["profile"])
+            kwargs["user_data_dir"] = slot["profile"]
+            profile = "영구 프로필" if os.listdir(slot["profile"]) else "새 프로필"
+        with self.launch_lock:
+            started = time.perf_counter()
+            slot["driver"] = self.factory(**kwargs)
+            elapsed = time.perf_counter() - started
+        slot["startups"].append(elapsed)
+        print(f"[브라우저 {slot['slot']}] 시작 {elapsed:.1f}초 ({profile})")
+
+    def start(self, wait: bool = True) -> "BrowserPool":
+        """
+        모든 슬롯의 브라우저를 백그라운드에서 띄웁니다. wait=False이면 바로 반환하고 acquire()가 준비를 기다립니다.
+        """
+        def warm(slot: Dict):
+            try:
+                self.launch(slot)
+            except Exception as e:
+                print(f"[브라우저 {slot['slot']}] 시작 실패 (사용 시 다시 시도): {type(e).__name__}: {e}")
+            self.idle.put(slot)
+
+        threads = [threading.Thread(target=warm, args=(slot,), daemon=True) for slot in self.slots]
+        for t in threads:
+            t.start()
+        if wait:
+            for t in threads:
+                t.join()
+        return self
+
+    def replace(self, slot: Dict, reason: str):
+        print(f"[브라우저 {slot['slot']}] 교체: {reason}")
+        old, slot["driver"] = slot["driver"], None
+        if old is not None:
+            try:
+                old.quit()
+            except Exception:
+                pass
+            if not wait_browser_exit(old):
+                print(f"[브라우저 {slot['slot']}] 이전 브라우저가 종료되지 않아 강제 종료")
+        slot["replaced"] += 1
+        self.launch(slot)
+
+    def acquire(self, timeout: Optional[float] = None) -> Dict:
+        """
+        준비된 슬롯을 하나 꺼냅니다. 브라우저가 없거나 응답하지 않으면 새로 띄운 뒤 넘겨줍니다.
+        """
+        slot = self.idle.get(timeout=timeout)
+        try:
+            if slot["driver"] is None:
+                self.launch(slot)
+            elif not is_alive(slot["driver"]):
+                self.replace(slot, "상태 검사 실패")
+        except BaseException:
+            self.idle.put(slot)
+            raise
+        return slot
+
+    def release(self, slot: Dict):
+        self.idle.put(slot)
+
+    def recycle(self, reason: str):
+        """
+        준비된 슬롯 하나의 브라우저를 종료하고 새로 띄웁니다. (장시간 실행 중 메모리 정리용)
+        """
+        slot = self.idle.get()
+        try:
+            self.replace(slot, reason)
+        finally:
+            self.release(slot)
+
+    @contextmanager
+    def lease(self):
+        slot = self.acquire()
+        try:
+            yield slot["driver"]
+        finally:
+            self.release(slot)
+
+    def run(self, fn: Callable[[Any], Any], label: str = "작업"):
+        """
+        fn(driver)를 실행합니다. 실행 중 브라우저가 죽으면 교체 후 같은 단계를 최대 retries회 다시 실행합니다.
+        """
+        slot = self.acquire()
+        try:
+            attempt = 0
+            while True:
+                try:
+                    return fn(slot["driver"])
+                except KeyboardInterrupt:
+                    raise
+                except Exception as e:
+                    if attempt >= self.retries or is_alive(slot["driver"]):
+                        raise
+                    attempt += 1
+                    self.replace(slot, f"{label} 중 브라우저 응답 없음 ({type(e).__name__})")
+                    print(f"[브라우저 {slot['slot']}] {label} 재시도 ({attempt}/{self.retries})")
+        finally:
+            self.release(slot)
+
+    def map(self, fn: Callable[[Any, Any], Any], items: List[Any], label: str = "작업") -> List[Any]:
+        """
+        items를 풀 크기만큼 동시에 fn(driver, item)으로 처리합니다. 항목별 예외는 결과 자리에 예외 객체로 돌려줍니다.
+        """
+        def one(item):
+            try:
+                return self.run(lambda driver: fn(driver, item), label=label)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=len(self.slots)) as ex:
+            return list(ex.map(one, items))
+
+    def report(self):
+        print(f"\n{'슬롯':<6}{'시작 횟수':>10}{'첫 시작(s)':>12}{'이후 평균(s)':>14}{'교체':>6}  프로필")
+        for slot in self.slots:
+            s = slot["startups"]
+            later = f"{sum(s[1:]) / len(s[1:]):.1f}" if len(s) > 1 else "-"
+            first = f"{s[0]:.1f}" if s else "-"
+            print(f"{slot['slot']:<6}{len(s):>10}{first:>12}{later:>14}{slot['replaced']:>6}  {slot['profile'] or '(임시)'}")
+
+    def close(self):
+        for slot in self.slots:
+            if slot["driver"] is not None:
+                try:
+                    slot["driver"].quit()
+                except Exception:
+                    pass
+                slot["driver"] = None
+
+
+def kill_browser(driver):
+    """
+    복구 확인용: 브라우저 프로세스를 강제로 종료합니다. (uc.Chrome의 browser_pid 사용)
+    """
+    pid = getattr(driver, "browser_pid", None)
+    if pid:
+        os.kill(pid, signal.SIGKILL)
+
+
+def main():
+    from batch_crawl import load_channel_list
+    from browser import lightweight_collection
+    from platforms import collect_videos
+
+    parser = argparse.ArgumentParser(description="영구 프로필 브라우저 풀: 시작 시간/장애 복구 확인")
+    parser.add_argument("--size", type=int, default=2)
+    parser.add_argument("--profile-root", default="chrome_profiles", help="영구 프로필 폴더 ('' 이면 임시 프로필)")
+    parser.add_argument("--channels", default=None, help="batch_crawl 형식의 채널 목록 CSV (지정 시 풀로 수집)")
+    parser.add_argument("--crash-test", action="store_true", help="첫 브라우저를 강제 종료한 뒤 수집해 교체/재시도 확인")
+    parser.add_argument("--headless", action="store_true")
+    args = parser.parse_args()
+
+    pool = BrowserPool(size=args.size, profile_root=args.profile_root or None, name="pool", headless=args.headless)
+    try:
+        pool.start()
+        if args.crash_test:
+            kill_browser(pool.slots[0]["driver"])
+            print("[브라우저 0] 강제 종료")
+        if args.channels:
+            channels = load_channel_list(args.channels)
+
+            def crawl(driver, ch):
+                with lightweight_collection(driver):
+                    return collect_videos(driver, ch["platform"], ch["name"], channel_url=ch.get("url"))
+
+            for ch, res in zip(channels, pool.map(crawl, channels, label="채널 수집")):
+                status = f"실패 ({res})" if isinstance(res, Exception) else f"{len(res)}개"
+                print(f"{ch['platform']} | {ch['name']} | {status}")
+        elif args.crash_test:
+            pool.run(lambda driver: driver.get("about:blank"), label="상태 확인")
+        pool.report()
+    finally:
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()
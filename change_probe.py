@@ -0,0 +1,102 @@
+"""
+전체 재수집 전에 첫 페이지만 확인하는 저비용 변경 감지(probe).
+
+대부분의 라운드는 이전 라운드와 같은 목록을 얻는데도 매번 스크롤/더보기 전체 페이지네이션과 카드별 추출을 반복합니다.
+collect_with_probe()는 먼저 목록 첫 화면(스크롤/클릭 없이)에서 최신 size개 영상의 ID와 조회수로 지문(fingerprint)을 만들고,
+마지막 전체 수집 때 저장한 지문과 같으면 캐시된 목록을 그대로 사용하고 전체 수집을 생략합니다.
+새 영상 업로드, 삭제, 순서 변화, 최신 영상 조회수 변화가 있으면 지문이 달라져 전체 수집을 실행합니다.
+
+- 첫 화면에 보이지 않는 오래된 영상의 조회수 변화는 probe로 알 수 없으므로, max_skips번 연속 생략하면 한 번은
+  전체 수집합니다. (기본 6회)
+- 지문은 probe_fingerprints.json에 플랫폼|채널별로 저장합니다. (csv_output.atomic_write_text로 원자적 교체)
+- probe가 실패하거나 캐시된 목록이 없으면 전체 수집합니다.
+"""
+
+import hashlib
+import json
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from csv_output import atomic_write_text
+from parsing import extract_video_id
+
+
+PROBE_SIZE = 10
+PROBE_MAX_SKIPS = 6
+
+
+def probe_key(platform: str, channel: str) -> str:
+    return f"{platform}|{channel}"
+
+
+def load_probes(path: str) -> Dict[str, Dict]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_probes(path: str, probes: Dict[str, Dict]):
+    atomic_write_text(path, lambda f: json.dump(probes, f, ensure_ascii=False, indent=2))
+
+
+def fingerprint(records: List[Dict], size: int = PROBE_SIZE) -> str:
+    """
+    목록 앞 size개 영상의 (ID, 조회수)로 만든 SHA-256 지문.
+    """
+    h = hashlib.sha256()
+    for r in records[:size]:
+        url = r.get("url")
+        h.update(f"{extract_video_id(url) or url}|{r.get('views')}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def remember_fingerprint(path: str, platform: str, channel: str, records: List[Dict], size: int = PROBE_SIZE):
+    """
+    전체 수집 결과의 앞부분 지문을 저장하고 연속 생략 횟수를 초기화합니다.
+    """
+    probes = load_probes(path)
+    probes[probe_key(platform, channel)] = {"fingerprint": fingerprint(records, size), "size": size, "skips": 0,
+                                            "crawled_at": time.strftime("%Y-%m-%d %H:%M:%S")}
+    save_probes(path, probes)
+
+
+def collect_with_probe(path: Optional[str], platform: str, channel: str, cached: List[Dict],
+                       probe: Callable[[], List[Dict]], collect: Callable[[], List[Dict]],
+                       size: int = PROBE_SIZE, max_skips: int = PROBE_MAX_SKIPS) -> Tuple[List[Dict], bool]:
+    """
+    probe()(첫 화면 레코드)의 지문이 저장된 지문과 같으면 cached를 반환하고, 아니면 collect()로 전체 수집합니다.
+    path가 None이면 항상 collect()만 호출합니다.
+    반환: (레코드, 전체 수집을 생략했는지)
+    """
+    if not path:
+        return collect(), False
+    key = probe_key(platform, channel)
+    stored = load_probes(path).get(key)
+    if cached and stored and stored.get("size") == size:
+        if int(stored.get("skips") or 0) >= max_skips:
+            print(f"변경 감지 생략 {max_skips}회 연속 → 이번 라운드는 전체 수집 ({platform} | {channel})")
+        else:
+            started = time.perf_counter()
+            try:
+                first = probe()
+            except Exception as e:
+                print(f"변경 감지(첫 페이지) 실패 → 전체 수집: {type(e).__name__}: {e}")
+                first = []
+            elapsed = time.perf_counter() - started
+            if len(first) >= min(size, len(cached)) and fingerprint(first, size) == stored.get("fingerprint"):
+                probes = load_probes(path)
+                probes[key] = {**stored, "skips": int(stored.get("skips") or 0) + 1,
+                               "probed_at": time.strftime("%Y-%m-%d %H:%M:%S")}
+                save_probes(path, probes)
+                print(f"첫 페이지 최신 {size}개 변화 없음 ({elapsed:.1f}초) → 전체 수집 생략, 캐시 목록 {len(cached)}개 사용")
+                return cached, True
+            if first:
+                print(f"첫 페이지에서 변화 감지 ({elapsed:.1f}초) → 전체 수집")
+
+    records = collect()
+    if records:
+        remember_fingerprint(path, platform, channel, records, size)
+    return records, False
@@ -0,0 +1,144 @@
+"""
+채널명 → 목록 페이지 URL 캐시 (검색 단계 생략용).
+
+채널 URL이 설정되지 않은 경우 라운드마다 검색창 입력 → 결과 대기 → 채널 클릭을 반복하는 대신,
+처음 한 번 검색으로 찾은 목록 페이지 URL(YouTube /videos, KakaoTV /channel/<ID>/video, NaverTV 채널)을
+JSON 파일에 저장해 두고 다음 라운드부터 바로 이동합니다.
+
+- 항목은 ttl(기본 7일)이 지나면 만료되어 다시 검색합니다.
+- 캐시된 URL로 이동/수집이 실패하거나 영상이 하나도 없으면 항목을 지우고 같은 라운드에서 검색으로 다시 시도합니다.
+- 파일은 임시 파일 + 원자적 교체로 씁니다. (csv_output.atomic_write_text)
+
+캐시 확인/삭제:
+  python channel_cache.py channel_cache.json
+  python channel_cache.py channel_cache.json --forget youtube "조선대학교 SW중심사업단"
+"""
+
+import argparse
+import json
+import re
+import time
+from typing import Callable, Dict, List, Optional
+
+from csv_output import atomic_write_text
+from youtube_http import videos_tab_url
+
+
+CHANNEL_CACHE_PATH = "channel_cache.json"
+CHANNEL_CACHE_TTL = 7 * 24 * 3600
+
+RE_YOUTUBE_CHANNEL = re.compile(r"^https?://(?:www\.|m\.)?youtube\.com/(@[^/?#]+|channel/[^/?#]+|c/[^/?#]+|user/[^/?#]+)")
+RE_KAKAO_CHANNEL = re.compile(r"tv\.kakao\.com/channel/(\d+)")
+RE_NAVER_CHANNEL = re.compile(r"^https?://tv\.naver\.com/([^/?#]+)")
+NAVER_NON_CHANNEL_PATHS = {"v", "l", "search", "my", "r"}
+
+
+def cache_key(platform: str, channel_name: str) -> str:
+    return f"{platform}|{channel_name}"
+
+
+def load_cache(path: str) -> Dict[str, Dict]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_cache(path: str, cache: Dict[str, Dict]):
+    atomic_write_text(path, lambda f: json.dump(cache, f, ensure_ascii=False, indent=2))
+
+
+def listing_url(platform: str, url: str) -> Optional[str]:
+    """
+    검색 후 도착한 URL을 플랫폼별 목록 페이지 URL로 정규화합니다. 채널 페이지가 아니면 None
+    """
+    url = (url or "").split("#")[0]
+    if platform == "youtube":
+        m = RE_YOUTUBE_CHANNEL.match(url)
+        return videos_tab_url(f"https://www.youtube.com/{m.group(1)}") if m else None
+    if platform == "kakao":
+        m = RE_KAKAO_CHANNEL.search(url)
+        return f"https://tv.kakao.com/channel/{m.group(1)}/video" if m else None
+    if platform == "naver":
+        m = RE_NAVER_CHANNEL.match(url)
+        return url if m and m.group(1) not in NAVER_NON_CHANNEL_PATHS else None
+    return None
+
+
+def lookup_channel_url(path: str, platform: str, channel_name: str, ttl: float = CHANNEL_CACHE_TTL) -> Optional[str]:
+    entry = load_cache(path).get(cache_key(platform, channel_name))
+    if not entry or not entry.get("url"):
+        return None
+    if time.time() - float(entry.get("resolved_at") or 0) > ttl:
+        print(f"채널 URL 캐시 만료 → 다시 검색: {platform} | {channel_name}")
+        return None
+    return entry["url"]
+
+
+def remember_channel_url(path: str, platform: str, channel_name: str, url: str):
+    cache = load_cache(path)
+    cache[cache_key(platform, channel_name)] = {"url": url, "resolved_at": time.time(),
+                                                "resolved": time.strftime("%Y-%m-%d %H:%M:%S")}
+    save_cache(path, cache)
+    print(f"채널 URL 캐시 저장: {platform} | {channel_name} → {url}")
+
+
+def forget_channel_url(path: str, platform: str, channel_name: str) -> bool:
+    cache = load_cache(path)
+    if cache.pop(cache_key(platform, channel_name), None) is None:
+        return False
+    save_cache(path, cache)
+    return True
+
+
+def collect_with_channel_cache(path: Optional[str], platform: str, channel_name: str,
+                               collect: Callable[[Optional[str]], List[Dict]],
+                               resolved_url: Callable[[], Optional[str]],
+                               ttl: float = CHANNEL_CACHE_TTL) -> List[Dict]:
+    """
+    collect(channel_url)로 수집합니다. 캐시된 URL이 있으면 검색 없이 그 URL로 수집하고,
+    없거나 실패하면 collect(None)(검색 경로)로 수집한 뒤 resolved_url()이 돌려준 URL을 캐시에 저장합니다.
+    path가 None이면 캐시 없이 collect(None)만 호출합니다.
+    """
+    if not path:
+        return collect(None)
+    cached = lookup_channel_url(path, platform, channel_name, ttl=ttl)
+    if cached:
+        print(f"캐시된 채널 URL로 이동 (검색 생략): {cached}")
+        try:
+            records = collect(cached)
+            if records:
+                return records
+            print("캐시된 채널 URL에서 영상을 찾지 못했습니다 → 캐시 삭제 후 검색")
+        except Exception as e:
+            print(f"캐시된 채널 URL로 수집 실패 → 캐시 삭제 후 검색: {e}")
+        forget_channel_url(path, platform, channel_name)
+
+    records = collect(None)
+    url = listing_url(platform, resolved_url() or "")
+    if url:
+        remember_channel_url(path, platform, channel_name, url)
+    else:
+        print("검색 후 채널 페이지 URL을 확인하지 못해 캐시에 저장하지 않습니다.")
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="채널 URL 캐시 확인/삭제")
+    parser.add_argument("cache", nargs="?", default=CHANNEL_CACHE_PATH)
+    parser.add_argument("--forget", nargs=2, metavar=("PLATFORM", "NAME"), help="항목 삭제")
+    args = parser.parse_args()
+    if args.forget:
+        ok = forget_channel_url(args.cache, *args.forget)
+        print("삭제했습니다." if ok else "해당 항목이 없습니다.")
+        return
+    now = time.time()
+    for key, entry in sorted(load_cache(args.cache).items()):
+        age = (now - float(entry.get("resolved_at") or 0)) / 3600
+        print(f"{key:<40} {entry.get('url')}  ({age:.1f}시간 전)")
+
+
+if __name__ == "__main__":
+    main()
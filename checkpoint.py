@@ -0,0 +1,156 @@
+"""
+긴 목록 수집의 체크포인트/재개 도우미.
+
+수천 개 영상 채널은 스크롤/더보기만 수 분이 걸리는데, 중간에 렌더러 충돌이나 세션 타임아웃이 나면
+그때까지의 작업이 모두 사라집니다. 수집 중 일정 간격(기본 30초)으로 지금까지 추출한 레코드와
+진행 위치(로드된 항목 수, 스크롤/클릭 횟수, YouTube는 다음 페이지 continuation 토큰)를
+<checkpoint_dir>/<플랫폼>-<채널>.json에 기록하고, 다음 시도에서 이어서 수집합니다.
+
+- 토큰이 있는 경우(YouTube): 브라우저 스크롤 없이 토큰부터 HTTP로 남은 페이지만 가져옵니다.
+- 토큰이 없는 경우(KakaoTV/NaverTV 또는 토큰 재개 실패): fast_forward()로 체크포인트의 로드 항목 수(items)까지
+  추출/체크포인트 저장 없이 더보기/스크롤만 반복해 내려간 뒤 이어서 수집하고, 이전 체크포인트의 레코드를
+  합쳐서 저장하므로 이번 시도가 이전보다 덜 진행된 상태에서 또 실패해도 수집분이 줄지 않습니다.
+- 수집이 정상 종료되면 체크포인트를 지우고, max_age(기본 6시간)보다 오래된 체크포인트는 사용하지 않습니다.
+"""
+
+import json
+import os
+import re
+import time
+from typing import Callable, Dict, List, Optional
+
+from csv_output import atomic_write_text
+from page_loader import count_items, scroll_and_wait_for_new
+from parsing import extract_video_id
+
+
+CHECKPOINT_EVERY = 30.0
+CHECKPOINT_MAX_AGE = 6 * 3600
+
+
+def checkpoint_path(checkpoint_dir: str, platform: str, channel_name: str) -> str:
+    safe = re.sub(r"[^\w.-]+", "_", channel_name, flags=re.UNICODE).strip("_") or "channel"
+    return os.path.join(checkpoint_dir, f"{platform}-{safe}.json")
+
+
+def load_checkpoint(path: Optional[str], max_age: float = CHECKPOINT_MAX_AGE) -> Optional[Dict]:
+    if not path:
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    if time.time() - float(state.get("saved_at") or 0) > max_age:
+        print(f"오래된 체크포인트는 사용하지 않습니다: {path}")
+        return None
+    return state
+
+
+def save_checkpoint(path: str, state: Dict):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    state = {**state, "saved_at": time.time()}
+    atomic_write_text(path, lambda f: json.dump(state, f, ensure_ascii=False))
+
+
+def clear_checkpoint(path: Optional[str]):
+    if path and os.path.exists(path):
+        os.remove(path)
+
+
+def extend_records(head: List[Dict], tail: List[Dict]) -> List[Dict]:
+    """
+    head 뒤에 tail 중 head에 없는 영상(ID 기준)을 이어 붙이고 index를 1..N으로 다시 매깁니다.
+    """
+    seen = {extract_video_id(r.get("url")) for r in head}
+    out = [dict(r) for r in head]
+    for r in tail:
+        vid = extract_video_id(r.get("url"))
+        if vid and vid in seen:
+            continue
+        seen.add(vid)
+        out.append(dict(r))
+    for i, r in enumerate(out, 1):
+        r["index"] = i
+    return out
+
+
+def make_checkpointer(path: str, snapshot: Callable[[], Dict], every: float = CHECKPOINT_EVERY) -> Callable[..., bool]:
+    """
+    save(force=False)를 반환합니다. 마지막 저장 후 every초가 지났거나 force=True이면 snapshot()
+    ({'records', 진행 위치...})을 이전 체크포인트의 레코드와 합쳐 저장합니다. 스냅샷 실패는 수집을 멈추지 않습니다.
+    """
+    previous = load_checkpoint(path) or {}
+    last = {"at": time.monotonic()}
+
+    def save(force: bool = False) -> bool:
+        if not force and time.monotonic() - last["at"] < every:
+            return False
+        last["at"] = time.monotonic()
+        try:
+            snap = snapshot()
+        except Exception as e:
+            print(f"체크포인트 스냅샷 실패 (계속 진행): {type(e).__name__}: {e}")
+            return False
+        snap["records"] = extend_records(snap.get("records") or [], previous.get("records") or [])
+        save_checkpoint(path, snap)
+        print(f"체크포인트 저장: 레코드 {len(snap['records'])}개, 단계 {snap.get('steps', '-')} → {path}")
+        return True
+
+    return save
+
+
+def checkpointing_stop_when(path: str, snapshot: Callable[[], Dict], stop_when: Optional[Callable[[], bool]] = None,
+                            every: float = CHECKPOINT_EVERY) -> Callable[[], bool]:
+    """
+    스크롤/더보기 루프의 stop_when 자리에 넣는 검사 함수를 만듭니다. 호출(=스크롤/클릭 1회)마다 단계 수를 세고,
+    every초마다 snapshot()과 단계 수를 체크포인트에 저장한 뒤 원래 stop_when의 결과를 반환합니다.
+    """
+    progress = {"steps": 0}
+    save = make_checkpointer(path, lambda: {**snapshot(), "steps": progress["steps"]}, every=every)
+
+    def check() -> bool:
+        progress["steps"] += 1
+        save()
+        return bool(stop_when and stop_when())
+
+    return check
+
+
+def merge_resumed(records: List[Dict], resumed: Optional[Dict]) -> List[Dict]:
+    """
+    다시 내려가며 수집한 records에 이전 체크포인트에만 있던 레코드를 이어 붙입니다.
+    """
+    if not resumed or not resumed.get("records"):
+        return records
+    merged = extend_records(records, resumed["records"])
+    if len(merged) > len(records):
+        print(f"체크포인트 병합: 이번 수집 {len(records)}개 + 체크포인트에만 있던 {len(merged) - len(records)}개")
+    return merged
+
+
+def fast_forward(driver, item_selector: str, resumed: Optional[Dict], click: Optional[Callable[[int], Optional[int]]] = None,
+                 max_steps: int = 300, idle_timeout: float = 3.0) -> int:
+    """
+    체크포인트에 기록된 로드 항목 수(items)까지 카드 추출 없이 목록을 내려갑니다.
+    click(현재 항목 수)은 더보기 한 번을 실행하고 늘어난 항목 수를 반환합니다. (버튼이 없거나 늘지 않으면 None → 이후 스크롤)
+    반환: 도달한 항목 수
+    """
+    target = int((resumed or {}).get("items") or 0)
+    count = count_items(driver, item_selector)
+    if count >= target:
+        return count
+    started = time.perf_counter()
+    steps = 0
+    while count < target and steps < max_steps:
+        steps += 1
+        grown = click(count) if click else None
+        if grown is None:
+            click = None
+            res = scroll_and_wait_for_new(driver, item_selector, count, idle_timeout=idle_timeout, settle=0) or {}
+            grown = int(res.get("count") or 0)
+            if res.get("timedOut") or grown <= count:
+                break
+        count = grown
+    print(f"체크포인트 위치로 이동: 항목 {count}/{target}개 ({steps}단계, {time.perf_counter() - started:.1f}초, 추출 없이)")
+    return count
@@ -0,0 +1,89 @@
+"""
+라운드 CSV 저장 도우미: 내용이 바뀌었을 때만 쓰고, 쓸 때는 임시 파일 + 원자적 교체로 씁니다.
+
+- 내용 해시는 saved_at을 제외한 레코드로 계산합니다. 이전 해시와 같으면 CSV를 다시 쓰지 않습니다.
+- 라운드 시각(saved_at)과 해시는 옆에 두는 작은 매니페스트(<csv>.manifest.json)에 기록합니다.
+- CSV는 같은 폴더의 임시 파일에 쓴 뒤 os.replace로 바꾸므로, 중간에 종료되어도 반쯤 쓴 파일이 남지 않습니다.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, List
+
+import pandas as pd
+
+
+CSV_COLUMNS = ["index", "title", "views", "url", "duration", "duration_seconds"]
+
+
+def manifest_path(csv_path: str) -> str:
+    return csv_path + ".manifest.json"
+
+
+def records_hash(records: List[Dict]) -> str:
+    """
+    saved_at을 제외한 레코드 내용의 SHA-256 해시.
+    """
+    h = hashlib.sha256()
+    for r in records:
+        row = [r.get(c) for c in CSV_COLUMNS]
+        h.update(json.dumps(row, ensure_ascii=False, default=str).encode("utf-8"))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+def read_manifest(csv_path: str) -> Dict:
+    try:
+        with open(manifest_path(csv_path), encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def atomic_write_text(path: str, write_fn, encoding: str = "utf-8"):
+    """
+    path와 같은 폴더의 임시 파일에 write_fn(file)로 쓴 뒤 fsync 후 원자적으로 교체합니다.
+    """
+    folder = os.path.dirname(os.path.abspath(path))
+    mode = os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644
+    fd, tmp = tempfile.mkstemp(prefix=".tmp-", suffix=os.path.basename(path), dir=folder)
+    try:
+        os.chmod(tmp, mode)
+        with os.fdopen(fd, "w", encoding=encoding, newline="") as f:
+            write_fn(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def write_manifest(csv_path: str, manifest: Dict):
+    atomic_write_text(manifest_path(csv_path), lambda f: json.dump(manifest, f, ensure_ascii=False, indent=2))
+
+
+def write_csv_if_changed(records: List[Dict], csv_path: str, saved_at: str) -> bool:
+    """
+    레코드 내용이 이전 기록과 다를 때만 CSV를 원자적으로 다시 씁니다. 매니페스트의 saved_at은 항상 갱신합니다.
+    CSV의 saved_at 컬럼은 내용이 마지막으로 바뀐(실제로 쓴) 시각입니다.
+    반환: CSV를 실제로 썼으면 True
+    """
+    digest = records_hash(records)
+    manifest = read_manifest(csv_path)
+    changed = manifest.get("hash") != digest or not os.path.exists(csv_path)
+    if changed:
+        df = pd.DataFrame(records, columns=CSV_COLUMNS)
+        for col in ("index", "views", "duration_seconds"):
+            df[col] = df[col].astype("Int64")
+        df["saved_at"] = saved_at
+        atomic_write_text(csv_path, lambda f: df.to_csv(f, index=False), encoding="utf-8-sig")
+        manifest.update({"hash": digest, "rows": len(records), "written_at": saved_at})
+    manifest["saved_at"] = saved_at
+    write_manifest(csv_path, manifest)
+    return changed
\ No newline at end of file
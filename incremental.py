@@ -0,0 +1,130 @@
+"""
+증분(델타) 수집 도우미.
+
+이전 라운드 CSV의 영상 ID를 '알려진 ID'로 두고, 스크롤/더보기 도중 목록 끝의 한 페이지 분량이
+모두 알려진 ID이면 더 내려가지 않습니다. 새로 수집한 앞부분(head)은 캐시된 나머지(tail)와 합칩니다.
+삭제된 영상은 증분 모드에서 감지되지 않으므로 N라운드마다 전체 재수집을 수행합니다.
+"""
+
+from typing import Callable, Dict, List, Optional, Set
+
+import pandas as pd
+
+from parsing import extract_video_id
+
+
+# 목록의 마지막 n개 항목에서 영상 링크를 읽는 스크립트 (항목이 a 태그가 아니면 내부 첫 링크 사용)
+FRONTIER_SCRIPT = r"""
+const items = document.querySelectorAll(arguments[0]);
+const n = arguments[1];
+const out = [];
+for (let i = Math.max(0, items.length - n); i < items.length; i++) {
+  const el = items[i];
+  const a = el.matches('a[href]') ? el : el.querySelector("a#video-title, a#thumbnail, a[href]");
+  out.push(a ? (a.href || '') : '');
+}
+return [items.length, out];
+"""
+
+
+def records_from_frame(df: pd.DataFrame) -> List[Dict]:
+    """
+    CSV에서 읽은 DataFrame을 수집 레코드 목록으로 변환합니다. (NaN → None, 정수 컬럼 복원)
+    """
+    cols = [c for c in ["index", "title", "views", "url", "duration", "duration_seconds"] if c in df.columns]
+    recs = df[cols].astype(object).where(df[cols].notna(), None).to_dict(orient="records")
+    for r in recs:
+        for key in ("index", "views", "duration_seconds"):
+            if r.get(key) is not None:
+                r[key] = int(r[key])
+    return recs
+
+
+def load_known_catalog(csv_path: str) -> List[Dict]:
+    """
+    이전 라운드 CSV를 레코드 목록으로 읽습니다. 파일이 없거나 읽을 수 없으면 빈 목록.
+    """
+    try:
+        df = pd.read_csv(csv_path)
+    except FileNotFoundError:
+        return []
+    except Exception as e:
+        print(f"이전 CSV '{csv_path}'를 읽지 못했습니다 → 전체 수집: {e}")
+        return []
+    return records_from_frame(df)
+
+
+def known_ids_of(records: List[Dict]) -> Set[str]:
+    return {vid for vid in (extract_video_id(r.get("url")) for r in records) if vid}
+
+
+def make_frontier_check(driver, item_selector: str, known_ids: Set[str], page_size: int) -> Callable[[], bool]:
+    """
+    현재 로드된 목록의 마지막 page_size개가 모두 알려진 ID이면 True를 반환하는 검사 함수를 만듭니다.
+    """
+    def check() -> bool:
+        try:
+            total, hrefs = driver.execute_script(FRONTIER_SCRIPT, item_selector, page_size)
+        except Exception as e:
+            print(f"프런티어 검사 실패 (계속 진행): {e}")
+            return False
+        ids = [extract_video_id(h) for h in hrefs]
+        if total < page_size or len(ids) < page_size:
+            return False
+        if all(vid and vid in known_ids for vid in ids):
+            print(f"이전 라운드에서 본 영상 {page_size}개 연속 확인 → 증분 수집 중단 (로드된 항목 {total}개)")
+            return True
+        return False
+
+    return check
+
+
+def merge_with_cache(fresh: List[Dict], cached: List[Dict]) -> List[Dict]:
+    """
+    새로 수집한 앞부분 뒤에 캐시된 레코드 중 새 목록에 없는 것을 이어 붙이고 index를 1..N으로 다시 매깁니다.
+    """
+    fresh_ids = set()
+    merged: List[Dict] = []
+    for r in fresh:
+        vid = extract_video_id(r.get("url"))
+        if vid:
+            if vid in fresh_ids:
+                continue
+            fresh_ids.add(vid)
+        merged.append(dict(r))
+    head = len(merged)
+    for r in cached:
+        vid = extract_video_id(r.get("url"))
+        if vid and vid in fresh_ids:
+            continue
+        merged.append(dict(r))
+    for i, r in enumerate(merged, 1):
+        r["index"] = i
+    print(f"증분 병합: 새로 수집 {head}개 + 캐시 {len(merged) - head}개 = {len(merged)}개")
+    return merged
+
+
+def is_full_resync_round(round_no: int, full_resync_every: Optional[int]) -> bool:
+    """
+    round_no(1부터)번째 라운드가 주기적 전체 재수집 라운드인지 여부.
+    """
+    if not full_resync_every or full_resync_every <= 0:
+        return False
+    return round_no % full_resync_every == 0
+
+
+def plan_round(round_no: int, cached: List[Dict], incremental: bool, full_resync_every: Optional[int]) -> Optional[Set[str]]:
+    """
+    이번 라운드에 사용할 알려진 ID 집합을 반환합니다. None이면 전체 수집 라운드입니다.
+    """
+    if not incremental:
+        return None
+    if not cached:
+        print("증분 모드: 캐시된 목록이 없어 전체 수집을 진행합니다.")
+        return None
+    if is_full_resync_round(round_no, full_resync_every):
+        print(f"증분 모드: {round_no}라운드는 주기적 전체 재수집 라운드입니다. (매 {full_resync_every}라운드)")
+        return None
+    known = known_ids_of(cached)
+    print(f"증분 모드: 알려진 영상 ID {len(known)}개 기준으로 새 영상만 수집합니다.")
+    return known
@@ -1,20 +1,47 @@
+import json
 import time
 from datetime import datetime
 import re
-from typing import List, Dict, Optional
+from typing import Callable, Iterator, List, Dict, Optional, Set, Tuple
 
 import pandas as pd
-import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-
-def smart_scroll_until_no_new(driver, item_selector: str, max_scrolls: int = 80, pause: float = 1.0):
+from browser import lightweight_collection
+from browser_pool import BrowserPool
+from change_probe import PROBE_SIZE, collect_with_probe
+from channel_cache import collect_with_channel_cache, lookup_channel_url
+from checkpoint import (checkpoint_path, checkpointing_stop_when, clear_checkpoint, fast_forward, load_checkpoint,
+                        merge_resumed)
+from csv_output import write_csv_if_changed
+from incremental import load_known_catalog, make_frontier_check, merge_with_cache, plan_round
+from memory_watchdog import MemoryWatchdog, maintain
+from overlays import dismiss_overlays
+from page_loader import observe_scroll_until_no_new
+from parquet_export import append_round, require_pyarrow
+from parsing import extract_video_id, parse_durations_batch, parse_views_batch, parse_views_generic
+from storage import latest_catalog, open_store, save_round
+from streaming import clear_partial_csv, drain, make_partial_csv_sink, make_store_sink, scroll_step, stream_new_items
+from video_index import update_index
+
+
+def smart_scroll_until_no_new(driver, item_selector: str, max_scrolls: int = 80, pause: float = 1.0, stop_when: Optional[Callable[[], bool]] = None,
+                              use_observer: bool = True, idle_timeout: float = 3.0):
+    if use_observer:
+        try:
+            observe_scroll_until_no_new(driver, item_selector, max_scrolls=max_scrolls, idle_timeout=idle_timeout, stop_when=stop_when)
+            return
+        except Exception as e:
+            print(f"이벤트 기반 스크롤 실패 → 고정 대기 스크롤로 대체: {e}")
     last = 0
     still = 0
     for i in range(max_scrolls):
+        if stop_when and stop_when():
+            print("중단 조건 충족. 스크롤 종료.")
+            break
         driver.execute_script("window.scrollTo(0, document.documentElement.scrollHeight);")
         time.sleep(pause)
         cnt = len(driver.find_elements(By.CSS_SELECTOR, item_selector))
@@ -29,94 +56,255 @@ def smart_scroll_until_no_new(driver, item_selector: str, max_scrolls: int = 80,
             break
 
 
-def parse_duration_to_seconds(text: str) -> Optional[int]:
-    if not text:
-        return None
-    t = re.sub(r"\s+", "", text).upper()
-    if any(k in t for k in ["LIVE", "실시간", "스트리밍", "PREMIERE", "예정"]):
-        return None
-    m = re.match(r"^(?:(\d+):)?(\d{1,2}):(\d{2})$", t)
-    if not m:
+def try_dismiss_overlays(driver):
+    """
+    쿠키 동의/로그인 유도 등 클릭을 방해하는 오버레이를 한 번의 페이지 내 조회로 닫습니다.
+    보이는 후보가 없으면 대기 없이 반환하며, 실패해도 예외를 던지지 않습니다. (패턴: overlays.OVERLAY_PATTERNS["kakao"])
+    """
+    dismiss_overlays(driver, "kakao")
+
+
+KAKAO_CARD_SELECTOR = "a.link_contents, a[href*='/cliplink/']"
+# 더보기 한 번에 추가되는 카드 수 (증분 수집에서 '한 페이지'로 사용)
+KAKAO_PAGE_SIZE = 20
+
+# 카드 앵커 목록을 한 번에 훑어 (href, title, aria-label, 재생시간, 조회수) 행을 돌려주는 스크립트.
+# card_row_from_anchor와 같은 컨테이너/선택자 우선순위를 따릅니다.
+KAKAO_BULK_CARD_SCRIPT = r"""
+const text = (el) => el ? (el.textContent || '').replace(/\s+/g, ' ').trim() : '';
+const rows = [];
+for (const a of Array.prototype.slice.call(document.querySelectorAll(arguments[0]), arguments[1] || 0)) {
+  const container = a.closest('li') || (a.parentElement && a.parentElement.closest('div')) || a;
+  const aria = (a.getAttribute('aria-label') || '').trim();
+  const title = (a.getAttribute('title') || '').trim() || (aria ? '' : text(a));
+  const spans = Array.from(container.querySelectorAll('span')).map(text);
+  let time = text(container.querySelector(".txt_time, [class*='time']"));
+  if (!time) time = spans.find((t) => /\d{1,2}:\d{2}/.test(t)) || '';
+  let view = text(container.querySelector(".txt_view, [class*='view']"));
+  if (!view) {
+    view = spans.find((t) => /(재생|조회|views)/.test(t) && /\d/.test(t)) || '';
+  }
+  rows.push([a.href || a.getAttribute('href') || '', title, aria, time, view]);
+}
+return JSON.stringify(rows);
+"""
+
+
+def extract_kakaotv_cards_bulk(driver, selector: str = KAKAO_CARD_SELECTOR, start: int = 0) -> Optional[List[Tuple]]:
+    """
+    /video 목록의 카드(start번째부터)를 페이지 내 스크립트 한 번으로 읽어 (href, title, aria, time, view) 목록을 반환합니다.
+    실패 시 None을 반환하여 앵커별 추출로 대체합니다.
+    """
+    try:
+        raw = driver.execute_script(KAKAO_BULK_CARD_SCRIPT, selector, start)
+        return [tuple(r) for r in json.loads(raw)] if raw else []
+    except Exception as e:
+        print(f"일괄 카드 추출 실패 → 앵커별 추출로 대체: {e}")
         return None
-    h = int(m.group(1) or 0)
-    m_ = int(m.group(2))
-    s = int(m.group(3))
-    return h * 3600 + m_ * 60 + s
 
 
-def parse_korean_views(text: str) -> Optional[int]:
-    if not text:
-        return None
-    raw = text.strip()
-    lower = raw.lower()
-    if any(k in lower for k in ["no views", "조회수 없음", "조회수없음"]):
-        return 0
-    t = raw.replace("조회수", "").replace("조회", "").replace("재생", "").replace("회", "")
-    t = re.sub(r"\s+", "", t)
-    m = re.match(r"^([0-9]+(?:\.[0-9]+)?)(억|만|천)?$", t)
-    if m:
-        num = float(m.group(1))
-        unit = m.group(2)
-        if unit == "억":
-            num *= 100_000_000
-        elif unit == "만":
-            num *= 10_000
-        elif unit == "천":
-            num *= 1_000
-        return int(num)
-    m_en = re.match(r"^([0-9]+(?:\.[0-9]+)?)([KMBkmb])?$", re.sub(r"[^0-9KMBkmb\.]", "", lower))
-    if m_en:
-        num = float(m_en.group(1))
-        unit = (m_en.group(2) or '').upper()
-        if unit == 'K':
-            num *= 1_000
-        elif unit == 'M':
-            num *= 1_000_000
-        elif unit == 'B':
-            num *= 1_000_000_000
-        return int(num)
-    m2 = re.search(r"([0-9][0-9,]*)", raw)
-    if m2:
-        return int(m2.group(1).replace(",", ""))
-    return None
-
-
-def parse_views_generic(text: str) -> Optional[int]:
-    if not text:
-        return None
-    t = text.strip()
-    t_clean = re.sub(r"(조회수|조회|재생수|재생|views|view)", "", t, flags=re.IGNORECASE)
-    t_clean = t_clean.replace("회", "").strip()
-    v = parse_korean_views(t_clean)
-    if v is not None:
-        return v
-    m = re.search(r"([0-9][0-9,]*)", t)
-    if m:
-        return int(m.group(1).replace(",", ""))
-    return None
+def card_row_from_anchor(a) -> Tuple:
+    """
+    앵커 WebElement 하나에서 (href, title, aria, time, view) 행을 추출합니다. (일괄 추출의 대체 경로)
+    """
+    href = a.get_attribute("href")
+    title = (a.get_attribute("title") or "").strip()
+    aria = ""
+    try:
+        aria = (a.get_attribute("aria-label") or "").strip()
+    except Exception:
+        pass
+    if not title and not aria:
+        try:
+            title = (a.text or "").strip()
+        except Exception:
+            pass
 
+    # 컨테이너 찾기
+    try:
+        container = a.find_element(By.XPATH, "ancestor::li[1]")
+    except Exception:
+        try:
+            container = a.find_element(By.XPATH, "ancestor::div[1]")
+        except Exception:
+            container = a
 
-def try_dismiss_overlays(driver):
-    candidates = [
-        "//button[.//span[contains(., '동의')]]",
-        "//button[normalize-space()='동의함']",
-        "//button[contains(., 'I agree')]",
-        "//button[contains(., 'Accept all')]",
-        "//button[@aria-label='닫기' or @aria-label='Close']",
-    ]
-    for xp in candidates:
+    # 재생 시간 추출
+    duration_text = None
+    try:
+        duration_elem = container.find_element(By.CSS_SELECTOR, ".txt_time, [class*='time']")
+        duration_text = duration_elem.text.strip()
+    except Exception:
         try:
-            el = WebDriverWait(driver, 2).until(EC.element_to_be_clickable((By.XPATH, xp)))
-            el.click()
-            print(f"오버레이 닫힘: {xp}")
+            texts = [e.text for e in container.find_elements(By.TAG_NAME, "span")]
+            for t in texts:
+                if re.search(r'\d{1,2}:\d{2}', t):
+                    duration_text = t.strip()
+                    break
         except Exception:
             pass
 
+    # 조회수 추출
+    views_text = None
+    try:
+        view_elem = container.find_element(By.CSS_SELECTOR, ".txt_view, [class*='view']")
+        views_text = view_elem.text.strip()
+    except Exception:
+        try:
+            texts = [e.text for e in container.find_elements(By.TAG_NAME, "span")]
+            for t in texts:
+                if any(k in t for k in ["재생", "조회", "views"]) and parse_views_generic(t) is not None:
+                    views_text = t
+                    break
+        except Exception:
+            pass
 
-def collect_kakaotv_videos(driver, channel_name: str, channel_url: Optional[str] = None) -> List[Dict]:
-    print(f"KakaoTV 채널 '{channel_name}'의 모든 동영상 정보를 수집합니다.")
+    return href, title, aria, duration_text, views_text
+
+
+# 더보기 버튼을 한 번의 조회로 찾아 클릭하고, 목록 길이가 늘어날 때까지 기다리는 비동기 스크립트.
+# arguments: itemSelector, timeoutMs, settleMs, callback
+# 반환 status: 'none'(버튼 없음/숨김) | 'disabled' | 'grew'(항목 증가) | 'timeout'(클릭했으나 증가 없음)
+KAKAO_MORE_CLICK_SCRIPT = r"""
+const [selector, timeoutMs, settleMs, done] = arguments;
+const count = () => document.querySelectorAll(selector).length;
+const ownText = (el) => Array.from(el.childNodes).filter((n) => n.nodeType === 3).map((n) => n.textContent).join('');
+const visible = (el) => {
+  const r = el.getBoundingClientRect();
+  const st = getComputedStyle(el);
+  return r.width > 0 && r.height > 0 && st.visibility !== 'hidden' && st.display !== 'none';
+};
+const cands = Array.from(document.querySelectorAll('a, button')).filter(visible);
+const btn = cands.find((el) => ownText(el).indexOf('더보기') >= 0) || cands.find((el) => /more/.test(String(el.className)));
+const prev = count();
+if (!btn) { done({status: 'none', count: prev}); return; }
+if (btn.disabled || btn.getAttribute('aria-disabled') === 'true' || /disabled/.test(String(btn.className))) {
+  done({status: 'disabled', count: prev}); return;
+}
+const started = performance.now();
+let settleTimer = null, grewAt = null, finished = false;
+const finish = (status) => {
+  if (finished) return;
+  finished = true;
+  observer.disconnect();
+  clearTimeout(timer);
+  clearTimeout(settleTimer);
+  done({status: status, count: count(), latencyMs: grewAt === null ? null : Math.round(grewAt - started)});
+};
+const observer = new MutationObserver(() => {
+  if (count() <= prev) return;
+  if (grewAt === null) grewAt = performance.now();
+  clearTimeout(settleTimer);
+  settleTimer = setTimeout(() => finish('grew'), settleMs);
+});
+observer.observe(document.documentElement, {childList: true, subtree: true});
+const timer = setTimeout(() => finish(grewAt === null ? 'timeout' : 'grew'), timeoutMs);
+btn.scrollIntoView({block: 'center'});
+btn.click();
+"""
+
+
+def paginate_more_button(driver, item_selector: str = KAKAO_CARD_SELECTOR, max_clicks: int = 100, timeout: float = 5.0,
+                         settle: float = 0.2, stop_when: Optional[Callable[[], bool]] = None) -> Dict:
+    """
+    더보기 버튼을 페이지 내에서 찾고 클릭한 뒤, 고정 sleep 대신 목록 길이가 늘어날 때까지만 기다립니다.
+    버튼이 사라지거나 비활성화되면 즉시 종료하며, 클릭 수/초당 클릭/총 소요 시간을 로그로 남깁니다.
+    반환: {'clicks', 'count', 'elapsed', 'latencies_ms', 'reason'}
+    """
+    driver.set_script_timeout(timeout + settle + 5)
+    started = time.perf_counter()
+    clicks = 0
+    count = 0
+    latencies: List[int] = []
+    reason = "max_clicks"
+    while clicks < max_clicks:
+        if stop_when and stop_when():
+            reason = "frontier"
+            break
+        res = driver.execute_async_script(KAKAO_MORE_CLICK_SCRIPT, item_selector, int(timeout * 1000), int(settle * 1000))
+        status = res.get("status")
+        count = int(res.get("count") or 0)
+        if status in ("none", "disabled"):
+            reason = "더보기 버튼 없음" if status == "none" else "더보기 버튼 비활성화"
+            break
+        clicks += 1
+        if status == "timeout":
+            print(f"더보기 클릭 #{clicks}: {timeout:.1f}초 동안 항목 증가 없음 → 종료 (항목 {count}개)")
+            reason = "증가 없음"
+            break
+        latencies.append(int(res.get("latencyMs") or 0))
+        print(f"더보기 클릭 #{clicks}: 항목 {count}개 ({res.get('latencyMs')}ms)")
+    elapsed = time.perf_counter() - started
+    rate = clicks / elapsed if elapsed > 0 else 0.0
+    avg = (sum(latencies) / len(latencies)) if latencies else 0
+    print(f"더보기 페이지네이션 종료({reason}): 클릭 {clicks}회, 항목 {count}개, 총 {elapsed:.1f}초, "
+          f"{rate:.2f}클릭/초, 평균 로딩 {avg:.0f}ms")
+    return {"clicks": clicks, "count": count, "elapsed": elapsed, "latencies_ms": latencies, "reason": reason}
+
+
+def click_more_once(driver, item_selector: str = KAKAO_CARD_SELECTOR, timeout: float = 5.0) -> Optional[int]:
+    """
+    더보기를 한 번 클릭하고 늘어난 항목 수를 반환합니다. 버튼이 없거나 늘지 않으면 None (체크포인트 위치 이동용)
+    """
+    driver.set_script_timeout(timeout + 5)
+    res = driver.execute_async_script(KAKAO_MORE_CLICK_SCRIPT, item_selector, int(timeout * 1000), 0) or {}
+    return int(res.get("count") or 0) if res.get("status") == "grew" else None
+
+
+def paginate_more_button_legacy(driver, max_clicks: int = 100, stop_when: Optional[Callable[[], bool]] = None) -> Dict:
+    """
+    XPath 선택자를 차례로 시도하고 고정 대기하는 기존 더보기 루프입니다. (비교/대체용)
+    """
+    started = time.perf_counter()
+    more_clicks = 0
+    while more_clicks < max_clicks:
+        if stop_when and stop_when():
+            break
+        try:
+            # 페이지 하단으로 스크롤
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            time.sleep(0.5)
+
+            # 더보기 버튼 찾기
+            more_button = None
+            more_selectors = [
+                "//a[contains(text(), '더보기')]",
+                "//button[contains(text(), '더보기')]",
+                "//a[contains(@class, 'more')]",
+                "//button[contains(@class, 'more')]",
+            ]
+            for sel in more_selectors:
+                try:
+                    more_button = WebDriverWait(driver, 2).until(
+                        EC.element_to_be_clickable((By.XPATH, sel))
+                    )
+                    break
+                except Exception:
+                    continue
 
-    # 1) 채널 URL로 직접 이동
+            if more_button:
+                driver.execute_script("arguments[0].scrollIntoView({block:'center'});", more_button)
+                time.sleep(0.3)
+                more_button.click()
+                more_clicks += 1
+                print(f"더보기 클릭 #{more_clicks}")
+                time.sleep(1)
+            else:
+                print("더보기 버튼을 찾지 못했습니다. 로딩 완료.")
+                break
+        except Exception:
+            print("더 이상 더보기 버튼이 없습니다.")
+            break
+    elapsed = time.perf_counter() - started
+    rate = more_clicks / elapsed if elapsed > 0 else 0.0
+    print(f"더보기 페이지네이션 종료(기존 방식): 클릭 {more_clicks}회, 총 {elapsed:.1f}초, {rate:.2f}클릭/초")
+    return {"clicks": more_clicks, "elapsed": elapsed}
+
+
+def open_kakaotv_listing(driver, channel_name: str, channel_url: Optional[str] = None):
+    """
+    채널 URL의 /video 목록으로 이동하거나, URL이 없으면 검색 결과에서 채널을 찾아 /video 목록으로 이동합니다.
+    """
     if channel_url:
         print(f"지정된 채널 URL로 이동: {channel_url}")
         # /video 경로로 직접 이동하여 전체 동영상 목록 로드
@@ -200,147 +388,168 @@ def collect_kakaotv_videos(driver, channel_name: str, channel_url: Optional[str]
             print("   예: KAKAO_CHANNEL_URL = 'https://tv.kakao.com/channel/XXXXX'")
             raise RuntimeError("채널을 찾지 못했습니다. channel_url을 직접 지정해주세요.")
 
+
+def collect_kakaotv_videos(driver, channel_name: str, channel_url: Optional[str] = None, bulk: bool = True,
+                           known_ids: Optional[Set[str]] = None, fast_pagination: bool = True,
+                           checkpoint_path: Optional[str] = None) -> List[Dict]:
+    """
+    fast_pagination=True이면 더보기 버튼을 페이지 내 스크립트로 찾고 클릭한 뒤 목록이 늘어날 때까지만 기다립니다.
+    known_ids가 주어지면 증분 모드: 목록 끝의 한 페이지가 모두 알려진 ID이면 더보기/스크롤을 멈추고
+    그때까지 로드된 앞부분만 반환합니다.
+    checkpoint_path가 주어지면 더보기/스크롤 중 주기적으로 추출한 레코드와 로드된 항목 수를 저장하고, 다음 호출은
+    그 항목 수까지 추출 없이 더보기만 눌러 내려간 뒤 이어서 수집하고 이전 체크포인트에만 있던 레코드를 병합합니다. (checkpoint.py)
+    """
+    print(f"KakaoTV 채널 '{channel_name}'의 모든 동영상 정보를 수집합니다.")
+    resumed = load_checkpoint(checkpoint_path)
+    if resumed:
+        print(f"체크포인트 발견: 레코드 {len(resumed.get('records') or [])}개, 항목 {resumed.get('items')}개 → 그 위치부터 이어서 수집")
+
+    # 1) 채널 목록 페이지로 이동 (URL 직접 또는 검색)
+    open_kakaotv_listing(driver, channel_name, channel_url)
+
     time.sleep(2)
     try_dismiss_overlays(driver)
+    if resumed:
+        fast_forward(driver, KAKAO_CARD_SELECTOR, resumed, click=lambda count: click_more_once(driver))
 
     # 2) 더보기 버튼 클릭으로 모든 영상 로드
     print("더보기 버튼을 클릭하여 모든 영상을 로드합니다.")
-    more_clicks = 0
-    while more_clicks < 100:  # 최대 100회
+    stop_when = make_frontier_check(driver, KAKAO_CARD_SELECTOR, known_ids, KAKAO_PAGE_SIZE) if known_ids else None
+    if checkpoint_path:
+        def snapshot() -> Dict:
+            rows = extract_kakaotv_cards_bulk(driver, KAKAO_CARD_SELECTOR) or []
+            return {"records": records_from_kakaotv_rows(rows, verbose=False), "items": len(rows)}
+
+        stop_when = checkpointing_stop_when(checkpoint_path, snapshot, stop_when)
+    paginated = False
+    if fast_pagination:
         try:
-            # 페이지 하단으로 스크롤
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(0.5)
-
-            # 더보기 버튼 찾기
-            more_button = None
-            more_selectors = [
-                "//a[contains(text(), '더보기')]",
-                "//button[contains(text(), '더보기')]",
-                "//a[contains(@class, 'more')]",
-                "//button[contains(@class, 'more')]",
-            ]
-            for sel in more_selectors:
-                try:
-                    more_button = WebDriverWait(driver, 2).until(
-                        EC.element_to_be_clickable((By.XPATH, sel))
-                    )
-                    break
-                except Exception:
-                    continue
-
-            if more_button:
-                driver.execute_script("arguments[0].scrollIntoView({block:'center'});", more_button)
-                time.sleep(0.3)
-                more_button.click()
-                more_clicks += 1
-                print(f"더보기 클릭 #{more_clicks}")
-                time.sleep(1)
-            else:
-                print("더보기 버튼을 찾지 못했습니다. 로딩 완료.")
-                break
-        except Exception:
-            print("더 이상 더보기 버튼이 없습니다.")
-            break
+            paginate_more_button(driver, KAKAO_CARD_SELECTOR, max_clicks=100, stop_when=stop_when)
+            paginated = True
+        except Exception as e:
+            print(f"빠른 더보기 페이지네이션 실패 → 기존 방식으로 대체: {e}")
+    if not paginated:
+        paginate_more_button_legacy(driver, max_clicks=100, stop_when=stop_when)
 
     # 3) 추가 스크롤로 동적 로딩 확인
-    smart_scroll_until_no_new(driver, "a.link_contents, a[href*='/cliplink/']", max_scrolls=30, pause=1.0)
+    smart_scroll_until_no_new(driver, KAKAO_CARD_SELECTOR, max_scrolls=30, pause=1.0, stop_when=stop_when)
 
-    # 4) 영상 링크 수집
+    # 4) 영상 정보 수집 (페이지 내 일괄 추출, 실패 시 앵커별 추출)
     print("영상 정보를 수집합니다.")
-    cards = driver.find_elements(By.CSS_SELECTOR, "a.link_contents, a[href*='/cliplink/']")
-    print(f"감지된 영상 카드 수: {len(cards)}")
-
-    out: List[Dict] = []
-    seen_urls = set()
-
-    for idx, a in enumerate(cards, 1):
-        try:
-            href = a.get_attribute("href")
-            if not href or href in seen_urls:
-                continue
-            seen_urls.add(href)
-
-            # URL 정규화
-            if href.startswith("/"):
-                href = "https://tv.kakao.com" + href
-
-            # cliplink가 포함된 영상만 수집
-            if "/cliplink/" not in href:
-                continue
+    rows = extract_kakaotv_cards_bulk(driver, KAKAO_CARD_SELECTOR) if bulk else None
+    if rows is None:
+        cards = driver.find_elements(By.CSS_SELECTOR, KAKAO_CARD_SELECTOR)
+        print(f"감지된 영상 카드 수: {len(cards)} (앵커별 추출)")
+        rows = []
+        for a in cards:
+            try:
+                rows.append(card_row_from_anchor(a))
+            except Exception as e:
+                print(f"카드 파싱 실패: {e}")
+    else:
+        print(f"감지된 영상 카드 수: {len(rows)} (일괄 추출)")
+    records = merge_resumed(records_from_kakaotv_rows(rows), resumed)
+    clear_checkpoint(checkpoint_path)
+    return records
+
+
+def iter_kakaotv_video_batches(driver, channel_name: str, channel_url: Optional[str] = None, bulk: bool = True,
+                               known_ids: Optional[Set[str]] = None, max_steps: int = 130,
+                               timeout: float = 5.0, settle: float = 0.2) -> Iterator[List[Dict]]:
+    """
+    collect_kakaotv_videos의 스트리밍 버전: 더보기 클릭(버튼이 없어지면 스크롤) 한 번마다 새로 로드된 카드만
+    추출해 레코드 배치를 yield합니다.
+    """
+    print(f"KakaoTV 채널 '{channel_name}'의 동영상을 스트리밍으로 수집합니다.")
+    open_kakaotv_listing(driver, channel_name, channel_url)
+    time.sleep(2)
+    try_dismiss_overlays(driver)
 
-            # 제목 추출
-            title = (a.get_attribute("title") or "").strip()
-            if not title:
+    def extract(start: int) -> List[Dict]:
+        rows = extract_kakaotv_cards_bulk(driver, KAKAO_CARD_SELECTOR, start) if bulk else None
+        if rows is None:
+            rows = []
+            for a in driver.find_elements(By.CSS_SELECTOR, KAKAO_CARD_SELECTOR)[start:]:
                 try:
-                    # aria-label에서 추출
-                    title = (a.get_attribute("aria-label") or "").strip()
-                except Exception:
-                    pass
-            if not title:
-                try:
-                    # 텍스트에서 추출
-                    title = (a.text or "").strip()
-                except Exception:
-                    pass
+                    rows.append(card_row_from_anchor(a))
+                except Exception as e:
+                    print(f"카드 파싱 실패: {e}")
+        return records_from_kakaotv_rows(rows, verbose=False)
+
+    scroll = scroll_step(driver, KAKAO_CARD_SELECTOR, idle_timeout=3.0, settle=settle)
+    more = {"exhausted": False}
+
+    def advance(count: int) -> bool:
+        if not more["exhausted"]:
+            driver.set_script_timeout(timeout + settle + 5)
+            res = driver.execute_async_script(KAKAO_MORE_CLICK_SCRIPT, KAKAO_CARD_SELECTOR,
+                                              int(timeout * 1000), int(settle * 1000)) or {}
+            if res.get("status") == "grew":
+                return True
+            # 더보기 버튼이 없거나 눌러도 늘지 않으면 남은 동적 로딩은 스크롤로 확인
+            more["exhausted"] = True
+        return scroll(count)
+
+    stop_when = make_frontier_check(driver, KAKAO_CARD_SELECTOR, known_ids, KAKAO_PAGE_SIZE) if known_ids else None
+    yield from stream_new_items(driver, KAKAO_CARD_SELECTOR, extract, advance, max_steps=max_steps, stop_when=stop_when)
+
+
+def probe_kakaotv_first_page(driver, channel_name: str, channel_url: Optional[str] = None,
+                             size: int = PROBE_SIZE) -> List[Dict]:
+    """
+    채널 목록 첫 화면만 열어(더보기/스크롤 없음) 최신 size개 레코드를 반환합니다. (change_probe 변경 감지용)
+    """
+    open_kakaotv_listing(driver, channel_name, channel_url)
+    WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, KAKAO_CARD_SELECTOR)))
+    rows = extract_kakaotv_cards_bulk(driver, KAKAO_CARD_SELECTOR)
+    if rows is None:
+        rows = [card_row_from_anchor(a) for a in driver.find_elements(By.CSS_SELECTOR, KAKAO_CARD_SELECTOR)[:size * 2]]
+    return records_from_kakaotv_rows(rows, verbose=False)[:size]
+
+
+def records_from_kakaotv_rows(rows: List[Tuple], verbose: bool = True) -> List[Dict]:
+    """
+    (href, title, aria, duration_text, views_text) 행 목록을 중복 제거 후 수집 레코드로 변환합니다.
+    """
+    kept: List[Tuple] = []
+    seen_ids = set()  # 클립 ID 기준 중복 제거 (같은 클립의 쿼리 문자열만 다른 링크 포함)
+
+    for href, title, aria, duration_text, views_text in rows:
+        if not href:
+            continue
 
-            # 컨테이너 찾기
-            try:
-                container = a.find_element(By.XPATH, "ancestor::li[1]")
-            except Exception:
-                try:
-                    container = a.find_element(By.XPATH, "ancestor::div[1]")
-                except Exception:
-                    container = a
+        # URL 정규화
+        if href.startswith("/"):
+            href = "https://tv.kakao.com" + href
 
-            # 재생 시간 추출
-            duration_text = None
-            try:
-                duration_elem = container.find_element(By.CSS_SELECTOR, ".txt_time, [class*='time']")
-                duration_text = duration_elem.text.strip()
-            except Exception:
-                try:
-                    texts = [e.text for e in container.find_elements(By.TAG_NAME, "span")]
-                    for t in texts:
-                        if re.search(r'\d{1,2}:\d{2}', t):
-                            duration_text = t.strip()
-                            break
-                except Exception:
-                    pass
+        # cliplink가 포함된 영상만 수집
+        if "/cliplink/" not in href:
+            continue
+        clip_id = extract_video_id(href) or href
+        if clip_id in seen_ids:
+            continue
+        seen_ids.add(clip_id)
+        kept.append((href, (title or "").strip() or (aria or "").strip(), duration_text or None, views_text or None))
 
-            duration_seconds = parse_duration_to_seconds(duration_text) if duration_text else None
+    # 조회수/길이는 모아서 한 번에 파싱
+    views_vals = parse_views_batch([r[3] for r in kept])
+    duration_vals = parse_durations_batch([r[2] for r in kept])
 
-            # 조회수 추출
-            views_val = None
-            try:
-                view_elem = container.find_element(By.CSS_SELECTOR, ".txt_view, [class*='view']")
-                views_text = view_elem.text.strip()
-                views_val = parse_views_generic(views_text)
-            except Exception:
-                try:
-                    texts = [e.text for e in container.find_elements(By.TAG_NAME, "span")]
-                    for t in texts:
-                        if any(k in t for k in ["재생", "조회", "views"]):
-                            views_val = parse_views_generic(t)
-                            if views_val is not None:
-                                break
-                except Exception:
-                    pass
-
-            out.append({
-                "index": len(out) + 1,
-                "title": title or "(제목 없음)",
-                "views": views_val,
-                "url": href,
-                "duration": duration_text,
-                "duration_seconds": duration_seconds,
-            })
+    out: List[Dict] = []
+    for (href, title, duration_text, _), views_val, duration_seconds in zip(kept, views_vals, duration_vals):
+        views_val = None if pd.isna(views_val) else int(views_val)
+        duration_seconds = None if pd.isna(duration_seconds) else int(duration_seconds)
+        out.append({
+            "index": len(out) + 1,
+            "title": title or "(제목 없음)",
+            "views": views_val,
+            "url": href,
+            "duration": duration_text,
+            "duration_seconds": duration_seconds,
+        })
+        if verbose:
             print(f"- [{len(out)}] {title} | 조회수: {views_val} | 길이: {duration_text}")
 
-        except Exception as e:
-            print(f"카드 파싱 실패: {e}")
-            continue
-
     return out
 
 
@@ -421,34 +630,144 @@ def play_videos_sequence_generic(driver, videos: List[Dict], site: str):
             print(f"  · 재생 중 오류: {e}")
 
 
-def run_loop_kakaotv(channel_name: str, csv_path: str = "kakaotv_videos.csv", channel_url: Optional[str] = None):
+def run_loop_kakaotv(channel_name: str, csv_path: str = "kakaotv_videos.csv", channel_url: Optional[str] = None,
+                     incremental: bool = False, full_resync_every: int = 10, lightweight: bool = False,
+                     store_path: Optional[str] = None, parquet_dir: Optional[str] = None,
+                     channel_cache_path: Optional[str] = None, profile_dir: Optional[str] = None,
+                     checkpoint_dir: Optional[str] = None, streaming: bool = False,
+                     memory_log: Optional[str] = None, video_index_path: Optional[str] = None,
+                     probe_path: Optional[str] = None):
+    """
+    channel_url이 없고 channel_cache_path가 주어지면 검색으로 찾은 채널 URL을 캐시해 다음 라운드부터 검색을 생략합니다.
+    profile_dir가 주어지면 브라우저 프로필(캐시/쿠키)을 그 폴더에 유지하고, 브라우저가 죽으면 새로 띄워 중단된 단계를 다시 실행합니다.
+    checkpoint_dir가 주어지면 긴 목록 수집의 진행 상황을 그 폴더에 저장하고, 중단 후 다음 시도(브라우저 교체 후 재시도 포함)에서 이어서 수집합니다.
+    streaming=True이면 더보기/스크롤마다 새로 로드된 부분만 추출해 배치 단위로 부분 CSV(<csv>.partial.csv) 또는 저장소에 바로 기록합니다.
+    memory_log가 주어지면 브라우저 프로세스 트리 RSS/CPU와 렌더러 JS 힙을 그 CSV에 시계열로 기록하고, 라운드 사이에
+    임계값(memory_watchdog.py)을 넘으면 탭 또는 브라우저를 새로 띄운 뒤 같은 위치(URL)로 돌아갑니다.
+    video_index_path가 주어지면 영상 ID 기준 색인(video_index.py)을 갱신하고 라운드 간 변경분(신규/삭제/제목 변경/조회수 증감)을
+    <색인>.changes.jsonl에 추가합니다.
+    probe_path가 주어지면 라운드마다 먼저 목록 첫 화면의 최신 영상 ID/조회수 지문만 확인하고(change_probe.py),
+    마지막 전체 수집 때와 같으면 캐시된 목록을 그대로 사용해 전체 수집을 생략합니다.
+    """
     print("KakaoTV 무한 재생 루프 시작")
-    options = uc.ChromeOptions()
-    options.add_argument("--window-size=1600,1000")
-    options.add_argument("--disable-background-timer-throttling")
-    options.add_argument("--disable-backgrounding-occluded-windows")
-    options.add_argument("--disable-renderer-backgrounding")
-    driver = uc.Chrome(options=options)
+    pool = BrowserPool(profile_root=profile_dir, name="kakao").start()
+    watchdog = MemoryWatchdog(memory_log).start() if memory_log else None
+    if watchdog is not None:
+        pool.run(watchdog.attach, label="메모리 확인")
+    landed: Dict[str, Optional[str]] = {"url": None}
+    ckpt = checkpoint_path(checkpoint_dir, "kakao", channel_name) if checkpoint_dir else None
+    if ckpt and streaming:
+        print("경고: 스트리밍 모드에서는 체크포인트를 저장하지 않습니다. (배치마다 부분 CSV/저장소에 기록된 결과로 대신함)")
+    round_at: Dict[str, Optional[str]] = {"saved_at": None}
+
+    def stream_sinks() -> List[Callable[[List[Dict]], None]]:
+        # 브라우저 교체 후 재시도하면 sink를 새로 만들어 부분 CSV를 처음부터 다시 씁니다.
+        saved_at = round_at["saved_at"] or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if store is not None:
+            return [make_store_sink(store, "kakao", channel_name, saved_at)]
+        return [make_partial_csv_sink(csv_path, saved_at)]
+
+    def collect(url: Optional[str], known_ids: Optional[Set[str]]) -> List[Dict]:
+        def step(driver) -> List[Dict]:
+            with lightweight_collection(driver, enabled=lightweight):
+                if streaming:
+                    records = drain(iter_kakaotv_video_batches(driver, channel_name, channel_url=url, known_ids=known_ids),
+                                    stream_sinks())
+                else:
+                    records = collect_kakaotv_videos(driver, channel_name, channel_url=url, known_ids=known_ids,
+                                                     checkpoint_path=ckpt)
+            landed["url"] = driver.current_url
+            return records
+
+        return pool.run(step, label="목록 수집")
+
+    def probe() -> List[Dict]:
+        # 지정된 채널 URL 또는 마지막 전체 수집에서 도착한 URL(없으면 채널 URL 캐시)의 첫 화면만 확인
+        url = channel_url or landed["url"] or (lookup_channel_url(channel_cache_path, "kakao", channel_name)
+                                               if channel_cache_path else None)
+        return pool.run(lambda driver: probe_kakaotv_first_page(driver, channel_name, channel_url=url), label="변경 감지")
+
+    store = open_store(store_path) if store_path else None
+    if parquet_dir:
+        require_pyarrow()
     try:
+        if store is not None:
+            cached = latest_catalog(store, "kakao", channel_name) if incremental else []
+        else:
+            cached = load_known_catalog(csv_path) if incremental else []
+        round_no = 0
         while True:
-            vids = collect_kakaotv_videos(driver, channel_name, channel_url=channel_url)
-            saved_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            df = pd.DataFrame(vids)
-            df["saved_at"] = saved_at
-            df.to_csv(csv_path, index=False, encoding="utf-8-sig")
-            print(f"CSV 업데이트(KakaoTV): {csv_path} | {len(df)}개")
-            play_videos_sequence_generic(driver, vids, site="KakaoTV")
+            round_no += 1
+            known_ids = plan_round(round_no, cached, incremental, full_resync_every)
+            round_at["saved_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+            def full_crawl() -> List[Dict]:
+                if channel_url:
+                    fresh = collect(channel_url, known_ids)
+                else:
+                    fresh = collect_with_channel_cache(channel_cache_path, "kakao", channel_name,
+                                                       lambda url: collect(url, known_ids), lambda: landed["url"])
+                return merge_with_cache(fresh, cached) if known_ids is not None else fresh
+
+            vids, skipped = collect_with_probe(probe_path, "kakao", channel_name, cached, probe, full_crawl)
+            cached = vids
+            saved_at = round_at["saved_at"] if streaming else datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            if store is not None and skipped:
+                print(f"첫 페이지 변화 없음 → 저장소 기록 생략(KakaoTV): {store_path}")
+            elif store is not None:
+                n = save_round(store, "kakao", channel_name, vids, saved_at)
+                print(f"저장소 기록(KakaoTV): {store_path} | {n}개")
+            elif write_csv_if_changed(vids, csv_path, saved_at):
+                print(f"CSV 업데이트(KakaoTV): {csv_path} | {len(vids)}개")
+            else:
+                print(f"목록 변경 없음 → CSV 쓰기 생략(KakaoTV): {csv_path} | {len(vids)}개")
+            if store is None:
+                clear_partial_csv(csv_path)
+            if parquet_dir and not skipped:
+                append_round(parquet_dir, "kakao", channel_name, vids, saved_at)
+                print(f"Parquet 이력 추가(KakaoTV): {parquet_dir}")
+            if video_index_path and not skipped:
+                update_index(video_index_path, "kakao", channel_name, vids, saved_at)
+            pool.run(lambda driver: play_videos_sequence_generic(driver, vids, site="KakaoTV"), label="재생")
+            maintain(pool, watchdog)
     except KeyboardInterrupt:
         print("사용자 인터럽트(KakaoTV). 종료합니다.")
     finally:
-        try:
-            driver.quit()
-        except Exception:
-            pass
+        if store is not None:
+            store.close()
+        if watchdog is not None:
+            watchdog.stop()
+        pool.close()
 
 
 if __name__ == "__main__":
     CHANNEL_NAME = "조선대학교 SW중심사업단"
     # 필요하다면 채널 URL을 직접 지정하세요 (예: "https://tv.kakao.com/channel/XXXX")
     KAKAO_CHANNEL_URL = "https://tv.kakao.com/channel/10114190/video"
-    run_loop_kakaotv(CHANNEL_NAME, channel_url=KAKAO_CHANNEL_URL)
+    # 증분 모드: 이전 라운드 이후 새로 올라온 영상만 수집하고 10라운드마다 전체 재수집
+    INCREMENTAL = False
+    # 경량 수집: 목록 수집 중에는 이미지/미디어/폰트 요청 차단 (재생 시에는 해제)
+    LIGHTWEIGHT = False
+    # 저장소: "crawl.db"처럼 지정하면 CSV 대신 SQLite에 조회수 이력 기록 (CSV는 python storage.py ... --export)
+    STORE_PATH = None
+    # 분석용 Parquet 이력: "view_history"처럼 지정하면 라운드마다 날짜별 파티션에 추가 (pyarrow 필요)
+    PARQUET_DIR = None
+    # 채널 URL 캐시: "channel_cache.json"처럼 지정하면 KAKAO_CHANNEL_URL이 없을 때 검색으로 찾은 URL을 저장해 다음 라운드부터 검색 생략 (None이면 매번 검색)
+    CHANNEL_CACHE_PATH = None
+    # 브라우저 프로필 폴더: "chrome_profiles"처럼 지정하면 캐시/쿠키를 유지해 재시작을 빠르게 하고, 브라우저가 죽으면 교체 후 재시도 (None이면 임시 프로필)
+    PROFILE_DIR = None
+    # 체크포인트 폴더: "checkpoints"처럼 지정하면 긴 목록 수집 중 진행 상황을 저장해 브라우저 충돌/재시작 후 이어서 수집 (None이면 사용 안 함)
+    CHECKPOINT_DIR = None
+    # 스트리밍 수집: 스크롤/더보기마다 새 배치를 부분 CSV(<csv>.partial.csv) 또는 저장소에 바로 기록 (중단되어도 부분 결과 유지)
+    STREAMING = False
+    # 메모리 감시: "memory_log.csv"처럼 지정하면 브라우저 RSS/CPU·JS 힙을 기록하고 임계값 초과 시 라운드 사이에 탭/브라우저 재활용
+    MEMORY_LOG = None
+    # 영상 ID 색인: "video_index.json"처럼 지정하면 라운드마다 신규/삭제/제목 변경/조회수 증감을 계산해 <색인>.changes.jsonl에 추가 (None이면 사용 안 함)
+    VIDEO_INDEX_PATH = None
+    # 변경 감지: "probe_fingerprints.json"처럼 지정하면 첫 화면 최신 10개가 그대로일 때 전체 수집 생략 (6회 연속 생략 후에는 전체 수집)
+    PROBE_PATH = None
+    run_loop_kakaotv(CHANNEL_NAME, channel_url=KAKAO_CHANNEL_URL, incremental=INCREMENTAL, full_resync_every=10,
+                     lightweight=LIGHTWEIGHT, store_path=STORE_PATH, parquet_dir=PARQUET_DIR,
+                     channel_cache_path=CHANNEL_CACHE_PATH, profile_dir=PROFILE_DIR,
+                     checkpoint_dir=CHECKPOINT_DIR, streaming=STREAMING, memory_log=MEMORY_LOG,
+                     video_index_path=VIDEO_INDEX_PATH, probe_path=PROBE_PATH)
@@ -0,0 +1,303 @@
+"""
+장시간 실행 루프용 브라우저 메모리 감시 + 탭/브라우저 재활용.
+
+며칠씩 같은 Chrome으로 수집/재생을 반복하면 브라우저 RSS가 조금씩 늘어 결국 스왑이 발생합니다.
+MemoryWatchdog은 백그라운드 스레드에서 interval초마다 Chrome 프로세스 트리(브라우저 + 렌더러/GPU 등 자식)의
+RSS 합계와 CPU 사용률을 측정하고, 라운드 사이에는 DevTools Performance.getMetrics로 렌더러 JS 힙과 DOM 노드 수도
+측정해 CSV 시계열(memory_log.csv)로 남깁니다.
+
+라운드 사이 maintain()이 임계값을 확인합니다.
+- JS 힙이 heap_limit_mb를 넘으면 새 탭을 열고 이전 탭을 닫아(렌더러 교체) 같은 URL로 돌아갑니다.
+- 프로세스 트리 RSS가 rss_limit_mb를 넘으면 BrowserPool에서 브라우저를 새로 띄우고 같은 URL로 돌아갑니다.
+루프의 라운드 번호/목록은 파이썬 쪽에 있으므로 재활용 후 다음 라운드가 그대로 이어집니다.
+
+프로세스 측정은 psutil이 있으면 사용하고(선택 의존성), 없으면 /proc(Linux)을 직접 읽습니다.
+
+로그 확인:
+  python memory_watchdog.py memory_log.csv
+"""
+
+import argparse
+import csv
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+RSS_LIMIT_MB = 2048.0
+HEAP_LIMIT_MB = 768.0
+SAMPLE_EVERY = 60.0
+
+LOG_COLUMNS = ["time", "event", "processes", "rss_mb", "cpu_percent", "heap_used_mb", "heap_total_mb", "dom_nodes", "note"]
+
+
+def browser_root_pid(driver) -> Optional[int]:
+    """
+    브라우저 프로세스 트리의 루트 PID (uc.Chrome은 browser_pid, 일반 드라이버는 chromedriver 프로세스)
+    """
+    pid = getattr(driver, "browser_pid", None)
+    if pid:
+        return int(pid)
+    process = getattr(getattr(driver, "service", None), "process", None)
+    return getattr(process, "pid", None)
+
+
+def proc_table() -> Dict[int, Dict]:
+    """
+    /proc에서 모든 프로세스의 부모 PID, CPU 시간(초), RSS(바이트)를 읽습니다.
+    """
+    ticks = os.sysconf("SC_CLK_TCK")
+    page = os.sysconf("SC_PAGE_SIZE")
+    table: Dict[int, Dict] = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat") as f:
+                # comm(2번째 필드)에 공백/괄호가 있을 수 있으므로 마지막 ')' 이후부터 나눕니다.
+                fields = f.read().rsplit(")", 1)[1].split()
+            with open(f"/proc/{name}/statm") as f:
+                resident = int(f.read().split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        table[int(name)] = {"ppid": int(fields[1]), "cpu": (int(fields[11]) + int(fields[12])) / ticks,
+                            "rss": resident * page}
+    return table
+
+
+def tree_usage(root_pid: int) -> Optional[Dict]:
+    """
+    root_pid와 모든 자손 프로세스의 RSS 합계와 누적 CPU 시간을 반환합니다. 반환: {'processes', 'rss', 'cpu_seconds'}
+    """
+    if psutil is not None:
+        try:
+            root = psutil.Process(root_pid)
+            procs = [root] + root.children(recursive=True)
+        except psutil.Error:
+            return None
+        rss, cpu, alive = 0, 0.0, 0
+        for p in procs:
+            try:
+                rss += p.memory_info().rss
+                t = p.cpu_times()
+                cpu += t.user + t.system
+                alive += 1
+            except psutil.Error:
+                continue
+        return {"processes": alive, "rss": rss, "cpu_seconds": cpu}
+
+    if not os.path.isdir("/proc"):
+        return None
+    table = proc_table()
+    if root_pid not in table:
+        return None
+    children: Dict[int, List[int]] = {}
+    for pid, info in table.items():
+        children.setdefault(info["ppid"], []).append(pid)
+    stack, pids = [root_pid], []
+    while stack:
+        pid = stack.pop()
+        pids.append(pid)
+        stack.extend(children.get(pid, []))
+    return {"processes": len(pids), "rss": sum(table[p]["rss"] for p in pids),
+            "cpu_seconds": sum(table[p]["cpu"] for p in pids)}
+
+
+def renderer_metrics(driver) -> Optional[Dict]:
+    """
+    현재 탭 렌더러의 JS 힙/DOM 노드 수 (DevTools Performance.getMetrics). CDP를 쓸 수 없으면 None
+    """
+    try:
+        driver.execute_cdp_cmd("Performance.enable", {})
+        metrics = driver.execute_cdp_cmd("Performance.getMetrics", {}).get("metrics") or []
+    except Exception as e:
+        print(f"렌더러 메트릭 측정 실패: {type(e).__name__}: {e}")
+        return None
+    values = {m.get("name"): m.get("value") for m in metrics}
+    return {"heap_used": values.get("JSHeapUsedSize"), "heap_total": values.get("JSHeapTotalSize"),
+            "dom_nodes": values.get("Nodes")}
+
+
+class MemoryWatchdog:
+    def __init__(self, log_path: str = "memory_log.csv", interval: float = SAMPLE_EVERY,
+                 rss_limit_mb: float = RSS_LIMIT_MB, heap_limit_mb: float = HEAP_LIMIT_MB):
+        """
+        :param interval: 백그라운드 측정 간격(초). 0이면 라운드 사이 측정만 합니다.
+        """
+        self.log_path = log_path
+        self.interval = interval
+        self.rss_limit_mb = rss_limit_mb
+        self.heap_limit_mb = heap_limit_mb
+        self.root_pid: Optional[int] = None
+        self.last_cpu: Optional[tuple] = None
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        if psutil is None:
+            print("psutil이 없어 /proc에서 프로세스 메모리를 측정합니다. (pip install psutil 권장)")
+
+    def attach(self, driver):
+        """
+        측정 대상 브라우저를 지정합니다. (브라우저를 새로 띄운 뒤 다시 호출)
+        """
+        pid = browser_root_pid(driver)
+        with self.lock:
+            if pid != self.root_pid:
+                self.root_pid = pid
+                self.last_cpu = None
+
+    def write(self, row: Dict):
+        new = not os.path.exists(self.log_path)
+        with open(self.log_path, "a", encoding="utf-8", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=LOG_COLUMNS)
+            if new:
+                w.writeheader()
+            w.writerow(row)
+
+    def sample(self, driver=None, event: str = "interval", note: str = "") -> Dict:
+        """
+        프로세스 트리 RSS/CPU(와 driver가 주어지면 렌더러 JS 힙/DOM 노드 수)를 측정해 로그에 한 줄 추가합니다.
+        driver는 WebDriver 명령이 겹치지 않도록 메인 스레드(라운드 사이)에서만 넘깁니다.
+        """
+        row = {"time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "event": event, "note": note}
+        with self.lock:
+            usage = tree_usage(self.root_pid) if self.root_pid else None
+            if usage:
+                now = time.monotonic()
+                row.update({"processes": usage["processes"], "rss_mb": round(usage["rss"] / 2 ** 20, 1)})
+                if self.last_cpu is not None and now > self.last_cpu[0]:
+                    busy = usage["cpu_seconds"] - self.last_cpu[1]
+                    row["cpu_percent"] = round(max(0.0, busy) / (now - self.last_cpu[0]) * 100, 1)
+                self.last_cpu = (now, usage["cpu_seconds"])
+            if driver is not None:
+                metrics = renderer_metrics(driver)
+                if metrics:
+                    for key, col in (("heap_used", "heap_used_mb"), ("heap_total", "heap_total_mb")):
+                        if metrics.get(key) is not None:
+                            row[col] = round(metrics[key] / 2 ** 20, 1)
+                    row["dom_nodes"] = metrics.get("dom_nodes")
+            self.write(row)
+        return row
+
+    def start(self) -> "MemoryWatchdog":
+        if self.interval <= 0 or self.thread is not None:
+            return self
+
+        def loop():
+            while not self.stopped.wait(self.interval):
+                try:
+                    self.sample()
+                except Exception as e:
+                    print(f"메모리 측정 실패 (계속 진행): {type(e).__name__}: {e}")
+
+        self.thread = threading.Thread(target=loop, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join(timeout=5)
+            self.thread = None
+
+    def check(self, driver) -> Optional[str]:
+        """
+        라운드 사이 측정 후 임계값을 확인합니다. 반환: 'browser'(RSS 초과) | 'tab'(JS 힙 초과) | None
+        """
+        self.attach(driver)
+        row = self.sample(driver, event="round")
+        rss, heap = row.get("rss_mb"), row.get("heap_used_mb")
+        print(f"브라우저 메모리: RSS {rss if rss is not None else '-'}MB (프로세스 {row.get('processes', '-')}개), "
+              f"JS 힙 {heap if heap is not None else '-'}MB, DOM 노드 {row.get('dom_nodes', '-')}")
+        if rss is not None and rss > self.rss_limit_mb:
+            return "browser"
+        if heap is not None and heap > self.heap_limit_mb:
+            return "tab"
+        return None
+
+
+def recycle_tab(driver, url: Optional[str] = None):
+    """
+    새 탭을 열어 url(기본: 현재 URL)로 이동하고 이전 탭을 닫습니다. 이전 탭의 렌더러 프로세스와 JS 힙이 해제됩니다.
+    """
+    url = url or driver.current_url
+    old = driver.current_window_handle
+    driver.switch_to.new_window("tab")
+    new = driver.current_window_handle
+    driver.switch_to.window(old)
+    driver.close()
+    driver.switch_to.window(new)
+    if url and url.startswith("http"):
+        driver.get(url)
+
+
+def maintain(pool, watchdog: Optional[MemoryWatchdog]) -> Optional[str]:
+    """
+    라운드 사이에 호출: 측정 후 임계값을 넘으면 탭 또는 브라우저를 재활용하고 현재 위치(URL)로 돌아갑니다.
+    재활용/재시작이 실패해도 루프를 멈추지 않도록 로그만 남기고, 다음 라운드의 acquire()가 브라우저를 다시 띄웁니다.
+    반환: 실행한 재활용 종류 ('tab' | 'browser') 또는 None (실패 포함)
+    """
+    if watchdog is None:
+        return None
+    position: Dict[str, Optional[str]] = {"url": None}
+
+    def check(driver) -> Optional[str]:
+        position["url"] = driver.current_url
+        return watchdog.check(driver)
+
+    def restore(driver):
+        watchdog.attach(driver)
+        if position["url"] and position["url"].startswith("http"):
+            driver.get(position["url"])
+
+    action = None
+    try:
+        action = pool.run(check, label="메모리 확인")
+        if action == "tab":
+            print(f"JS 힙이 {watchdog.heap_limit_mb:.0f}MB를 넘어 탭을 재활용합니다.")
+            pool.run(lambda driver: recycle_tab(driver, position["url"]), label="탭 재활용")
+        elif action == "browser":
+            print(f"브라우저 RSS가 {watchdog.rss_limit_mb:.0f}MB를 넘어 브라우저를 새로 띄웁니다.")
+            pool.recycle(f"메모리 임계값 초과 (RSS > {watchdog.rss_limit_mb:.0f}MB)")
+            pool.run(restore, label="위치 복원")
+        if action:
+            pool.run(lambda driver: watchdog.sample(driver, event=f"recycled-{action}"), label="메모리 확인")
+        return action
+    except KeyboardInterrupt:
+        raise
+    except Exception as e:
+        stage = f"{action} 재활용" if action else "메모리 확인"
+        print(f"{stage} 실패 (다음 라운드에 브라우저를 다시 띄웁니다): {type(e).__name__}: {e}")
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="브라우저 메모리 로그 요약")
+    parser.add_argument("log", nargs="?", default="memory_log.csv")
+    args = parser.parse_args()
+    with open(args.log, encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    if not rows:
+        print("기록이 없습니다.")
+        return
+    rss = [float(r["rss_mb"]) for r in rows if r.get("rss_mb")]
+    heap = [float(r["heap_used_mb"]) for r in rows if r.get("heap_used_mb")]
+    recycles = [r for r in rows if (r.get("event") or "").startswith("recycled")]
+    print(f"기간: {rows[0]['time']} ~ {rows[-1]['time']} ({len(rows)}개 측정)")
+    if rss:
+        print(f"RSS: 처음 {rss[0]:.0f}MB, 마지막 {rss[-1]:.0f}MB, 최대 {max(rss):.0f}MB")
+    if heap:
+        print(f"JS 힙: 처음 {heap[0]:.0f}MB, 마지막 {heap[-1]:.0f}MB, 최대 {max(heap):.0f}MB")
+    for r in recycles:
+        print(f"재활용 {r['time']}: {r['event']} → RSS {r.get('rss_mb') or '-'}MB, JS 힙 {r.get('heap_used_mb') or '-'}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+브라우저 하나에서 여러 탭을 번갈아 진행하는 겹침(overlapped) 수집.
+
+채널(또는 YouTube 채널의 동영상/Shorts/실시간 탭)마다 창 핸들을 하나씩 열고, 각 탭에서 스크롤 또는
+'더보기' 클릭을 한 단계씩 돌아가며 실행합니다. 한 탭이 네트워크 응답을 기다리는 동안 다른 탭을 진행하므로
+고정 대기 시간이 겹쳐집니다. 탭에서 유휴 시간 동안 새 항목이 없으면 그 탭의 카드를 추출하고 닫습니다.
+(백그라운드 탭 스로틀링은 build_chrome_options의 --disable-background-timer-throttling 등으로 완화)
+
+실행 예:
+  python multi_tab.py --youtube https://www.youtube.com/@handle --tabs videos,shorts,streams --compare
+  python multi_tab.py --channels channels.csv --max-tabs 4
+"""
+
+import argparse
+import time
+from typing import Dict, List
+
+from batch_crawl import load_channel_list
+from browser import create_driver
+from kakao_auto_crawl import KAKAO_CARD_SELECTOR, KAKAO_MORE_CLICK_SCRIPT, extract_kakaotv_cards_bulk, records_from_kakaotv_rows
+from naver_auto_crawl import (NAVER_CARD_SELECTOR, install_navertv_capture_hook, read_navertv_state,
+                               records_from_anchors_and_state, records_from_navertv_state, state_records_by_id)
+from overlays import dismiss_overlays
+from parsing import parse_views_generic
+from youtube_auto_crawl import card_field_getters, records_from_card_getters
+from youtube_http import videos_tab_url
+
+
+YOUTUBE_TAB_SELECTORS = {
+    "videos": "ytd-rich-grid-media",
+    "streams": "ytd-rich-grid-media",
+    "shorts": "ytm-shorts-lockup-view-model, ytd-reel-item-renderer",
+}
+
+SCROLL_STEP_SCRIPT = r"""
+window.scrollTo(0, document.documentElement.scrollHeight);
+return document.querySelectorAll(arguments[0]).length;
+"""
+
+# Shorts 카드: 제목/URL/조회수 텍스트 (길이 정보 없음)
+SHORTS_CARDS_SCRIPT = r"""
+const out = [];
+for (const el of document.querySelectorAll(arguments[0])) {
+  const a = el.querySelector("a[href*='/shorts/']");
+  if (!a) continue;
+  const h = el.querySelector('h3');
+  const title = ((h && h.textContent) || a.getAttribute('title') || a.getAttribute('aria-label') || '').replace(/\s+/g, ' ').trim();
+  let views = '';
+  for (const s of el.querySelectorAll('span, div')) {
+    const t = (s.textContent || '').trim();
+    if (t && s.children.length === 0 && (t.indexOf('조회수') >= 0 || /views?$/i.test(t))) { views = t; break; }
+  }
+  out.push([a.href, title, views]);
+}
+return out;
+"""
+
+
+def channel_jobs(channels: List[Dict]) -> List[Dict]:
+    """
+    batch_crawl 채널 목록을 탭 작업으로 변환합니다. (URL이 있는 채널만)
+    """
+    jobs = []
+    for ch in channels:
+        if not ch.get("url"):
+            print(f"URL이 없어 건너뜀 (다중 탭은 검색 단계 없이 동작): {ch['platform']} | {ch['name']}")
+            continue
+        tab = "videos" if ch["platform"] == "youtube" else None
+        url = videos_tab_url(ch["url"]) if ch["platform"] == "youtube" else ch["url"]
+        if ch["platform"] == "kakao" and "/video" not in url:
+            url = url.rstrip("/") + "/video"
+        jobs.append({"platform": ch["platform"], "name": ch["name"], "url": url, "tab": tab})
+    return jobs
+
+
+def youtube_tab_jobs(channel_url: str, tabs: List[str], name: str = "") -> List[Dict]:
+    base = videos_tab_url(channel_url)[: -len("/videos")]
+    return [{"platform": "youtube", "name": name or base, "url": f"{base}/{tab}", "tab": tab} for tab in tabs]
+
+
+def selector_of(job: Dict) -> str:
+    if job["platform"] == "youtube":
+        return YOUTUBE_TAB_SELECTORS[job.get("tab") or "videos"]
+    return KAKAO_CARD_SELECTOR if job["platform"] == "kakao" else NAVER_CARD_SELECTOR
+
+
+def extract_records(driver, job: Dict) -> List[Dict]:
+    """
+    현재 탭(작업)의 로드된 카드를 플랫폼별 일괄 추출 경로로 레코드로 변환합니다.
+    """
+    sel = selector_of(job)
+    if job["platform"] == "youtube":
+        if job.get("tab") == "shorts":
+            rows = driver.execute_script(SHORTS_CARDS_SCRIPT, sel) or []
+            out = []
+            for href, title, views_text in rows:
+                views = parse_views_generic(views_text) if views_text else None
+                out.append({"index": len(out) + 1, "title": title, "views": int(views) if views is not None else None,
+                            "url": href, "duration": None, "duration_seconds": None})
+            return out
+        return records_from_card_getters(card_field_getters(driver, sel, bulk=True))
+    if job["platform"] == "kakao":
+        return records_from_kakaotv_rows(extract_kakaotv_cards_bulk(driver, sel) or [])
+    # 단일 탭 수집기와 같이 목록 앵커 기준: 상태 JSON 레코드가 있으면 사용하고, 없으면 앵커 주변 텍스트(record_from_anchor)
+    state = read_navertv_state(driver)
+    records = records_from_navertv_state(state) if state else []
+    if not records:
+        print(f"초기 상태 JSON에서 영상을 찾지 못했습니다. 앵커 스캔으로 대체합니다: {job['url']}")
+    merged = records_from_anchors_and_state(driver, state_records_by_id(records))
+    return [{"index": i, **rec} for i, rec in enumerate(merged, 1)]
+
+
+def open_tab(driver, job: Dict, first: bool):
+    if not first:
+        driver.switch_to.new_window("tab")
+    job["handle"] = driver.current_window_handle
+    # 페이지 로드 완료를 기다리지 않고 이동만 시작 (다른 탭을 여는 동안 로드가 진행됨)
+    job["prev_href"] = driver.execute_script("const h = location.href; window.location.href = arguments[0]; return h;",
+                                             job["url"])
+    job.update({"ready": False, "done": False, "count": 0, "steps": 0, "records": [],
+                "opened_at": time.perf_counter()})
+
+
+def advance(driver, job: Dict) -> int:
+    """
+    탭에서 한 단계(스크롤 1회 또는 더보기 클릭 1회)를 대기 없이 실행하고 현재 항목 수를 반환합니다.
+    """
+    sel = selector_of(job)
+    if job["platform"] == "kakao" and not job.get("more_exhausted"):
+        # 대기 시간 0: 클릭만 하고 바로 반환 (목록 증가는 다음 차례에 확인)
+        res = driver.execute_async_script(KAKAO_MORE_CLICK_SCRIPT, sel, 0, 0) or {}
+        if res.get("status") in ("none", "disabled"):
+            # 더보기 버튼이 없어지면 남은 동적 로딩은 스크롤로 확인
+            job["more_exhausted"] = True
+        return int(res.get("count") or 0)
+    return int(driver.execute_script(SCROLL_STEP_SCRIPT, sel) or 0)
+
+
+def collect_tabs(driver, jobs: List[Dict], max_tabs: int = 4, pause: float = 1.0, idle_timeout: float = 3.0,
+                 load_timeout: float = 15.0, max_steps: int = 100) -> Dict:
+    """
+    jobs를 최대 max_tabs개 탭에서 번갈아 진행합니다. max_tabs=1이면 기존처럼 한 탭씩 순차 진행합니다.
+    한 바퀴를 도는 데 걸린 시간이 pause보다 짧을 때만 나머지를 쉽니다.
+    반환: {'results': [작업별 결과], 'elapsed', 'cards', 'cards_per_sec'}
+    """
+    driver.set_script_timeout(10)
+    queue = list(jobs)
+    active: List[Dict] = []
+    finished: List[Dict] = []
+    started = time.perf_counter()
+    first = True
+
+    def finish(job: Dict, reason: str):
+        driver.switch_to.window(job["handle"])
+        try:
+            job["records"] = extract_records(driver, job)
+        except Exception as e:
+            job["error"] = f"{type(e).__name__}: {e}"
+        job["done"] = True
+        job["elapsed"] = time.perf_counter() - job["opened_at"]
+        print(f"[탭 종료] {job['platform']}/{job.get('tab') or '-'} | {job['name']} | {len(job['records'])}개, "
+              f"단계 {job['steps']}회, {job['elapsed']:.1f}초 ({reason})")
+        active.remove(job)
+        finished.append(job)
+        if len(driver.window_handles) > 1:
+            driver.close()
+        driver.switch_to.window(driver.window_handles[0])
+
+    while queue or active:
+        while queue and len(active) < max_tabs:
+            job = queue.pop(0)
+            open_tab(driver, job, first=first and not active)
+            first = False
+            active.append(job)
+
+        cycle_started = time.perf_counter()
+        for job in list(active):
+            driver.switch_to.window(job["handle"])
+            now = time.perf_counter()
+            if not job["ready"]:
+                state, href = driver.execute_script("return [document.readyState, location.href];")
+                navigated = href != job["prev_href"] and state != "loading"
+                if not navigated and now - job["opened_at"] < load_timeout:
+                    continue
+                job["ready"] = True
+                job["last_growth"] = now
+                dismiss_overlays(driver, job["platform"])
+                if job["platform"] == "naver":
+                    install_navertv_capture_hook(driver)
+            try:
+                count = advance(driver, job)
+                job["steps"] += 1
+            except Exception as e:
+                job["error"] = f"{type(e).__name__}: {e}"
+                finish(job, "오류")
+                continue
+            if count > job["count"]:
+                job["count"] = count
+                job["last_growth"] = now
+            elif now - job["last_growth"] >= idle_timeout:
+                finish(job, f"{idle_timeout:.0f}초 동안 새 항목 없음")
+            elif job["steps"] >= max_steps:
+                finish(job, "최대 단계 도달")
+
+        spent = time.perf_counter() - cycle_started
+        if active and spent < pause:
+            time.sleep(pause - spent)
+
+    elapsed = time.perf_counter() - started
+    cards = sum(len(j["records"]) for j in finished)
+    order = {id(j): i for i, j in enumerate(jobs)}
+    finished.sort(key=lambda j: order[id(j)])
+    return {"results": finished, "elapsed": elapsed, "cards": cards,
+            "cards_per_sec": cards / elapsed if elapsed > 0 else 0.0}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="한 브라우저 다중 탭 겹침 수집")
+    parser.add_argument("--channels", default=None, help="batch_crawl 형식의 채널 목록 CSV (URL 필요)")
+    parser.add_argument("--youtube", default=None, help="YouTube 채널 URL (탭별로 나눠 수집)")
+    parser.add_argument("--tabs", default="videos,shorts,streams", help="--youtube와 함께 사용할 탭 목록")
+    parser.add_argument("--max-tabs", type=int, default=4)
+    parser.add_argument("--pause", type=float, default=1.0, help="한 바퀴의 최소 간격(초)")
+    parser.add_argument("--idle-timeout", type=float, default=3.0)
+    parser.add_argument("--compare", action="store_true", help="같은 작업을 한 탭 순차 방식으로도 실행해 비교")
+    parser.add_argument("--headless", action="store_true")
+    args = parser.parse_args()
+
+    jobs: List[Dict] = []
+    if args.channels:
+        jobs += channel_jobs(load_channel_list(args.channels))
+    if args.youtube:
+        jobs += youtube_tab_jobs(args.youtube, [t.strip() for t in args.tabs.split(",") if t.strip()])
+    if not jobs:
+        parser.error("--channels 또는 --youtube가 필요합니다.")
+
+    driver = create_driver(headless=args.headless)
+    try:
+        runs = [("다중 탭", args.max_tabs)] + ([("순차(1탭)", 1)] if args.compare else [])
+        summary: Dict[str, Dict] = {}
+        for label, tabs in runs:
+            print(f"\n=== {label}: 작업 {len(jobs)}개, 동시 탭 {tabs}개 ===")
+            summary[label] = collect_tabs(driver, [dict(j) for j in jobs], max_tabs=tabs, pause=args.pause,
+                                          idle_timeout=args.idle_timeout)
+    finally:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    print(f"\n{'방식':<10}{'카드':>8}{'시간(s)':>10}{'카드/초':>10}")
+    for label, res in summary.items():
+        print(f"{label:<10}{res['cards']:>8}{res['elapsed']:>10.1f}{res['cards_per_sec']:>10.2f}")
+    if args.compare:
+        multi, seq = summary["다중 탭"], summary["순차(1탭)"]
+        if seq["cards_per_sec"]:
+            print(f"\n유효 처리량 {multi['cards_per_sec'] / seq['cards_per_sec']:.2f}배")
+
+
+if __name__ == "__main__":
+    main()
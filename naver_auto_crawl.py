@@ -1,20 +1,46 @@
+import json
 import time
 from datetime import datetime
 import re
-from typing import List, Dict, Optional
+from typing import Any, Callable, Iterator, List, Dict, Optional, Set
 
-import pandas as pd
-import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-
-def smart_scroll_until_no_new(driver, item_selector: str, max_scrolls: int = 80, pause: float = 1.0):
+from browser import lightweight_collection
+from browser_pool import BrowserPool
+from change_probe import PROBE_SIZE, collect_with_probe
+from channel_cache import collect_with_channel_cache, lookup_channel_url
+from checkpoint import (checkpoint_path, checkpointing_stop_when, clear_checkpoint, fast_forward, load_checkpoint,
+                        merge_resumed)
+from csv_output import write_csv_if_changed
+from incremental import load_known_catalog, make_frontier_check, merge_with_cache, plan_round
+from memory_watchdog import MemoryWatchdog, maintain
+from overlays import dismiss_overlays
+from page_loader import observe_scroll_until_no_new
+from parquet_export import append_round, require_pyarrow
+from parsing import extract_video_id, parse_duration_to_seconds, parse_views_generic
+from storage import latest_catalog, open_store, save_round
+from streaming import clear_partial_csv, drain, make_partial_csv_sink, make_store_sink, scroll_step, stream_new_items
+from video_index import update_index
+
+
+def smart_scroll_until_no_new(driver, item_selector: str, max_scrolls: int = 80, pause: float = 1.0, stop_when: Optional[Callable[[], bool]] = None,
+                              use_observer: bool = True, idle_timeout: float = 3.0):
+    if use_observer:
+        try:
+            observe_scroll_until_no_new(driver, item_selector, max_scrolls=max_scrolls, idle_timeout=idle_timeout, stop_when=stop_when)
+            return
+        except Exception as e:
+            print(f"이벤트 기반 스크롤 실패 → 고정 대기 스크롤로 대체: {e}")
     last = 0
     still = 0
     for i in range(max_scrolls):
+        if stop_when and stop_when():
+            print("중단 조건 충족. 스크롤 종료.")
+            break
         driver.execute_script("window.scrollTo(0, document.documentElement.scrollHeight);")
         time.sleep(pause)
         cnt = len(driver.find_elements(By.CSS_SELECTOR, item_selector))
@@ -29,93 +55,283 @@ def smart_scroll_until_no_new(driver, item_selector: str, max_scrolls: int = 80,
             break
 
 
-def parse_duration_to_seconds(text: str) -> Optional[int]:
-    if not text:
-        return None
-    t = re.sub(r"\s+", "", text).upper()
-    if any(k in t for k in ["LIVE", "실시간", "스트리밍", "PREMIERE", "예정"]):
+def try_dismiss_overlays(driver):
+    """
+    쿠키 동의/로그인 유도 등 클릭을 방해하는 오버레이를 한 번의 페이지 내 조회로 닫습니다.
+    보이는 후보가 없으면 대기 없이 반환하며, 실패해도 예외를 던지지 않습니다. (패턴: overlays.OVERLAY_PATTERNS["naver"])
+    """
+    dismiss_overlays(driver, "naver")
+
+
+NAVER_CARD_SELECTOR = "a[href*='/v/']"
+# 스크롤 한 번에 추가되는 클립 수 (증분 수집에서 '한 페이지'로 사용)
+NAVER_PAGE_SIZE = 20
+
+# 이후 스크롤로 로드되는 페이지(JSON 응답)를 window.__acNaverPages에 모아두는 훅.
+NAVER_CAPTURE_HOOK_SCRIPT = r"""
+if (window.__acNaverHooked) return true;
+window.__acNaverHooked = true;
+window.__acNaverPages = window.__acNaverPages || [];
+const keep = (body) => {
+  if (body && (body.indexOf('clipNo') >= 0 || body.indexOf('clipId') >= 0)) window.__acNaverPages.push(body);
+};
+const origFetch = window.fetch;
+if (origFetch) {
+  window.fetch = function () {
+    return origFetch.apply(this, arguments).then((res) => {
+      try { res.clone().text().then(keep).catch(() => {}); } catch (e) {}
+      return res;
+    });
+  };
+}
+const origSend = XMLHttpRequest.prototype.send;
+XMLHttpRequest.prototype.send = function () {
+  this.addEventListener('load', function () {
+    try { if (!this.responseType || this.responseType === 'text') keep(this.responseText); } catch (e) {}
+  });
+  return origSend.apply(this, arguments);
+};
+return true;
+"""
+
+# 페이지에 내장된 초기 상태(JSON)와 캡처된 추가 페이지를 문자열 목록으로 반환하는 스크립트.
+NAVER_STATE_SCRIPT = r"""
+const blobs = [];
+const next = document.getElementById('__NEXT_DATA__');
+if (next && next.textContent) blobs.push(next.textContent);
+for (const key of ['__INITIAL_STATE__', '__PRELOADED_STATE__', '__APOLLO_STATE__']) {
+  try { if (window[key]) blobs.push(JSON.stringify(window[key])); } catch (e) {}
+}
+return JSON.stringify({state: blobs, pages: window.__acNaverPages || []});
+"""
+
+
+def install_navertv_capture_hook(driver) -> bool:
+    try:
+        return bool(driver.execute_script(NAVER_CAPTURE_HOOK_SCRIPT))
+    except Exception as e:
+        print(f"추가 페이지 캡처 훅 설치 실패: {e}")
+        return False
+
+
+def read_navertv_state(driver) -> Optional[Dict[str, List[Any]]]:
+    """
+    초기 상태 JSON과 캡처된 추가 페이지 JSON을 파싱하여 {'state': [...], 'pages': [...]}로 반환합니다.
+    상태 블롭이 하나도 없으면 None을 반환합니다.
+    """
+    try:
+        raw = json.loads(driver.execute_script(NAVER_STATE_SCRIPT) or "{}")
+    except Exception as e:
+        print(f"초기 상태 읽기 실패: {e}")
         return None
-    m = re.match(r"^(?:(\d+):)?(\d{1,2}):(\d{2})$", t)
-    if not m:
+    parsed: Dict[str, List[Any]] = {"state": [], "pages": []}
+    for key in ("state", "pages"):
+        for blob in raw.get(key) or []:
+            try:
+                parsed[key].append(json.loads(blob))
+            except (TypeError, ValueError):
+                continue
+    if not parsed["state"]:
         return None
-    h = int(m.group(1) or 0)
-    m_ = int(m.group(2))
-    s = int(m.group(3))
-    return h * 3600 + m_ * 60 + s
+    return parsed
+
+
+# 채널 클립 목록이 아닌 노드(추천/인기/관련 영상, 재생목록, 배너 등)의 키
+NAVER_NON_CHANNEL_KEYS = re.compile(r"recommend|related|popular|best|ranking|playlist|banner|^ads?$", re.I)
+
+
+def is_clip_object(obj: Any) -> bool:
+    return isinstance(obj, dict) and ("clipNo" in obj or "clipId" in obj) and any(k in obj for k in ("title", "clipTitle"))
+
+
+def channel_clip_list(obj: Any) -> List[Dict]:
+    """
+    JSON에서 채널 클립 목록 노드를 찾습니다: 원소 절반 이상이 클립 객체인 list 중
+    추천/관련 영상 키(NAVER_NON_CHANNEL_KEYS) 아래에 있지 않은 가장 긴 목록. 없으면 빈 목록.
+    """
+    best: List[Dict] = []
+    stack = [(obj, False)]
+    while stack:
+        cur, excluded = stack.pop()
+        if isinstance(cur, dict):
+            stack.extend((v, excluded or bool(NAVER_NON_CHANNEL_KEYS.search(str(k)))) for k, v in cur.items())
+        elif isinstance(cur, list):
+            clips = [c for c in cur if is_clip_object(c)]
+            if clips and len(clips) * 2 >= len(cur):
+                if not excluded and len(clips) > len(best):
+                    best = clips
+                continue
+            stack.extend((v, excluded) for v in cur)
+    return best
 
 
-def parse_korean_views(text: str) -> Optional[int]:
-    if not text:
+def format_seconds(sec: int) -> str:
+    h, rem = divmod(int(sec), 3600)
+    m, s = divmod(rem, 60)
+    return f"{h}:{m:02d}:{s:02d}" if h else f"{m}:{s:02d}"
+
+
+def record_from_clip(clip: Dict) -> Optional[Dict]:
+    """
+    클립 객체를 수집 레코드 형태(title, views, url, duration, duration_seconds)로 변환합니다.
+    """
+    clip_no = clip.get("clipNo") or clip.get("clipId")
+    if not clip_no:
         return None
-    raw = text.strip()
-    lower = raw.lower()
-    if any(k in lower for k in ["no views", "조회수 없음", "조회수없음"]):
-        return 0
-    t = raw.replace("조회수", "").replace("조회", "").replace("재생", "").replace("회", "")
-    t = re.sub(r"\s+", "", t)
-    m = re.match(r"^([0-9]+(?:\.[0-9]+)?)(억|만|천)?$", t)
-    if m:
-        num = float(m.group(1))
-        unit = m.group(2)
-        if unit == "억":
-            num *= 100_000_000
-        elif unit == "만":
-            num *= 10_000
-        elif unit == "천":
-            num *= 1_000
-        return int(num)
-    m_en = re.match(r"^([0-9]+(?:\.[0-9]+)?)([KMBkmb])?$", re.sub(r"[^0-9KMBkmb\.]", "", lower))
-    if m_en:
-        num = float(m_en.group(1))
-        unit = (m_en.group(2) or '').upper()
-        if unit == 'K':
-            num *= 1_000
-        elif unit == 'M':
-            num *= 1_000_000
-        elif unit == 'B':
-            num *= 1_000_000_000
-        return int(num)
-    m2 = re.search(r"([0-9][0-9,]*)", raw)
-    if m2:
-        return int(m2.group(1).replace(",", ""))
-    return None
-
-
-def parse_views_generic(text: str) -> Optional[int]:
-    if not text:
+    title = str(clip.get("title") or clip.get("clipTitle") or "").strip()
+
+    duration_text, duration_seconds = None, None
+    for key in ("playTime", "duration", "playtime"):
+        val = clip.get(key)
+        if isinstance(val, (int, float)) and not isinstance(val, bool):
+            duration_seconds = int(val)
+            duration_text = format_seconds(duration_seconds)
+            break
+        if isinstance(val, str) and val.strip():
+            duration_text = val.strip()
+            duration_seconds = int(val) if val.isdigit() else parse_duration_to_seconds(val)
+            if val.isdigit():
+                duration_text = format_seconds(duration_seconds)
+            break
+
+    views_val = None
+    for key in ("playCount", "viewCount", "hitCount"):
+        val = clip.get(key)
+        if isinstance(val, (int, float)) and not isinstance(val, bool):
+            views_val = int(val)
+            break
+        if isinstance(val, str) and val.strip():
+            views_val = parse_views_generic(val)
+            break
+
+    return {
+        "title": title,
+        "views": views_val,
+        "url": f"https://tv.naver.com/v/{clip_no}",
+        "duration": duration_text,
+        "duration_seconds": duration_seconds,
+    }
+
+
+def records_from_navertv_state(state: Dict[str, List[Any]]) -> List[Dict]:
+    """
+    블롭마다 채널 클립 목록 노드(channel_clip_list)만 레코드로 바꿉니다. (다른 노드의 추천/관련 클립은 제외)
+    """
+    out: List[Dict] = []
+    seen_urls = set()
+    for blob in state.get("state", []) + state.get("pages", []):
+        for clip in channel_clip_list(blob):
+            rec = record_from_clip(clip)
+            if not rec or rec["url"] in seen_urls:
+                continue
+            seen_urls.add(rec["url"])
+            out.append({"index": len(out) + 1, **rec})
+    return out
+
+
+def record_from_anchor(a) -> Optional[Dict]:
+    """
+    a[href*='/v/'] 앵커와 주변 텍스트에서 수집 레코드(index 제외)를 만듭니다. (앵커 스캔 경로)
+    """
+    href = a.get_attribute("href")
+    if not href:
         return None
-    t = text.strip()
-    t_clean = re.sub(r"(조회수|조회|재생수|재생|views|view)", "", t, flags=re.IGNORECASE)
-    t_clean = t_clean.replace("회", "").strip()
-    v = parse_korean_views(t_clean)
-    if v is not None:
-        return v
-    m = re.search(r"([0-9][0-9,]*)", t)
-    if m:
-        return int(m.group(1).replace(",", ""))
-    return None
+    title = (a.get_attribute("title") or a.text or "").strip()
+    try:
+        container = a.find_element(By.XPATH, "ancestor::*[self::li or self::div][1]")
+    except Exception:
+        container = a
+    duration_text = None
+    try:
+        texts = [e.text for e in container.find_elements(By.XPATH, ".//*[self::span or self::em][contains(.,':')]")]
+        for t in texts:
+            m = re.search(r"\b\d{1,2}:\d{2}(?::\d{2})?\b", t)
+            if m:
+                duration_text = m.group(0); break
+    except Exception:
+        pass
+    duration_seconds = parse_duration_to_seconds(duration_text) if duration_text else None
+    views_val = None
+    try:
+        texts = [e.text for e in container.find_elements(By.XPATH, ".//*[self::span or self::em or self::div]")]
+        cand = None
+        for t in texts:
+            if any(k in t for k in ["조회", "재생", "views", "VIEW", "View"]):
+                cand = t; break
+        views_val = parse_views_generic(cand) if cand else None
+    except Exception:
+        pass
+    return {
+        "title": title,
+        "views": views_val,
+        "url": href,
+        "duration": duration_text,
+        "duration_seconds": duration_seconds,
+    }
+
+
+# 목록 앵커와 href를 start번째부터 한 번에 [앵커, href] 쌍으로 읽는 스크립트
+# (앵커와 href를 따로 읽으면 그 사이 목록이 늘어나거나 다시 렌더링될 때 서로 어긋남)
+NAVER_ANCHOR_PAIRS_SCRIPT = "return Array.from(document.querySelectorAll(arguments[0]), (a) => [a, a.href]).slice(arguments[1]);"
+
+
+def records_from_anchors_and_state(driver, state_records: Dict[str, Dict], start: int = 0) -> List[Dict]:
+    """
+    목록 앵커(start번째 이후)를 기준으로 레코드(index 제외)를 만듭니다. 앵커의 클립 ID가 상태 JSON 레코드에
+    있으면 그것을, 없으면 앵커 주변 텍스트(record_from_anchor)를 사용하고, 앵커에 없는 상태 JSON 클립은 버립니다.
+    """
+    pairs = driver.execute_script(NAVER_ANCHOR_PAIRS_SCRIPT, NAVER_CARD_SELECTOR, start) or []
+    out: List[Dict] = []
+    seen_ids = set()
+    for a, href in pairs:
+        clip_id = extract_video_id(href) or href
+        if not clip_id or clip_id in seen_ids:
+            continue
+        seen_ids.add(clip_id)
+        rec = state_records.get(clip_id)
+        if rec is None:
+            try:
+                rec = record_from_anchor(a)
+            except Exception as e:
+                print(f"카드 파싱 실패: {e}")
+                continue
+        if rec:
+            out.append({k: v for k, v in rec.items() if k != "index"})
+    return out
 
 
-def try_dismiss_overlays(driver):
-    candidates = [
-        "//button[.//span[contains(., '동의')]]",
-        "//button[normalize-space()='동의함']",
-        "//button[contains(., 'I agree')]",
-        "//button[contains(., 'Accept all')]",
-        "//button[@aria-label='닫기' or @aria-label='Close']",
-    ]
-    for xp in candidates:
-        try:
-            el = WebDriverWait(driver, 2).until(EC.element_to_be_clickable((By.XPATH, xp)))
-            el.click()
-            print(f"오버레이 닫힘: {xp}")
-        except Exception:
-            pass
+def state_records_by_id(records: List[Dict]) -> Dict[str, Dict]:
+    return {extract_video_id(r["url"]) or r["url"]: r for r in records}
+
+
+def collect_navertv_videos(driver, channel_name: str, channel_url: Optional[str] = None, mode: str = "dom",
+                           known_ids: Optional[Set[str]] = None, checkpoint_path: Optional[str] = None) -> List[Dict]:
+    """
+    known_ids가 주어지면 증분 모드: 목록 끝의 한 페이지가 모두 알려진 ID이면 스크롤을 멈추고 앞부분만 반환합니다.
 
+    mode="dom":   a[href*='/v/'] 앵커와 주변 텍스트를 스캔합니다. (기본값)
+    mode="state": 페이지에 내장된 초기 상태 JSON과 스크롤 중 로드된 추가 페이지 JSON의 채널 클립 목록 노드에서
+                  레코드를 구성합니다. 목록 앵커의 클립 ID와 다르면(추천 클립 포함, 추가 페이지 누락) 앵커를 기준으로
+                  병합하고, 상태 블롭이 없거나 클립을 찾지 못하면 앵커 스캔으로 대체합니다.
+
+    checkpoint_path가 주어지면 스크롤 중 주기적으로 레코드(state 모드)와 로드된 항목 수를 저장하고, 다음 호출은
+    그 항목 수까지 추출 없이 스크롤만 해서 내려간 뒤 이어서 수집하고 이전 체크포인트에만 있던 레코드를 병합합니다. (checkpoint.py)
+    """
+    print(f"NaverTV 채널 '{channel_name}'의 모든 동영상 정보를 수집합니다. (mode={mode})")
+    resumed = load_checkpoint(checkpoint_path)
+    if resumed:
+        print(f"체크포인트 발견: 레코드 {len(resumed.get('records') or [])}개, 항목 {resumed.get('items')}개 → 그 위치부터 이어서 수집")
+    out = collect_navertv_listing(driver, channel_name, channel_url=channel_url, mode=mode, known_ids=known_ids,
+                                  checkpoint_path=checkpoint_path, resumed=resumed)
+    out = merge_resumed(out, resumed)
+    clear_checkpoint(checkpoint_path)
+    return out
 
-def collect_navertv_videos(driver, channel_name: str, channel_url: Optional[str] = None) -> List[Dict]:
-    print(f"NaverTV 채널 '{channel_name}'의 모든 동영상 정보를 수집합니다.")
 
+def open_navertv_listing(driver, channel_name: str, channel_url: Optional[str] = None) -> bool:
+    """
+    채널 URL로 이동하거나, URL이 없으면 검색 결과에서 채널 링크를 클릭합니다. 반환: 채널 페이지 도착 여부
+    """
     # 채널 URL이 직접 제공되면 그것을 사용
     if channel_url:
         print(f"지정된 채널 URL로 직접 이동: {channel_url}")
@@ -189,58 +405,67 @@ def collect_navertv_videos(driver, channel_name: str, channel_url: Optional[str]
     if not is_channel_page:
         print("⚠ 경고: 채널 페이지로 이동하지 못했습니다. 검색 결과에서 영상을 수집합니다.")
         print("  → 다른 채널의 영상이 포함될 수 있습니다.")
+    return is_channel_page
+
+
+def collect_navertv_listing(driver, channel_name: str, channel_url: Optional[str], mode: str,
+                            known_ids: Optional[Set[str]], checkpoint_path: Optional[str],
+                            resumed: Optional[Dict] = None) -> List[Dict]:
+    """
+    collect_navertv_videos 본체: 채널 이동 → 스크롤 → 목록 추출
+    """
+    open_navertv_listing(driver, channel_name, channel_url)
 
     time.sleep(1)
-    smart_scroll_until_no_new(driver, "a[href*='/v/']", max_scrolls=80, pause=1.0)
-    cards = driver.find_elements(By.CSS_SELECTOR, "a[href*='/v/']")
+    if mode == "state":
+        install_navertv_capture_hook(driver)
+    if resumed:
+        fast_forward(driver, NAVER_CARD_SELECTOR, resumed)
+    stop_when = make_frontier_check(driver, NAVER_CARD_SELECTOR, known_ids, NAVER_PAGE_SIZE) if known_ids else None
+    if checkpoint_path:
+        def snapshot() -> Dict:
+            state = read_navertv_state(driver) if mode == "state" else None
+            records = records_from_navertv_state(state) if state else []
+            return {"records": records, "items": driver.execute_script(
+                "return document.querySelectorAll(arguments[0]).length;", NAVER_CARD_SELECTOR)}
+
+        stop_when = checkpointing_stop_when(checkpoint_path, snapshot, stop_when)
+    smart_scroll_until_no_new(driver, NAVER_CARD_SELECTOR, max_scrolls=80, pause=1.0, stop_when=stop_when)
+
+    if mode == "state":
+        state = read_navertv_state(driver)
+        out_state = records_from_navertv_state(state) if state else []
+        if out_state:
+            by_id = state_records_by_id(out_state)
+            out = [{"index": i, **rec} for i, rec in enumerate(records_from_anchors_and_state(driver, by_id), 1)]
+            state_ids = set(by_id)
+            anchor_ids = {extract_video_id(r["url"]) or r["url"] for r in out}
+            if state_ids != anchor_ids:
+                print(f"상태 JSON 클립 {len(state_ids)}개와 목록 앵커 {len(anchor_ids)}개가 다릅니다 → 앵커 기준으로 병합 "
+                      f"(상태 JSON에만 있는 {len(state_ids - anchor_ids)}개 제외, 앵커에서 보충 {len(anchor_ids - state_ids)}개)")
+            for rec in out:
+                print(f"- [{rec['index']}] {rec['title']} | 조회수: {rec['views']} | 길이: {rec['duration']}")
+            print(f"최종 수집된 영상 수: {len(out)}개 (초기 상태 {len(state['state'])}개 + 추가 페이지 {len(state['pages'])}개)")
+            return out
+        print("초기 상태 JSON에서 영상을 찾지 못했습니다. 앵커 스캔으로 대체합니다.")
+
+    cards = driver.find_elements(By.CSS_SELECTOR, NAVER_CARD_SELECTOR)
     print(f"감지된 영상 링크 수: {len(cards)}")
 
     out: List[Dict] = []
-    seen_urls = set()  # 중복 제거용
+    seen_ids = set()  # 클립 ID 기준 중복 제거
 
     for a in cards:
         try:
-            href = a.get_attribute("href")
-
-            # 중복 URL 제거
-            if not href or href in seen_urls:
+            rec = record_from_anchor(a)
+            if not rec:
                 continue
-            seen_urls.add(href)
-
-            title = (a.get_attribute("title") or a.text or "").strip()
-            try:
-                container = a.find_element(By.XPATH, "ancestor::*[self::li or self::div][1]")
-            except Exception:
-                container = a
-            duration_text = None
-            try:
-                texts = [e.text for e in container.find_elements(By.XPATH, ".//*[self::span or self::em][contains(.,':')]")]
-                for t in texts:
-                    m = re.search(r"\b\d{1,2}:\d{2}(?::\d{2})?\b", t)
-                    if m:
-                        duration_text = m.group(0); break
-            except Exception:
-                pass
-            duration_seconds = parse_duration_to_seconds(duration_text) if duration_text else None
-            views_val = None
-            try:
-                texts = [e.text for e in container.find_elements(By.XPATH, ".//*[self::span or self::em or self::div]")]
-                cand = None
-                for t in texts:
-                    if any(k in t for k in ["조회", "재생", "views", "VIEW", "View"]):
-                        cand = t; break
-                views_val = parse_views_generic(cand) if cand else None
-            except Exception:
-                pass
-            out.append({
-                "index": len(out) + 1,
-                "title": title,
-                "views": views_val,
-                "url": href,
-                "duration": duration_text,
-                "duration_seconds": duration_seconds,
-            })
-            print(f"- [{len(out)}] {title} | 조회수: {views_val} | 길이: {duration_text}")
+            clip_id = extract_video_id(rec["url"]) or rec["url"]
+            if clip_id in seen_ids:
+                continue
+            seen_ids.add(clip_id)
+            out.append({"index": len(out) + 1, **rec})
+            print(f"- [{len(out)}] {rec['title']} | 조회수: {rec['views']} | 길이: {rec['duration']}")
         except Exception as e:
             print(f"카드 파싱 실패: {e}")
 
@@ -248,6 +473,94 @@ def collect_navertv_videos(driver, channel_name: str, channel_url: Optional[str]
     return out
 
 
+# 캡처된 추가 페이지 중 arguments[0]번째 이후만 반환 (스트리밍 수집에서 새 페이지만 파싱)
+NAVER_PAGES_SINCE_SCRIPT = "return (window.__acNaverPages || []).slice(arguments[0]);"
+
+
+def iter_navertv_video_batches(driver, channel_name: str, channel_url: Optional[str] = None, mode: str = "dom",
+                               known_ids: Optional[Set[str]] = None, max_scrolls: int = 80) -> Iterator[List[Dict]]:
+    """
+    collect_navertv_videos의 스트리밍 버전: 스크롤 한 번마다 새로 들어온 부분만 레코드 배치로 yield합니다.
+    mode="state"이면 처음에 초기 상태 JSON을, 이후에는 새로 캡처된 페이지 JSON만 파싱해 두고, 새로 나타난 앵커마다
+    상태 JSON 레코드(없으면 앵커 주변 텍스트)를 사용합니다. 상태 블롭이 없거나 mode="dom"이면 앵커만 스캔합니다.
+    """
+    print(f"NaverTV 채널 '{channel_name}'의 동영상을 스트리밍으로 수집합니다. (mode={mode})")
+    open_navertv_listing(driver, channel_name, channel_url)
+    time.sleep(1)
+    use_state = mode == "state" and install_navertv_capture_hook(driver)
+    progress = {"pages": 0, "initial": True}
+    # 지금까지 파싱한 상태 JSON 레코드 (클립 ID → 레코드), 앵커 기준으로 꺼내 씁니다.
+    state_records: Dict[str, Dict] = {}
+
+    def extract(start: int) -> List[Dict]:
+        nonlocal use_state
+        if use_state:
+            if progress["initial"]:
+                progress["initial"] = False
+                state = read_navertv_state(driver)
+                records = records_from_navertv_state(state) if state else []
+                if records:
+                    progress["pages"] = len(state["pages"])
+                    state_records.update(state_records_by_id(records))
+                else:
+                    print("초기 상태 JSON에서 영상을 찾지 못했습니다. 앵커 스캔으로 대체합니다.")
+                    use_state = False
+            else:
+                blobs = driver.execute_script(NAVER_PAGES_SINCE_SCRIPT, progress["pages"]) or []
+                progress["pages"] += len(blobs)
+                pages = []
+                for blob in blobs:
+                    try:
+                        pages.append(json.loads(blob))
+                    except (TypeError, ValueError):
+                        continue
+                state_records.update(state_records_by_id(records_from_navertv_state({"state": [], "pages": pages})))
+        if use_state:
+            return records_from_anchors_and_state(driver, state_records, start)
+        out = []
+        for a in driver.find_elements(By.CSS_SELECTOR, NAVER_CARD_SELECTOR)[start:]:
+            try:
+                rec = record_from_anchor(a)
+            except Exception as e:
+                print(f"카드 파싱 실패: {e}")
+                continue
+            if rec:
+                out.append(rec)
+        return out
+
+    stop_when = make_frontier_check(driver, NAVER_CARD_SELECTOR, known_ids, NAVER_PAGE_SIZE) if known_ids else None
+    yield from stream_new_items(driver, NAVER_CARD_SELECTOR, extract, scroll_step(driver, NAVER_CARD_SELECTOR),
+                                max_steps=max_scrolls, stop_when=stop_when)
+
+
+def probe_navertv_first_page(driver, channel_name: str, channel_url: Optional[str] = None, mode: str = "dom",
+                             size: int = PROBE_SIZE) -> List[Dict]:
+    """
+    채널 첫 화면만 열어(스크롤 없음) 최신 size개 레코드를 반환합니다. (change_probe 변경 감지용)
+    state 모드는 앞쪽 앵커 순서대로 초기 상태 JSON 레코드를, 실패하거나 dom 모드이면 앵커 주변 텍스트를 읽습니다.
+    """
+    open_navertv_listing(driver, channel_name, channel_url)
+    WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, NAVER_CARD_SELECTOR)))
+    if mode == "state":
+        state = read_navertv_state(driver)
+        records = records_from_navertv_state(state) if state else []
+        if records:
+            merged = records_from_anchors_and_state(driver, state_records_by_id(records))
+            return [{"index": i, **rec} for i, rec in enumerate(merged[:size], 1)]
+    out: List[Dict] = []
+    seen_ids = set()
+    for a in driver.find_elements(By.CSS_SELECTOR, NAVER_CARD_SELECTOR):
+        rec = record_from_anchor(a)
+        clip_id = extract_video_id(rec["url"]) if rec else None
+        if not rec or clip_id in seen_ids:
+            continue
+        seen_ids.add(clip_id)
+        out.append({"index": len(out) + 1, **rec})
+        if len(out) >= size:
+            break
+    return out
+
+
 def play_videos_sequence_generic(driver, videos: List[Dict], site: str):
     print(f"{site}: 순서대로 영상 재생 시작")
     for v in sorted(videos, key=lambda x: x.get("index", 0)):
@@ -279,34 +592,147 @@ def play_videos_sequence_generic(driver, videos: List[Dict], site: str):
             print(f"  · 재생 중 오류: {e}")
 
 
-def run_loop_navertv(channel_name: str, csv_path: str = "navertv_videos.csv", channel_url: Optional[str] = None):
+def run_loop_navertv(channel_name: str, csv_path: str = "navertv_videos.csv", channel_url: Optional[str] = None, mode: str = "dom",
+                     incremental: bool = False, full_resync_every: int = 10, lightweight: bool = False,
+                     store_path: Optional[str] = None, parquet_dir: Optional[str] = None,
+                     channel_cache_path: Optional[str] = None, profile_dir: Optional[str] = None,
+                     checkpoint_dir: Optional[str] = None, streaming: bool = False,
+                     memory_log: Optional[str] = None, video_index_path: Optional[str] = None,
+                     probe_path: Optional[str] = None):
+    """
+    channel_url이 없고 channel_cache_path가 주어지면 검색으로 찾은 채널 URL을 캐시해 다음 라운드부터 검색을 생략합니다.
+    profile_dir가 주어지면 브라우저 프로필(캐시/쿠키)을 그 폴더에 유지하고, 브라우저가 죽으면 새로 띄워 중단된 단계를 다시 실행합니다.
+    checkpoint_dir가 주어지면 긴 목록 수집의 진행 상황을 그 폴더에 저장하고, 중단 후 다음 시도(브라우저 교체 후 재시도 포함)에서 이어서 수집합니다.
+    streaming=True이면 스크롤마다 새로 로드된 부분만 추출해 배치 단위로 부분 CSV(<csv>.partial.csv) 또는 저장소에 바로 기록합니다.
+    memory_log가 주어지면 브라우저 프로세스 트리 RSS/CPU와 렌더러 JS 힙을 그 CSV에 시계열로 기록하고, 라운드 사이에
+    임계값(memory_watchdog.py)을 넘으면 탭 또는 브라우저를 새로 띄운 뒤 같은 위치(URL)로 돌아갑니다.
+    video_index_path가 주어지면 영상 ID 기준 색인(video_index.py)을 갱신하고 라운드 간 변경분(신규/삭제/제목 변경/조회수 증감)을
+    <색인>.changes.jsonl에 추가합니다.
+    probe_path가 주어지면 라운드마다 먼저 목록 첫 화면의 최신 영상 ID/조회수 지문만 확인하고(change_probe.py),
+    마지막 전체 수집 때와 같으면 캐시된 목록을 그대로 사용해 전체 수집을 생략합니다.
+    """
     print("NaverTV 무한 재생 루프 시작")
-    options = uc.ChromeOptions()
-    options.add_argument("--window-size=1600,1000")
-    options.add_argument("--disable-background-timer-throttling")
-    options.add_argument("--disable-backgrounding-occluded-windows")
-    options.add_argument("--disable-renderer-backgrounding")
-    driver = uc.Chrome(options=options)
+    pool = BrowserPool(profile_root=profile_dir, name="naver").start()
+    watchdog = MemoryWatchdog(memory_log).start() if memory_log else None
+    if watchdog is not None:
+        pool.run(watchdog.attach, label="메모리 확인")
+    landed: Dict[str, Optional[str]] = {"url": None}
+    ckpt = checkpoint_path(checkpoint_dir, "naver", channel_name) if checkpoint_dir else None
+    if ckpt and streaming:
+        print("경고: 스트리밍 모드에서는 체크포인트를 저장하지 않습니다. (배치마다 부분 CSV/저장소에 기록된 결과로 대신함)")
+    round_at: Dict[str, Optional[str]] = {"saved_at": None}
+
+    def stream_sinks() -> List[Callable[[List[Dict]], None]]:
+        # 브라우저 교체 후 재시도하면 sink를 새로 만들어 부분 CSV를 처음부터 다시 씁니다.
+        saved_at = round_at["saved_at"] or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if store is not None:
+            return [make_store_sink(store, "naver", channel_name, saved_at)]
+        return [make_partial_csv_sink(csv_path, saved_at)]
+
+    def collect(url: Optional[str], known_ids: Optional[Set[str]]) -> List[Dict]:
+        def step(driver) -> List[Dict]:
+            with lightweight_collection(driver, enabled=lightweight):
+                if streaming:
+                    records = drain(iter_navertv_video_batches(driver, channel_name, channel_url=url, mode=mode,
+                                                               known_ids=known_ids), stream_sinks())
+                else:
+                    records = collect_navertv_videos(driver, channel_name, channel_url=url, mode=mode, known_ids=known_ids,
+                                                     checkpoint_path=ckpt)
+            landed["url"] = driver.current_url
+            return records
+
+        return pool.run(step, label="목록 수집")
+
+    def probe() -> List[Dict]:
+        # 지정된 채널 URL 또는 마지막 전체 수집에서 도착한 URL(없으면 채널 URL 캐시)의 첫 화면만 확인
+        url = channel_url or landed["url"] or (lookup_channel_url(channel_cache_path, "naver", channel_name)
+                                               if channel_cache_path else None)
+        return pool.run(lambda driver: probe_navertv_first_page(driver, channel_name, channel_url=url, mode=mode),
+                        label="변경 감지")
+
+    store = open_store(store_path) if store_path else None
+    if parquet_dir:
+        require_pyarrow()
     try:
+        if store is not None:
+            cached = latest_catalog(store, "naver", channel_name) if incremental else []
+        else:
+            cached = load_known_catalog(csv_path) if incremental else []
+        round_no = 0
         while True:
-            vids = collect_navertv_videos(driver, channel_name, channel_url=channel_url)
-            saved_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            df = pd.DataFrame(vids)
-            df["saved_at"] = saved_at
-            df.to_csv(csv_path, index=False, encoding="utf-8-sig")
-            print(f"CSV 업데이트(NaverTV): {csv_path} | {len(df)}개")
-            play_videos_sequence_generic(driver, vids, site="NaverTV")
+            round_no += 1
+            known_ids = plan_round(round_no, cached, incremental, full_resync_every)
+            round_at["saved_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+            def full_crawl() -> List[Dict]:
+                if channel_url:
+                    fresh = collect(channel_url, known_ids)
+                else:
+                    fresh = collect_with_channel_cache(channel_cache_path, "naver", channel_name,
+                                                       lambda url: collect(url, known_ids), lambda: landed["url"])
+                return merge_with_cache(fresh, cached) if known_ids is not None else fresh
+
+            vids, skipped = collect_with_probe(probe_path, "naver", channel_name, cached, probe, full_crawl)
+            cached = vids
+            saved_at = round_at["saved_at"] if streaming else datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            if store is not None and skipped:
+                print(f"첫 페이지 변화 없음 → 저장소 기록 생략(NaverTV): {store_path}")
+            elif store is not None:
+                n = save_round(store, "naver", channel_name, vids, saved_at)
+                print(f"저장소 기록(NaverTV): {store_path} | {n}개")
+            elif write_csv_if_changed(vids, csv_path, saved_at):
+                print(f"CSV 업데이트(NaverTV): {csv_path} | {len(vids)}개")
+            else:
+                print(f"목록 변경 없음 → CSV 쓰기 생략(NaverTV): {csv_path} | {len(vids)}개")
+            if store is None:
+                clear_partial_csv(csv_path)
+            if parquet_dir and not skipped:
+                append_round(parquet_dir, "naver", channel_name, vids, saved_at)
+                print(f"Parquet 이력 추가(NaverTV): {parquet_dir}")
+            if video_index_path and not skipped:
+                update_index(video_index_path, "naver", channel_name, vids, saved_at)
+            pool.run(lambda driver: play_videos_sequence_generic(driver, vids, site="NaverTV"), label="재생")
+            maintain(pool, watchdog)
     except KeyboardInterrupt:
         print("사용자 인터럽트(NaverTV). 종료합니다.")
     finally:
-        try:
-            driver.quit()
-        except Exception:
-            pass
+        if store is not None:
+            store.close()
+        if watchdog is not None:
+            watchdog.stop()
+        pool.close()
 
 
 if __name__ == "__main__":
     CHANNEL_NAME = "조선대학교 SW중심사업단"
     # 필요시 채널 URL을 직접 지정하세요. 예: NAVER_CHANNEL_URL = "https://tv.naver.com/cnu.sw"
     NAVER_CHANNEL_URL = "https://tv.naver.com/chosunswuniv?tab=clip"  # 또는 "https://tv.naver.com/cnu.sw" 같은 채널 URL
-    run_loop_navertv(CHANNEL_NAME, channel_url=NAVER_CHANNEL_URL)
+    # 수집 방식: "dom"(앵커 스캔) 또는 "state"(내장 상태 JSON을 앵커와 대조해 사용, 실패 시 앵커 스캔 / 실제 채널로 검증 전까지 실험적)
+    NAVER_COLLECT_MODE = "dom"
+    # 증분 모드: 이전 라운드 이후 새로 올라온 영상만 수집하고 10라운드마다 전체 재수집
+    INCREMENTAL = False
+    # 경량 수집: 목록 수집 중에는 이미지/미디어/폰트 요청 차단 (재생 시에는 해제)
+    LIGHTWEIGHT = False
+    # 저장소: "crawl.db"처럼 지정하면 CSV 대신 SQLite에 조회수 이력 기록 (CSV는 python storage.py ... --export)
+    STORE_PATH = None
+    # 분석용 Parquet 이력: "view_history"처럼 지정하면 라운드마다 날짜별 파티션에 추가 (pyarrow 필요)
+    PARQUET_DIR = None
+    # 채널 URL 캐시: "channel_cache.json"처럼 지정하면 NAVER_CHANNEL_URL이 없을 때 검색으로 찾은 URL을 저장해 다음 라운드부터 검색 생략 (None이면 매번 검색)
+    CHANNEL_CACHE_PATH = None
+    # 브라우저 프로필 폴더: "chrome_profiles"처럼 지정하면 캐시/쿠키를 유지해 재시작을 빠르게 하고, 브라우저가 죽으면 교체 후 재시도 (None이면 임시 프로필)
+    PROFILE_DIR = None
+    # 체크포인트 폴더: "checkpoints"처럼 지정하면 긴 목록 수집 중 진행 상황을 저장해 브라우저 충돌/재시작 후 이어서 수집 (None이면 사용 안 함)
+    CHECKPOINT_DIR = None
+    # 스트리밍 수집: 스크롤/더보기마다 새 배치를 부분 CSV(<csv>.partial.csv) 또는 저장소에 바로 기록 (중단되어도 부분 결과 유지)
+    STREAMING = False
+    # 메모리 감시: "memory_log.csv"처럼 지정하면 브라우저 RSS/CPU·JS 힙을 기록하고 임계값 초과 시 라운드 사이에 탭/브라우저 재활용
+    MEMORY_LOG = None
+    # 영상 ID 색인: "video_index.json"처럼 지정하면 라운드마다 신규/삭제/제목 변경/조회수 증감을 계산해 <색인>.changes.jsonl에 추가 (None이면 사용 안 함)
+    VIDEO_INDEX_PATH = None
+    # 변경 감지: "probe_fingerprints.json"처럼 지정하면 첫 화면 최신 10개가 그대로일 때 전체 수집 생략 (6회 연속 생략 후에는 전체 수집)
+    PROBE_PATH = None
+    run_loop_navertv(CHANNEL_NAME, channel_url=NAVER_CHANNEL_URL, mode=NAVER_COLLECT_MODE,
+                     incremental=INCREMENTAL, full_resync_every=10, lightweight=LIGHTWEIGHT, store_path=STORE_PATH,
+                     parquet_dir=PARQUET_DIR, channel_cache_path=CHANNEL_CACHE_PATH, profile_dir=PROFILE_DIR,
+                     checkpoint_dir=CHECKPOINT_DIR, streaming=STREAMING, memory_log=MEMORY_LOG,
+                     video_index_path=VIDEO_INDEX_PATH, probe_path=PROBE_PATH)
@@ -0,0 +1,144 @@
+"""
+쿠키 동의/로그인 유도 등 오버레이를 한 번의 페이지 내 조회로 닫는 도우미.
+
+플랫폼별 패턴 목록을 한 번에 검사하여, 보이는 후보가 없으면 즉시 반환하고 있으면 패턴마다 첫 후보 하나만 클릭합니다.
+기본 패턴은 동의/대화상자 컨테이너(DIALOG_CONTAINERS) 안의 버튼만 대상으로 하고 텍스트가 정확히 일치해야 하므로,
+목록 페이지의 일반 버튼이나 "동의하지 않음" 같은 버튼은 누르지 않습니다.
+패턴은 OVERLAY_PATTERNS를 수정하거나 register_overlay_patterns / load_overlay_patterns(JSON)로 추가할 수 있습니다.
+
+패턴 형식: {"selector": CSS 선택자, "text": 일치(또는 contains=True면 포함)해야 하는 텍스트, "label": 로그용 이름}
+"""
+
+import json
+from typing import Dict, List, Optional
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+
+# 쿠키 동의/로그인 유도가 뜨는 컨테이너 (이 안의 버튼만 클릭)
+DIALOG_CONTAINERS = [
+    "[role='dialog']", "[role='alertdialog']", "[aria-modal='true']", "dialog",
+    "[class*='consent']", "[id*='consent']", "[class*='cookie']", "[id*='cookie']",
+]
+
+
+def in_dialog(selector: str) -> str:
+    """
+    선택자를 DIALOG_CONTAINERS 안으로 한정합니다. 예: in_dialog("button") → "[role='dialog'] button, ..."
+    """
+    return ", ".join(f"{c} {selector}" for c in DIALOG_CONTAINERS)
+
+
+COMMON_PATTERNS: List[Dict] = [
+    # 쿠키 동의 (KR/EN 변형)
+    {"selector": in_dialog("button"), "text": "동의함", "label": "동의함"},
+    {"selector": in_dialog("button"), "text": "동의", "label": "동의"},
+    {"selector": in_dialog("button"), "text": "모두 동의", "label": "모두 동의"},
+    {"selector": in_dialog("button"), "text": "I agree", "label": "I agree"},
+    {"selector": in_dialog("button"), "text": "Accept all", "label": "Accept all"},
+    # 로그인 유도 닫기 X
+    {"selector": in_dialog("button[aria-label='닫기']") + ", " + in_dialog("button[aria-label='Close']"), "label": "닫기"},
+]
+
+OVERLAY_PATTERNS: Dict[str, List[Dict]] = {
+    "youtube": COMMON_PATTERNS + [
+        {"selector": "ytd-consent-bulk-dialog-renderer button", "text": "Accept all", "label": "consent(Accept all)"},
+        {"selector": "ytd-consent-bulk-dialog-renderer button", "text": "모두 수락", "label": "consent(모두 수락)"},
+        {"selector": "tp-yt-paper-dialog #dismiss-button button, yt-mealbar-promo-renderer #dismiss-button button",
+         "label": "프로모션 닫기"},
+    ],
+    "kakao": list(COMMON_PATTERNS),
+    "naver": list(COMMON_PATTERNS),
+}
+
+# 페이지 내 스크립트를 쓸 수 없을 때 사용하는 XPath 후보 (XPath마다 첫 후보만 클릭, 대화상자 안으로 한정)
+DIALOG_XPATH = "//*[@role='dialog' or @role='alertdialog' or @aria-modal='true' or self::dialog]"
+LEGACY_XPATHS = [
+    f"{DIALOG_XPATH}//button[normalize-space()='동의함' or normalize-space()='동의' or normalize-space()='모두 동의']",
+    f"{DIALOG_XPATH}//button[normalize-space()='I agree' or normalize-space()='Accept all']",
+    f"{DIALOG_XPATH}//button[@aria-label='닫기' or @aria-label='Close']",
+]
+
+DISMISS_OVERLAYS_SCRIPT = r"""
+const patterns = arguments[0];
+const norm = (s) => (s || '').replace(/\s+/g, ' ').trim();
+const clickable = (el) => {
+  if (el.disabled) return false;
+  const r = el.getBoundingClientRect();
+  const st = getComputedStyle(el);
+  return r.width > 0 && r.height > 0 && st.visibility !== 'hidden' && st.display !== 'none' && st.pointerEvents !== 'none';
+};
+const clicked = [];
+const seen = new Set();
+for (const p of patterns) {
+  let els;
+  try { els = document.querySelectorAll(p.selector); } catch (e) { continue; }
+  for (const el of els) {
+    if (seen.has(el)) continue;
+    if (p.text) {
+      const t = norm(el.textContent);
+      if (p.contains ? t.indexOf(p.text) < 0 : t !== p.text) continue;
+    }
+    if (!clickable(el)) continue;
+    seen.add(el);
+    // 패턴마다 첫 후보 하나만 클릭
+    try { el.click(); clicked.push(p.label || p.selector); } catch (e) {}
+    break;
+  }
+}
+return clicked;
+"""
+
+
+def register_overlay_patterns(platform: str, patterns: List[Dict], replace: bool = False):
+    """
+    플랫폼의 오버레이 패턴을 추가(또는 replace=True면 교체)합니다.
+    """
+    if replace or platform not in OVERLAY_PATTERNS:
+        OVERLAY_PATTERNS[platform] = list(patterns)
+    else:
+        OVERLAY_PATTERNS[platform].extend(patterns)
+
+
+def load_overlay_patterns(path: str, replace: bool = False):
+    """
+    {"youtube": [...], "kakao": [...]} 형식의 JSON 파일에서 패턴을 읽어 등록합니다.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    for platform, patterns in data.items():
+        register_overlay_patterns(platform, patterns, replace=replace)
+
+
+def dismiss_overlays_sequential(driver, xpaths: List[str] = LEGACY_XPATHS, timeout: float = 2):
+    """
+    XPath 후보를 하나씩 WebDriverWait로 기다리며 클릭하는 기존 방식입니다. (대체 경로)
+    """
+    clicked = []
+    for xp in xpaths:
+        try:
+            el = WebDriverWait(driver, timeout).until(EC.element_to_be_clickable((By.XPATH, xp)))
+            el.click()
+            clicked.append(xp)
+        except Exception:
+            pass
+    return clicked
+
+
+def dismiss_overlays(driver, platform: str, patterns: Optional[List[Dict]] = None) -> List[str]:
+    """
+    플랫폼의 모든 오버레이 패턴을 한 번의 페이지 내 조회로 검사하고, 패턴마다 보이는 첫 후보를 클릭합니다.
+    후보가 없으면 대기 없이 바로 반환합니다. 실패해도 예외를 던지지 않습니다.
+    반환: 클릭한 패턴 이름 목록
+    """
+    pats = patterns if patterns is not None else OVERLAY_PATTERNS.get(platform, COMMON_PATTERNS)
+    try:
+        clicked = driver.execute_script(DISMISS_OVERLAYS_SCRIPT, pats) or []
+    except Exception as e:
+        print(f"오버레이 일괄 검사 실패 → 순차 검사로 대체: {e}")
+        clicked = dismiss_overlays_sequential(driver)
+    for label in clicked:
+        print(f"오버레이를 닫았습니다: {label}")
+    return clicked
@@ -0,0 +1,101 @@
+"""
+이벤트 기반 무한 스크롤 로더.
+
+고정 시간 sleep 후 find_elements로 개수를 세는 대신, 페이지 안에 MutationObserver를 설치하고
+스크롤한 뒤 새 항목이 실제로 추가되거나 유휴 시간이 만료될 때까지 execute_async_script로 기다립니다.
+배치(스크롤 1회)마다 새 항목이 나타나기까지 걸린 시간을 함께 기록합니다.
+"""
+
+import time
+from typing import Callable, Dict, List, Optional
+
+
+# arguments: selector, prevCount, idleTimeoutMs, settleMs, callback
+# 새 항목이 처음 늘어난 뒤 settleMs 동안 추가 변화가 없으면 한 배치로 보고 반환합니다.
+WAIT_FOR_NEW_ITEMS_SCRIPT = r"""
+const [selector, prevCount, idleTimeoutMs, settleMs, done] = arguments;
+const started = performance.now();
+const count = () => document.querySelectorAll(selector).length;
+let firstGrowthAt = null;
+let settleTimer = null;
+let finished = false;
+const finish = (timedOut) => {
+  if (finished) return;
+  finished = true;
+  observer.disconnect();
+  clearTimeout(idleTimer);
+  clearTimeout(settleTimer);
+  done({
+    count: count(),
+    timedOut: timedOut,
+    latencyMs: firstGrowthAt === null ? null : Math.round(firstGrowthAt - started),
+    elapsedMs: Math.round(performance.now() - started),
+  });
+};
+const onChange = () => {
+  if (count() <= prevCount) return;
+  if (firstGrowthAt === null) firstGrowthAt = performance.now();
+  clearTimeout(settleTimer);
+  settleTimer = setTimeout(() => finish(false), settleMs);
+};
+const observer = new MutationObserver(onChange);
+observer.observe(document.documentElement, {childList: true, subtree: true});
+const idleTimer = setTimeout(() => finish(firstGrowthAt === null), idleTimeoutMs);
+window.scrollTo(0, document.documentElement.scrollHeight);
+onChange();
+"""
+
+
+def scroll_and_wait_for_new(driver, item_selector: str, prev_count: int, idle_timeout: float = 3.0,
+                            settle: float = 0.2) -> Dict:
+    """
+    한 번 스크롤하고 item_selector 항목이 prev_count보다 늘어나거나 idle_timeout이 지날 때까지 기다립니다.
+    반환: {'count', 'timedOut', 'latencyMs', 'elapsedMs'}
+    """
+    driver.set_script_timeout(idle_timeout + settle + 5)
+    return driver.execute_async_script(
+        WAIT_FOR_NEW_ITEMS_SCRIPT, item_selector, int(prev_count), int(idle_timeout * 1000), int(settle * 1000)
+    )
+
+
+def count_items(driver, item_selector: str) -> int:
+    return int(driver.execute_script("return document.querySelectorAll(arguments[0]).length;", item_selector))
+
+
+def summarize_latencies(latencies: List[int]) -> str:
+    if not latencies:
+        return "새 배치 없음"
+    ordered = sorted(latencies)
+    p50 = ordered[len(ordered) // 2]
+    avg = sum(ordered) / len(ordered)
+    return f"배치 {len(ordered)}개, 평균 {avg:.0f}ms, 중앙값 {p50}ms, 최대 {ordered[-1]}ms"
+
+
+def observe_scroll_until_no_new(driver, item_selector: str, max_scrolls: int = 80, idle_timeout: float = 3.0,
+                                settle: float = 0.2, stop_when: Optional[Callable[[], bool]] = None) -> Dict:
+    """
+    MutationObserver 기반으로 새 항목이 더 이상 나타나지 않을 때까지 스크롤합니다.
+    유휴 시간 안에 새 항목이 없으면 바닥으로 판단하고 종료합니다.
+    반환: {'count', 'scrolls', 'latencies_ms', 'elapsed'}
+    """
+    started = time.perf_counter()
+    count = count_items(driver, item_selector)
+    latencies: List[int] = []
+    scrolls = 0
+    for i in range(max_scrolls):
+        if stop_when and stop_when():
+            print("중단 조건 충족. 스크롤 종료.")
+            break
+        res = scroll_and_wait_for_new(driver, item_selector, count, idle_timeout=idle_timeout, settle=settle)
+        scrolls += 1
+        new_count = int(res.get("count") or 0)
+        if res.get("timedOut") or new_count <= count:
+            print(f"스크롤 {i+1}회, 항목 수 {new_count} (유휴 {res.get('elapsedMs')}ms 동안 새 항목 없음)")
+            count = max(count, new_count)
+            break
+        latencies.append(int(res.get("latencyMs") or 0))
+        print(f"스크롤 {i+1}회, 항목 수 {new_count} (+{new_count - count}, {res.get('latencyMs')}ms)")
+        count = new_count
+    elapsed = time.perf_counter() - started
+    print(f"스크롤 종료: 항목 {count}개, {elapsed:.1f}초 | {summarize_latencies(latencies)}")
+    return {"count": count, "scrolls": scrolls, "latencies_ms": latencies, "elapsed": elapsed}
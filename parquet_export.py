@@ -0,0 +1,126 @@
+"""
+조회수 이력을 날짜별로 분할된 Parquet 데이터셋으로 내보내는 도우미. (pyarrow 필요, 선택 의존성)
+
+라운드마다 기록 파일을 하나씩 추가합니다: <dataset_dir>/date=YYYY-MM-DD/<platform>-<채널>-<시각>-<uuid>-0.parquet
+(같은 초에 여러 채널/프로세스가 기록해도 파일 이름이 겹치지 않으므로 서로 덮어쓰지 않습니다)
+컬럼 타입: views int64, duration_seconds int32, platform/channel 사전 인코딩, saved_at timestamp
+읽을 때는 read_history가 메모리 맵으로 열고 채널/날짜 조건을 파일 단위로 걸러 필요한 부분만 읽습니다.
+
+실행 예:
+  python parquet_export.py view_history --channel "조선대학교 SW중심사업단" --start 2026-10-01
+"""
+
+import argparse
+import os
+import re
+import uuid
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from parsing import extract_video_id
+
+
+def require_pyarrow():
+    """
+    pyarrow를 필요할 때만 불러옵니다. 반환: (pyarrow, pyarrow.dataset)
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ImportError as e:
+        raise ImportError("Parquet 내보내기에는 pyarrow가 필요합니다: pip install pyarrow") from e
+    return pa, ds
+
+
+def safe_file_part(text: str, limit: int = 40) -> str:
+    """
+    채널 이름을 파일 이름에 쓸 수 있게 바꿉니다. (경로 구분자/공백/특수문자 → '_')
+    """
+    return re.sub(r"[^\w.-]+", "_", text or "", flags=re.UNICODE).strip("._")[:limit] or "channel"
+
+
+def date_partitioning(pa, ds):
+    return ds.partitioning(pa.schema([("date", pa.date32())]), flavor="hive")
+
+
+def table_from_records(pa, platform: str, channel: str, records: List[Dict], saved_at: datetime):
+    n = len(records)
+    return pa.table({
+        "platform": pa.array([platform] * n, type=pa.string()).dictionary_encode(),
+        "channel": pa.array([channel] * n, type=pa.string()).dictionary_encode(),
+        "video_id": pa.array([extract_video_id(r.get("url")) for r in records], type=pa.string()),
+        "index": pa.array([r.get("index") for r in records], type=pa.int32()),
+        "title": pa.array([r.get("title") for r in records], type=pa.string()),
+        "views": pa.array([r.get("views") for r in records], type=pa.int64()),
+        "url": pa.array([r.get("url") for r in records], type=pa.string()),
+        "duration": pa.array([r.get("duration") for r in records], type=pa.string()),
+        "duration_seconds": pa.array([r.get("duration_seconds") for r in records], type=pa.int32()),
+        "saved_at": pa.array([saved_at] * n, type=pa.timestamp("s")),
+        "date": pa.array([saved_at.date()] * n, type=pa.date32()),
+    })
+
+
+def append_round(dataset_dir: str, platform: str, channel: str, records: List[Dict], saved_at: str) -> str:
+    """
+    한 라운드의 레코드를 saved_at 날짜 파티션에 새 Parquet 파일로 추가합니다. (기존 파일은 건드리지 않음)
+    반환: 기록한 파일 이름 패턴
+    """
+    pa, ds = require_pyarrow()
+    ts = datetime.strptime(saved_at, "%Y-%m-%d %H:%M:%S")
+    table = table_from_records(pa, platform, channel, records, ts)
+    stamp = ts.strftime("%Y%m%dT%H%M%S")
+    basename = f"{platform}-{safe_file_part(channel)}-{stamp}-{uuid.uuid4().hex}-{{i}}.parquet"
+    ds.write_dataset(table, dataset_dir, format="parquet", partitioning=date_partitioning(pa, ds),
+                     basename_template=basename, existing_data_behavior="overwrite_or_ignore")
+    return basename.format(i=0)
+
+
+def read_history(dataset_dir: str, platform: Optional[str] = None, channel: Optional[str] = None,
+                 start: Optional[date] = None, end: Optional[date] = None,
+                 columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    데이터셋을 메모리 맵으로 열고 플랫폼/채널/날짜 범위(start~end, 포함) 조건을 걸어 필요한 부분만 읽습니다.
+    """
+    pa, ds = require_pyarrow()
+    from pyarrow import fs
+
+    dataset = ds.dataset(os.path.abspath(dataset_dir), format="parquet", partitioning=date_partitioning(pa, ds),
+                         filesystem=fs.LocalFileSystem(use_mmap=True))
+    conds = []
+    if platform:
+        conds.append(ds.field("platform") == platform)
+    if channel:
+        conds.append(ds.field("channel") == channel)
+    if start:
+        conds.append(ds.field("date") >= pa.scalar(start, type=pa.date32()))
+    if end:
+        conds.append(ds.field("date") <= pa.scalar(end, type=pa.date32()))
+    expr = None
+    for c in conds:
+        expr = c if expr is None else expr & c
+    return dataset.to_table(columns=columns, filter=expr).to_pandas()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parquet 조회수 이력 조회")
+    parser.add_argument("dataset_dir")
+    parser.add_argument("--platform", choices=["youtube", "kakao", "naver"], default=None)
+    parser.add_argument("--channel", default=None)
+    parser.add_argument("--start", type=date.fromisoformat, default=None, help="YYYY-MM-DD")
+    parser.add_argument("--end", type=date.fromisoformat, default=None, help="YYYY-MM-DD")
+    args = parser.parse_args()
+
+    df = read_history(args.dataset_dir, platform=args.platform, channel=args.channel, start=args.start, end=args.end,
+                      columns=["channel", "video_id", "title", "views", "saved_at"])
+    print(f"행 수: {len(df)} | 라운드 수: {df['saved_at'].nunique() if len(df) else 0}")
+    if len(df):
+        growth = (df.sort_values("saved_at").groupby("video_id")
+                  .agg(title=("title", "last"), first=("views", "first"), last=("views", "last")))
+        growth["delta"] = growth["last"] - growth["first"]
+        print(growth.sort_values("delta", ascending=False).head(20).to_string())
+
+
+if __name__ == "__main__":
+    main()
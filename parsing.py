@@ -0,0 +1,210 @@
+"""
+조회수/재생 길이/영상 ID 파싱 공용 모듈.
+
+세 크롤러(youtube/kakao/naver)가 함께 사용하며, 정규식은 모듈 로드 시 한 번만 컴파일합니다.
+- 단건: parse_duration_to_seconds, parse_korean_views, parse_views_generic
+- 일괄: parse_durations_batch, parse_views_batch (pandas 벡터화 문자열 연산, 결과는 Int64 Series)
+일괄 함수의 결과는 같은 입력에 대한 단건 함수의 결과와 항상 같아야 합니다. (tests/test_parsing.py, bench_parsing.py에서 검증)
+"""
+
+import re
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+LIVE_KEYWORDS = ["LIVE", "실시간", "스트리밍", "PREMIERE", "예정"]
+ZERO_KEYWORDS = ["no views", "조회수 없음", "조회수없음"]
+KOREAN_UNITS = {"억": 100_000_000, "만": 10_000, "천": 1_000}
+ENGLISH_UNITS = {"K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
+
+RE_SPACES = re.compile(r"\s+")
+RE_LIVE = re.compile("|".join(re.escape(k) for k in LIVE_KEYWORDS))
+RE_ZERO = re.compile("|".join(re.escape(k) for k in ZERO_KEYWORDS))
+RE_HMS = re.compile(r"^(?:(\d+):)?(\d{1,2}):(\d{2})$")
+RE_VIEW_WORDS = re.compile(r"(조회수|조회|재생수|재생|views|view)", re.IGNORECASE)
+RE_KO_WORDS = re.compile(r"조회수|조회|재생|회")
+RE_KO_NUMBER = re.compile(r"^([0-9]+(?:\.[0-9]+)?)(억|만|천)?$")
+RE_EN_STRIP = re.compile(r"[^0-9kmb\.]")
+RE_EN_NUMBER = re.compile(r"^([0-9]+(?:\.[0-9]+)?)([kmb])?$")
+RE_DIGITS = re.compile(r"([0-9][0-9,]*)")
+# 영상 URL → 플랫폼 내 고유 ID (watch?v=, youtu.be/, /shorts/, /cliplink/<id>, /v/<id>)
+RE_VIDEO_ID = [
+    re.compile(r"[?&]v=([A-Za-z0-9_-]{6,})"),
+    re.compile(r"youtu\.be/([A-Za-z0-9_-]{6,})"),
+    re.compile(r"/shorts/([A-Za-z0-9_-]{6,})"),
+    re.compile(r"/cliplink/(\d+)"),
+    re.compile(r"(?:^|tv\.naver\.com)/v/(\d+)"),
+]
+# 일괄 파싱의 빠른 경로: '조회수 1.2만회', '1,234 views', '2.3M views'처럼 흔한 형태를 한 번에 추출
+RE_VIEWS_FAST = re.compile(
+    r"^\s*(?:조회수|재생수|재생|조회)?\s*([0-9][0-9,]*(?:\.[0-9]+)?)\s*(억|만|천|[KMBkmb])?\s*회?\s*(?:[Vv]iews?)?\s*$"
+)
+
+
+def parse_duration_to_seconds(text: str) -> Optional[int]:
+    """
+    'HH:MM:SS' 또는 'MM:SS'를 초 단위로 변환합니다. LIVE/예정 등 길이 미확정이면 None.
+    """
+    if not text:
+        return None
+    t = RE_SPACES.sub("", text).upper()
+    if RE_LIVE.search(t):
+        return None
+    m = RE_HMS.match(t)
+    if not m:
+        return None
+    h = int(m.group(1) or 0)
+    m_ = int(m.group(2))
+    s = int(m.group(3))
+    return h * 3600 + m_ * 60 + s
+
+
+def parse_korean_views(text: str) -> Optional[int]:
+    """
+    다양한 조회수 표기 문자열을 정수로 변환합니다.
+    예: '조회수 1,234회', '조회수 2.3만회', '1.2천회', '1,234 views', '1.2K views', '2.3M views', 'No views'
+    변환 실패 시 None 반환.
+    """
+    if not text:
+        return None
+    raw = text.strip()
+    lower = raw.lower()
+
+    # 명시적인 0 처리
+    if RE_ZERO.search(lower):
+        return 0
+
+    # 한국어 단위: 억, 만, 천
+    t = RE_SPACES.sub("", RE_KO_WORDS.sub("", raw))
+    m = RE_KO_NUMBER.match(t)
+    if m:
+        return int(round(float(m.group(1)) * KOREAN_UNITS.get(m.group(2), 1)))
+
+    # 영어 단위: K, M, B
+    m_en = RE_EN_NUMBER.match(RE_EN_STRIP.sub("", lower))
+    if m_en:
+        return int(round(float(m_en.group(1)) * ENGLISH_UNITS.get((m_en.group(2) or "").upper(), 1)))
+
+    # 숫자만 추출 (쉼표 포함)
+    m2 = RE_DIGITS.search(raw)
+    if m2:
+        return int(m2.group(1).replace(",", ""))
+    return None
+
+
+def parse_views_generic(text: str) -> Optional[int]:
+    """
+    '조회수/재생/views' 같은 접두·접미어가 섞인 조회수 문자열을 정수로 변환합니다.
+    """
+    if not text:
+        return None
+    t = text.strip()
+    if RE_ZERO.search(t.lower()):
+        return 0
+    t_clean = RE_VIEW_WORDS.sub("", t).replace("회", "").strip()
+    v = parse_korean_views(t_clean)
+    if v is not None:
+        return v
+    m = RE_DIGITS.search(t)
+    if m:
+        return int(m.group(1).replace(",", ""))
+    return None
+
+
+def extract_video_id(url: Optional[str]) -> Optional[str]:
+    """
+    영상 URL에서 플랫폼 내 고유 ID를 추출합니다. 인식할 수 없는 URL이면 None.
+    """
+    if not url:
+        return None
+    for pattern in RE_VIDEO_ID:
+        m = pattern.search(url)
+        if m:
+            return m.group(1)
+    return None
+
+
+def _as_string_series(values: Iterable) -> pd.Series:
+    s = values if isinstance(values, pd.Series) else pd.Series(list(values), dtype="object")
+    s = s.astype("string")
+    # 빈 문자열은 단건 함수와 동일하게 '값 없음'으로 취급
+    return s.mask(s == "")
+
+
+def _on_uniques(values: Iterable, parse) -> pd.Series:
+    """
+    중복 문자열은 한 번만 파싱하도록 고유값에 parse를 적용한 뒤 원래 순서로 펼칩니다.
+    """
+    s = _as_string_series(values)
+    codes, uniques = pd.factorize(s, use_na_sentinel=True)
+    parsed = parse(pd.Series(uniques, dtype="string")).to_numpy(dtype="float64", na_value=np.nan)
+    out = np.full(len(codes), np.nan)
+    hit = codes >= 0
+    out[hit] = parsed[codes[hit]]
+    return pd.Series(out, index=s.index).astype("Int64")
+
+
+def _digits_to_float(s: pd.Series) -> pd.Series:
+    return pd.to_numeric(s.str.extract(RE_DIGITS, expand=False).str.replace(",", "", regex=False), errors="coerce")
+
+
+def _scaled(number: pd.Series, unit: pd.Series, units: dict) -> pd.Series:
+    factor = unit.map(units).astype("float64").fillna(1.0)
+    return np.round(pd.to_numeric(number, errors="coerce") * factor)
+
+
+def _parse_durations(t: pd.Series) -> pd.Series:
+    t = t.str.replace(RE_SPACES, "", regex=True).str.upper()
+    parts = t.str.extract(RE_HMS)
+    hours = pd.to_numeric(parts[0], errors="coerce").fillna(0)
+    seconds = hours * 3600 + pd.to_numeric(parts[1], errors="coerce") * 60 + pd.to_numeric(parts[2], errors="coerce")
+    return seconds.mask(t.str.contains(RE_LIVE, regex=True).fillna(False).astype(bool))
+
+
+def _parse_views(t: pd.Series) -> pd.Series:
+    t = t.str.strip()
+
+    # 빠른 경로: 접두/접미어와 단위 하나만 있는 흔한 형태
+    # (쉼표가 있는 숫자 뒤의 억/만/천은 단건 파서에서 단위가 무시되므로 느린 경로로 보냅니다)
+    fast = t.str.extract(RE_VIEWS_FAST)
+    number = fast[0].str.replace(",", "", regex=False)
+    unit = fast[1].str.upper()
+    korean_after_comma = fast[0].str.contains(",", regex=False).fillna(False).astype(bool) & unit.isin(list(KOREAN_UNITS))
+    result = _scaled(number, unit, {**KOREAN_UNITS, **ENGLISH_UNITS}).mask(korean_after_comma)
+
+    todo = result.isna() & t.notna()
+    if not todo.any():
+        return result
+
+    # 느린 경로: parse_views_generic과 같은 단계를 남은 항목에만 적용
+    rest = t[todo]
+    clean = rest.str.replace(RE_VIEW_WORDS, "", regex=True).str.replace("회", "", regex=False).str.strip()
+    clean = clean.mask(clean == "")
+    ko = clean.str.replace(RE_KO_WORDS, "", regex=True).str.replace(RE_SPACES, "", regex=True).str.extract(RE_KO_NUMBER)
+    slow = _scaled(ko[0], ko[1], KOREAN_UNITS)
+    en = clean.str.lower().str.replace(RE_EN_STRIP, "", regex=True).str.extract(RE_EN_NUMBER)
+    slow = slow.fillna(_scaled(en[0], en[1].str.upper(), ENGLISH_UNITS))
+    slow = slow.fillna(_digits_to_float(clean))
+    slow = slow.fillna(_digits_to_float(rest))
+
+    # 명시적인 0 처리 ('No views', '조회수 없음')
+    zero = rest.str.lower().str.contains(RE_ZERO, regex=True) | clean.str.lower().str.contains(RE_ZERO, regex=True)
+    slow = slow.mask(zero.fillna(False).astype(bool), 0.0)
+    return result.fillna(slow)
+
+
+def parse_durations_batch(values: Iterable) -> pd.Series:
+    """
+    재생 길이 문자열 목록/Series를 한 번에 초 단위로 변환합니다. (parse_duration_to_seconds의 일괄 버전)
+    """
+    return _on_uniques(values, _parse_durations)
+
+
+def parse_views_batch(values: Iterable) -> pd.Series:
+    """
+    조회수 문자열 목록/Series를 한 번에 정수로 변환합니다. (parse_views_generic의 일괄 버전)
+    억/만/천, K/M/B, '조회수 …회', '… views', 'No views'를 모두 처리하며 실패한 항목은 <NA>입니다.
+    """
+    return _on_uniques(values, _parse_views)
@@ -0,0 +1,23 @@
+"""
+플랫폼 이름("youtube"/"kakao"/"naver")으로 각 스크립트의 collect_* 함수를 호출하는 공통 진입점.
+"""
+
+from typing import Dict, List, Optional, Set
+
+from kakao_auto_crawl import collect_kakaotv_videos
+from naver_auto_crawl import collect_navertv_videos
+from youtube_auto_crawl import collect_channel_videos
+
+
+PLATFORMS = ("youtube", "kakao", "naver")
+
+
+def collect_videos(driver, platform: str, channel_name: str, channel_url: Optional[str] = None,
+                   known_ids: Optional[Set[str]] = None) -> List[Dict]:
+    if platform == "youtube":
+        return collect_channel_videos(driver, channel_name, known_ids=known_ids, channel_url=channel_url)
+    if platform == "kakao":
+        return collect_kakaotv_videos(driver, channel_name, channel_url=channel_url, known_ids=known_ids)
+    if platform == "naver":
+        return collect_navertv_videos(driver, channel_name, channel_url=channel_url, known_ids=known_ids)
+    raise ValueError(f"지원하지 않는 플랫폼: {platform} (가능: {', '.join(PLATFORMS)})")
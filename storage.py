@@ -0,0 +1,164 @@
+"""
+SQLite 기반 수집 결과 저장소 (append-only 조회수 이력).
+
+- videos:    (platform, video_id)별 최신 메타데이터(제목/URL/길이/목록 순서)와 처음/마지막 확인 시각
+- snapshots: (platform, video_id, saved_at)별 조회수 — 라운드마다 추가되므로 조회수 이력이 남습니다.
+
+라운드 결과는 한 트랜잭션 안에서 executemany로 일괄 기록하며, WAL 모드라 기록 중에도 읽기가 막히지 않습니다.
+CSV는 필요할 때 export_csv로 내보냅니다.
+
+실행 예:
+  python storage.py crawl.db --platform youtube --channel "조선대학교 SW중심사업단" --export out.csv
+  python storage.py crawl.db --platform youtube --history VIDEO_ID
+"""
+
+import argparse
+import sqlite3
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from parsing import extract_video_id
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    platform         TEXT NOT NULL,
+    video_id         TEXT NOT NULL,
+    channel          TEXT NOT NULL,
+    title            TEXT,
+    url              TEXT,
+    duration         TEXT,
+    duration_seconds INTEGER,
+    position         INTEGER,
+    first_seen       TEXT NOT NULL,
+    last_seen        TEXT NOT NULL,
+    PRIMARY KEY (platform, video_id)
+);
+CREATE INDEX IF NOT EXISTS idx_videos_channel ON videos (platform, channel, last_seen);
+
+CREATE TABLE IF NOT EXISTS snapshots (
+    platform TEXT NOT NULL,
+    video_id TEXT NOT NULL,
+    saved_at TEXT NOT NULL,
+    views    INTEGER,
+    PRIMARY KEY (platform, video_id, saved_at)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_snapshots_saved_at ON snapshots (saved_at);
+"""
+
+# 채널의 마지막 라운드에서 확인된 영상 + 영상별 최신 조회수 (snapshots 기본 키 인덱스로 역순 1건 조회)
+LATEST_CATALOG_SQL = """
+SELECT v.position, v.title, v.url, v.duration, v.duration_seconds, v.last_seen,
+       (SELECT s.views FROM snapshots s
+         WHERE s.platform = v.platform AND s.video_id = v.video_id
+         ORDER BY s.saved_at DESC LIMIT 1) AS views
+  FROM videos v
+ WHERE v.platform = ? AND v.channel = ?
+   AND v.last_seen = (SELECT MAX(last_seen) FROM videos WHERE platform = ? AND channel = ?)
+ ORDER BY v.position
+"""
+
+UPSERT_VIDEO_SQL = """
+INSERT INTO videos (platform, video_id, channel, title, url, duration, duration_seconds, position, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (platform, video_id) DO UPDATE SET
+    channel = excluded.channel, title = excluded.title, url = excluded.url, duration = excluded.duration,
+    duration_seconds = excluded.duration_seconds, position = excluded.position, last_seen = excluded.last_seen
+"""
+
+
+def open_store(path: str = "crawl.db") -> sqlite3.Connection:
+    """
+    저장소를 열고(없으면 생성) WAL 모드와 스키마를 준비합니다.
+    """
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def video_key(record: Dict) -> Optional[str]:
+    url = record.get("url")
+    return extract_video_id(url) or url
+
+
+def save_round(conn: sqlite3.Connection, platform: str, channel: str, records: List[Dict], saved_at: str) -> int:
+    """
+    한 라운드의 수집 결과를 한 트랜잭션으로 기록합니다. (영상 메타데이터 upsert + 조회수 스냅샷 추가)
+    반환: 기록한 영상 수
+    """
+    videos = []
+    snapshots = []
+    for pos, r in enumerate(records, 1):
+        key = video_key(r)
+        if not key:
+            continue
+        videos.append((platform, key, channel, r.get("title"), r.get("url"), r.get("duration"),
+                       r.get("duration_seconds"), r.get("index") or pos, saved_at, saved_at))
+        snapshots.append((platform, key, saved_at, r.get("views")))
+    with conn:
+        conn.executemany(UPSERT_VIDEO_SQL, videos)
+        conn.executemany("INSERT OR REPLACE INTO snapshots (platform, video_id, saved_at, views) VALUES (?, ?, ?, ?)",
+                         snapshots)
+    return len(videos)
+
+
+def latest_catalog(conn: sqlite3.Connection, platform: str, channel: str) -> List[Dict]:
+    """
+    채널의 마지막 라운드 목록을 수집 레코드 형식으로 반환합니다. (CSV를 읽던 자리에 사용)
+    """
+    rows = conn.execute(LATEST_CATALOG_SQL, (platform, channel, platform, channel)).fetchall()
+    return [
+        {"index": i, "title": title, "views": views, "url": url, "duration": duration,
+         "duration_seconds": dsec, "saved_at": last_seen}
+        for i, (_, title, url, duration, dsec, last_seen, views) in enumerate(rows, 1)
+    ]
+
+
+def view_history(conn: sqlite3.Connection, platform: str, video_id: str) -> List[Dict]:
+    rows = conn.execute(
+        "SELECT saved_at, views FROM snapshots WHERE platform = ? AND video_id = ? ORDER BY saved_at",
+        (platform, video_id),
+    ).fetchall()
+    return [{"saved_at": saved_at, "views": views} for saved_at, views in rows]
+
+
+def export_csv(conn: sqlite3.Connection, platform: str, channel: str, csv_path: str) -> int:
+    """
+    채널의 최신 목록을 기존 CSV와 같은 컬럼으로 내보냅니다.
+    """
+    df = pd.DataFrame(latest_catalog(conn, platform, channel),
+                      columns=["index", "title", "views", "url", "duration", "duration_seconds", "saved_at"])
+    for col in ("views", "duration_seconds"):
+        df[col] = df[col].astype("Int64")
+    df.to_csv(csv_path, index=False, encoding="utf-8-sig")
+    return len(df)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수집 결과 저장소(SQLite) 조회/내보내기")
+    parser.add_argument("db", help="저장소 파일 경로 (예: crawl.db)")
+    parser.add_argument("--platform", choices=["youtube", "kakao", "naver"], required=True)
+    parser.add_argument("--channel", default=None)
+    parser.add_argument("--export", default=None, help="채널 최신 목록을 내보낼 CSV 경로")
+    parser.add_argument("--history", default=None, help="조회수 이력을 볼 영상 ID")
+    args = parser.parse_args()
+
+    conn = open_store(args.db)
+    try:
+        if args.export:
+            if not args.channel:
+                parser.error("--export에는 --channel이 필요합니다.")
+            n = export_csv(conn, args.platform, args.channel, args.export)
+            print(f"CSV 내보내기 완료: {args.export} | {n}개")
+        if args.history:
+            for row in view_history(conn, args.platform, args.history):
+                print(f"{row['saved_at']}  {row['views']}")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
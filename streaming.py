@@ -0,0 +1,124 @@
+"""
+스크롤/더보기 단계마다 새로 로드된 카드만 추출해 배치로 내보내는 스트리밍 수집 도우미.
+
+기존 수집기는 목록 끝까지 모두 로드한 뒤 전체 카드를 한 번에 추출하므로, 수집이 끝나기 전에는 레코드가
+하나도 없습니다. stream_new_items()는 단계마다 이전에 추출한 위치(start) 이후의 카드만 페이지 내 스크립트로
+읽어 새 배치를 yield하므로, 첫 배치는 첫 화면 로드 직후에 나옵니다.
+
+- 배치의 index는 채널 전체 기준 1..N으로 이어지고, 같은 영상(ID 기준)은 한 번만 내보냅니다.
+- drain(batches, sinks)는 배치를 받는 즉시 각 sink(부분 CSV, SQLite 저장소)에 쓰고 전체 레코드를 반환합니다.
+- 부분 CSV(<csv>.partial.csv)는 배치마다 덧붙여 flush하므로 수집이 중단되어도 그때까지의 결과가 남습니다.
+  라운드가 정상 종료되어 본 CSV를 쓰면 clear_partial_csv()로 지웁니다.
+"""
+
+import csv
+import os
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from csv_output import CSV_COLUMNS
+from page_loader import count_items, scroll_and_wait_for_new
+from parsing import extract_video_id
+from storage import save_round
+
+
+def stream_new_items(driver, item_selector: str, extract: Callable[[int], List[Dict]],
+                     advance: Callable[[int], bool], max_steps: int = 100,
+                     stop_when: Optional[Callable[[], bool]] = None,
+                     count: Optional[Callable[[], int]] = None) -> Iterator[List[Dict]]:
+    """
+    extract(start)로 start번째 이후 카드의 레코드를 읽어 새 배치를 yield하고, advance(현재 항목 수)로
+    다음 단계(스크롤/더보기)를 실행합니다. advance가 False를 반환하거나(더 이상 증가 없음) max_steps에 도달하거나
+    stop_when()이 True이면 종료합니다.
+    count()를 주면 항목 수를 그것으로 셉니다. (처리한 카드를 DOM에서 지우는 경우 지운 수를 포함한 누적 수)
+    """
+    seen = set()
+    start = 0
+    total = 0
+    steps = 0
+    while True:
+        total_items = count() if count else count_items(driver, item_selector)
+        batch: List[Dict] = []
+        if total_items > start:
+            for r in extract(start):
+                key = extract_video_id(r.get("url")) or r.get("url")
+                if key and key in seen:
+                    continue
+                seen.add(key)
+                total += 1
+                batch.append(dict(r, index=total))
+            start = total_items
+        if batch:
+            print(f"새 배치 {len(batch)}개 (누적 {total}개, 단계 {steps}회)")
+            yield batch
+        if steps >= max_steps or (stop_when and stop_when()):
+            break
+        if not advance(total_items):
+            break
+        steps += 1
+    print(f"스트리밍 수집 종료: 총 {total}개, 단계 {steps}회")
+
+
+def scroll_step(driver, item_selector: str, idle_timeout: float = 3.0, settle: float = 0.2) -> Callable[[int], bool]:
+    """
+    한 번 스크롤하고 항목이 늘어날 때까지만 기다리는 advance 함수를 만듭니다. (idle_timeout 동안 증가 없으면 False)
+    """
+    def advance(count: int) -> bool:
+        res = scroll_and_wait_for_new(driver, item_selector, count, idle_timeout=idle_timeout, settle=settle) or {}
+        return not res.get("timedOut") and int(res.get("count") or 0) > count
+
+    return advance
+
+
+def partial_csv_path(csv_path: str) -> str:
+    root, ext = os.path.splitext(csv_path)
+    return f"{root}.partial{ext or '.csv'}"
+
+
+def clear_partial_csv(csv_path: str):
+    path = partial_csv_path(csv_path)
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def make_partial_csv_sink(csv_path: str, saved_at: str) -> Callable[[List[Dict]], None]:
+    """
+    배치를 <csv>.partial.csv에 덧붙이는 sink를 만듭니다. 첫 배치에서 파일을 새로 만들고 헤더를 씁니다.
+    """
+    path = partial_csv_path(csv_path)
+    state = {"started": False}
+
+    def write(batch: List[Dict]):
+        mode = "a" if state["started"] else "w"
+        with open(path, mode, encoding="utf-8-sig" if mode == "w" else "utf-8", newline="") as f:
+            w = csv.writer(f)
+            if not state["started"]:
+                w.writerow(CSV_COLUMNS + ["saved_at"])
+                state["started"] = True
+            for r in batch:
+                w.writerow([r.get(c) if r.get(c) is not None else "" for c in CSV_COLUMNS] + [saved_at])
+            f.flush()
+
+    return write
+
+
+def make_store_sink(conn, platform: str, channel: str, saved_at: str) -> Callable[[List[Dict]], None]:
+    """
+    배치를 SQLite 저장소에 바로 기록하는 sink를 만듭니다. 라운드의 최종 save_round도 같은 saved_at을 쓰면
+    스냅샷이 중복되지 않습니다.
+    """
+    def write(batch: List[Dict]):
+        save_round(conn, platform, channel, batch, saved_at)
+
+    return write
+
+
+def drain(batches: Iterable[List[Dict]], sinks: List[Callable[[List[Dict]], None]]) -> List[Dict]:
+    """
+    배치를 받는 즉시 모든 sink에 쓰고, 전체 레코드를 반환합니다.
+    """
+    records: List[Dict] = []
+    for batch in batches:
+        for sink in sinks:
+            sink(batch)
+        records.extend(batch)
+    return records
@@ -0,0 +1,86 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+import browser_pool
+from browser_pool import BrowserPool, process_running
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="/proc와 SingletonLock 심볼릭 링크 필요")
+
+# 이름이 chrome인 스크립트는 /proc/<pid>/comm이 chrome이 되어 profile_lock_holder가 Chrome으로 봅니다.
+SLOW_EXIT = '#!/bin/sh\ntrap "sleep 0.5; exit 0" TERM\nwhile :; do sleep 0.05; done\n'
+IGNORE_TERM = '#!/bin/sh\ntrap "" TERM\nwhile :; do sleep 0.05; done\n'
+
+
+class FakeChrome:
+    """
+    uc.Chrome처럼 quit()이 SIGTERM만 보내고 바로 반환하는 가짜 브라우저. 실행 중에는 프로필에 SingletonLock을 잡습니다.
+    """
+
+    def __init__(self, script: str, user_data_dir: str):
+        self.process = subprocess.Popen([script])
+        self.browser_pid = self.process.pid
+        lock = os.path.join(user_data_dir, "SingletonLock")
+        if os.path.lexists(lock):
+            os.remove(lock)
+        os.symlink(f"{socket.gethostname()}-{self.browser_pid}", lock)
+        time.sleep(0.2)  # trap 설치 대기
+
+    def execute_script(self, script):
+        return 1
+
+    def quit(self):
+        os.kill(self.browser_pid, signal.SIGTERM)
+
+
+def make_pool(tmp_path, body: str):
+    script = tmp_path / "bin" / "chrome"
+    script.parent.mkdir()
+    script.write_text(body)
+    script.chmod(0o755)
+    launched = []
+
+    def factory(headless=False, performance_log=False, user_data_dir=None):
+        launched.append(FakeChrome(str(script), user_data_dir))
+        return launched[-1]
+
+    pool = BrowserPool(size=1, profile_root=str(tmp_path / "profiles"), name="test", factory=factory)
+    return pool, launched
+
+
+def stop_all(launched):
+    for d in launched:
+        if d.process.poll() is None:
+            d.process.kill()
+        d.process.wait()
+
+
+def test_recycle_waits_for_old_browser_with_persistent_profile(tmp_path):
+    pool, launched = make_pool(tmp_path, SLOW_EXIT)
+    try:
+        pool.start()
+        pool.recycle("메모리 정리")
+        assert len(launched) == 2
+        assert not process_running(launched[0].browser_pid)
+        assert pool.slots[0]["driver"] is launched[1]
+        assert pool.slots[0]["replaced"] == 1
+    finally:
+        stop_all(launched)
+
+
+def test_replace_kills_browser_that_ignores_sigterm(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(browser_pool, "BROWSER_EXIT_TIMEOUT", 0.5)
+    pool, launched = make_pool(tmp_path, IGNORE_TERM)
+    try:
+        pool.start()
+        pool.recycle("메모리 정리")
+        assert len(launched) == 2
+        assert not process_running(launched[0].browser_pid)
+        assert "강제 종료" in capsys.readouterr().out
+    finally:
+        stop_all(launched)
@@ -0,0 +1,98 @@
+import pytest
+
+from change_probe import collect_with_probe, load_probes, probe_key, remember_fingerprint
+
+
+def rec(i, views=100):
+    return {"index": i, "title": f"영상 {i}", "views": views, "url": f"https://tv.kakao.com/v/{1000 + i}"}
+
+
+CATALOG = [rec(i) for i in range(1, 31)]
+
+
+class Calls:
+    def __init__(self, first=None, error=None):
+        self.first = CATALOG[:10] if first is None else first
+        self.error = error
+        self.probes = self.collects = 0
+
+    def probe(self):
+        self.probes += 1
+        if self.error:
+            raise self.error
+        return self.first
+
+    def collect(self):
+        self.collects += 1
+        return CATALOG
+
+
+@pytest.fixture
+def path(tmp_path):
+    p = str(tmp_path / "probe.json")
+    remember_fingerprint(p, "kakao", "채널", CATALOG, size=10)
+    return p
+
+
+def run(path, calls, cached=CATALOG, max_skips=6):
+    return collect_with_probe(path, "kakao", "채널", cached, calls.probe, calls.collect, size=10, max_skips=max_skips)
+
+
+def skips(path):
+    return load_probes(path)[probe_key("kakao", "채널")]["skips"]
+
+
+def test_unchanged_first_page_skips_the_crawl(path):
+    calls = Calls()
+    records, skipped = run(path, calls)
+    assert skipped and records is CATALOG
+    assert (calls.probes, calls.collects) == (1, 0)
+    assert skips(path) == 1
+
+
+def test_changed_views_on_first_page_trigger_crawl(path):
+    calls = Calls(first=[rec(1, views=101)] + CATALOG[1:10])
+    records, skipped = run(path, calls)
+    assert not skipped and records == CATALOG
+    assert calls.collects == 1
+    assert skips(path) == 0
+
+
+def test_max_skips_forces_a_full_crawl(path):
+    calls = Calls()
+    for _ in range(3):
+        assert run(path, calls, max_skips=3)[1]
+    assert skips(path) == 3
+    records, skipped = run(path, calls, max_skips=3)
+    assert not skipped
+    assert (calls.probes, calls.collects) == (3, 1)
+    assert skips(path) == 0
+
+
+def test_probe_error_falls_back_to_crawl(path):
+    calls = Calls(error=RuntimeError("페이지 로드 실패"))
+    records, skipped = run(path, calls)
+    assert not skipped and records == CATALOG
+    assert (calls.probes, calls.collects) == (1, 1)
+
+
+def test_short_first_page_falls_back_to_crawl(path):
+    # 앞부분 지문이 같아도 첫 화면이 size개보다 적게 로드되면 판단하지 않음
+    calls = Calls(first=CATALOG[:4])
+    assert not run(path, calls)[1]
+    assert calls.collects == 1
+
+
+def test_short_channel_can_still_skip(tmp_path):
+    p = str(tmp_path / "probe.json")
+    short = CATALOG[:4]
+    remember_fingerprint(p, "kakao", "채널", short, size=10)
+    calls = Calls(first=short)
+    assert run(p, calls, cached=short)[1]
+
+
+def test_no_cache_or_no_path_always_crawls(path):
+    calls = Calls()
+    assert not run(path, calls, cached=[])[1]
+    assert not run(None, calls)[1]
+    assert (calls.probes, calls.collects) == (0, 2)
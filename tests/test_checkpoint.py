@@ -0,0 +1,131 @@
+import json
+import os
+import time
+
+from checkpoint import (checkpoint_path, clear_checkpoint, extend_records, fast_forward, load_checkpoint,
+                        make_checkpointer, merge_resumed, save_checkpoint)
+
+
+def rec(i, title=None):
+    return {"index": i, "title": title or f"영상 {i}", "url": f"https://www.youtube.com/watch?v=vid{i:08d}"}
+
+
+def ids(records):
+    return [r["url"][-3:] for r in records]
+
+
+class ListingDriver:
+    """
+    항목 수만 흉내 내는 목록 페이지: 스크롤 한 번에 batch개씩, 최대 total개까지 늘어납니다.
+    """
+
+    def __init__(self, count, total, batch=30):
+        self.count, self.total, self.batch = count, total, batch
+        self.scrolls = 0
+
+    def execute_script(self, script, selector):
+        return self.count
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def execute_async_script(self, script, selector, prev_count, idle_ms, settle_ms):
+        self.scrolls += 1
+        grown = min(self.total, self.count + self.batch)
+        timed_out = grown == self.count
+        self.count = grown
+        return {"count": grown, "timedOut": timed_out}
+
+
+def test_extend_records_appends_unseen_and_reindexes():
+    head = [rec(3), rec(1)]
+    tail = [rec(1, title="중복"), rec(2), rec(2)]
+    out = extend_records(head, tail)
+    assert ids(out) == ["003", "001", "002"]
+    assert [r["index"] for r in out] == [1, 2, 3]
+    assert out[1]["title"] == "영상 1"
+    assert head[0]["index"] == 3  # 입력은 바꾸지 않음
+
+
+def test_merge_resumed_keeps_records_only_in_checkpoint():
+    assert merge_resumed([rec(1)], None) == [rec(1)]
+    merged = merge_resumed([rec(1), rec(2)], {"records": [rec(1), rec(2), rec(3), rec(4)]})
+    assert ids(merged) == ["001", "002", "003", "004"]
+
+
+def test_checkpointer_throttles_and_merges_previous_records(tmp_path):
+    path = str(tmp_path / "ckpt" / "youtube-ch.json")
+    save_checkpoint(path, {"records": [rec(1), rec(2), rec(3)], "items": 3})
+    progress = {"records": [rec(1)], "items": 1}
+    save = make_checkpointer(path, lambda: dict(progress), every=3600)
+
+    assert not save()  # every초가 지나지 않음
+    progress.update(records=[rec(1), rec(4)], items=2)
+    assert save(force=True)
+    state = load_checkpoint(path)
+    # 이번 시도가 덜 진행되었어도 이전 체크포인트의 레코드를 잃지 않음
+    assert ids(state["records"]) == ["001", "004", "002", "003"]
+    assert state["items"] == 2
+
+
+def test_checkpointer_survives_snapshot_errors(tmp_path):
+    path = str(tmp_path / "c.json")
+
+    def broken():
+        raise RuntimeError("페이지 닫힘")
+
+    assert not make_checkpointer(path, broken, every=0)(force=True)
+    assert not os.path.exists(path)
+
+
+def test_load_checkpoint_ignores_old_or_broken_files(tmp_path):
+    path = str(tmp_path / "c.json")
+    assert load_checkpoint(None) is None
+    assert load_checkpoint(path) is None
+    save_checkpoint(path, {"records": [], "items": 5})
+    assert load_checkpoint(path)["items"] == 5
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"items": 5, "saved_at": time.time() - 100}, f)
+    assert load_checkpoint(path, max_age=10) is None
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{")
+    assert load_checkpoint(path) is None
+    clear_checkpoint(path)
+    clear_checkpoint(path)
+    assert not os.path.exists(path)
+
+
+def test_checkpoint_path_is_safe_for_channel_names(tmp_path):
+    path = checkpoint_path(str(tmp_path), "naver", "채널 / 이름?")
+    assert os.path.dirname(path) == str(tmp_path)
+    assert os.path.basename(path) == "naver-채널_이름.json"
+
+
+def test_fast_forward_scrolls_to_checkpoint_items():
+    driver = ListingDriver(count=30, total=1000)
+    assert fast_forward(driver, "a", {"items": 150}) == 150
+    assert driver.scrolls == 4
+
+
+def test_fast_forward_clicks_then_scrolls_when_button_disappears():
+    driver = ListingDriver(count=20, total=1000)
+    clicks = []
+
+    def click(count):
+        clicks.append(count)
+        if len(clicks) > 2:
+            return None  # 더보기 버튼 없음 → 이후 스크롤
+        driver.count = count + 20
+        return driver.count
+
+    assert fast_forward(driver, "a", {"items": 100}, click=click) == 120
+    assert clicks == [20, 40, 60]
+    assert driver.scrolls == 2
+
+
+def test_fast_forward_stops_at_the_end_of_the_list_or_when_already_there():
+    driver = ListingDriver(count=30, total=70)
+    assert fast_forward(driver, "a", {"items": 500}) == 70
+    assert driver.scrolls == 3  # 30→60→70→(늘지 않음) 중단
+    assert fast_forward(ListingDriver(count=80, total=80), "a", {"items": 50}) == 80
+    assert fast_forward(ListingDriver(count=10, total=80), "a", None) == 10
@@ -0,0 +1,67 @@
+import os
+
+import pandas as pd
+import pytest
+
+from csv_output import atomic_write_text, read_manifest, write_csv_if_changed
+
+
+def rec(i, views=100):
+    return {"index": i, "title": f"영상 {i}", "views": views, "url": f"https://tv.naver.com/v/{i}",
+            "duration": "1:00", "duration_seconds": 60}
+
+
+def leftovers(folder):
+    return [name for name in os.listdir(folder) if name.startswith(".tmp-")]
+
+
+def test_unchanged_catalog_only_updates_manifest(tmp_path):
+    path = str(tmp_path / "catalog.csv")
+    records = [rec(1), rec(2)]
+    assert write_csv_if_changed(records, path, "2026-01-01 00:00:00")
+    before = (os.stat(path).st_ino, open(path, "rb").read())
+
+    assert not write_csv_if_changed([dict(r) for r in records], path, "2026-01-02 00:00:00")
+    assert (os.stat(path).st_ino, open(path, "rb").read()) == before
+    manifest = read_manifest(path)
+    assert manifest["saved_at"] == "2026-01-02 00:00:00"
+    assert manifest["written_at"] == "2026-01-01 00:00:00"
+    assert manifest["rows"] == 2
+    assert set(pd.read_csv(path)["saved_at"]) == {"2026-01-01 00:00:00"}
+
+
+def test_changed_catalog_replaces_the_csv(tmp_path):
+    path = str(tmp_path / "catalog.csv")
+    write_csv_if_changed([rec(1), rec(2)], path, "2026-01-01 00:00:00")
+    old_inode = os.stat(path).st_ino
+
+    assert write_csv_if_changed([rec(1, views=150), rec(2), rec(3)], path, "2026-01-02 00:00:00")
+    assert os.stat(path).st_ino != old_inode  # 임시 파일을 os.replace로 교체
+    df = pd.read_csv(path)
+    assert df["views"].tolist() == [150, 100, 100]
+    assert set(df["saved_at"]) == {"2026-01-02 00:00:00"}
+    manifest = read_manifest(path)
+    assert (manifest["rows"], manifest["written_at"]) == (3, "2026-01-02 00:00:00")
+    assert leftovers(tmp_path) == []
+
+
+def test_missing_csv_is_rewritten_even_with_same_hash(tmp_path):
+    path = str(tmp_path / "catalog.csv")
+    write_csv_if_changed([rec(1)], path, "2026-01-01 00:00:00")
+    os.remove(path)
+    assert write_csv_if_changed([rec(1)], path, "2026-01-02 00:00:00")
+    assert os.path.exists(path)
+
+
+def test_failed_write_keeps_the_previous_file(tmp_path):
+    path = str(tmp_path / "catalog.csv")
+    atomic_write_text(path, lambda f: f.write("old\n"))
+
+    def broken(f):
+        f.write("new, half written")
+        raise RuntimeError("중단")
+
+    with pytest.raises(RuntimeError):
+        atomic_write_text(path, broken)
+    assert open(path, encoding="utf-8").read() == "old\n"
+    assert leftovers(tmp_path) == []
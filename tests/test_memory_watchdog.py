@@ -0,0 +1,66 @@
+from browser_pool import BrowserPool
+from memory_watchdog import maintain
+
+
+class FakeDriver:
+    current_url = "https://tv.kakao.com/channel/1/video"
+
+    def __init__(self):
+        self.visited = []
+
+    def execute_script(self, script):
+        return 1
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def quit(self):
+        pass
+
+
+class FakeWatchdog:
+    rss_limit_mb = 100.0
+    heap_limit_mb = 100.0
+
+    def __init__(self, action):
+        self.action = action
+
+    def check(self, driver):
+        return self.action
+
+    def attach(self, driver):
+        pass
+
+    def sample(self, driver=None, event="interval", note=""):
+        return {}
+
+
+def flaky_factory(fail_on):
+    launches = []
+
+    def factory(**kwargs):
+        launches.append(kwargs)
+        if len(launches) in fail_on:
+            raise RuntimeError("프로필 폴더를 다른 Chrome이 사용 중입니다")
+        return FakeDriver()
+
+    return factory, launches
+
+
+def test_browser_recycle_failure_does_not_stop_the_loop():
+    factory, launches = flaky_factory(fail_on={2})
+    pool = BrowserPool(size=1, factory=factory).start()
+    assert maintain(pool, FakeWatchdog("browser")) is None
+    assert pool.slots[0]["driver"] is None
+
+    # 다음 라운드의 acquire()가 브라우저를 다시 띄움
+    assert pool.run(lambda driver: driver.execute_script("return 1")) == 1
+    assert len(launches) == 3
+
+
+def test_browser_recycle_restores_position():
+    factory, launches = flaky_factory(fail_on=set())
+    pool = BrowserPool(size=1, factory=factory).start()
+    assert maintain(pool, FakeWatchdog("browser")) == "browser"
+    assert pool.slots[0]["driver"].visited == [FakeDriver.current_url]
+    assert len(launches) == 2
@@ -0,0 +1,50 @@
+from naver_auto_crawl import NAVER_ANCHOR_PAIRS_SCRIPT, records_from_anchors_and_state, state_records_by_id
+
+
+class FakeAnchor:
+    def __init__(self, href, title=""):
+        self.href = href
+        self.text = title
+
+    def get_attribute(self, name):
+        return {"href": self.href, "title": self.text}.get(name)
+
+    def find_element(self, by, value):
+        raise LookupError(value)
+
+    def find_elements(self, by, value):
+        return []
+
+
+class FakeDriver:
+    def __init__(self, anchors):
+        self.anchors = anchors
+
+    def execute_script(self, script, selector, start):
+        assert script == NAVER_ANCHOR_PAIRS_SCRIPT
+        return [[a, a.href] for a in self.anchors][start:]
+
+    def find_elements(self, by, value):
+        raise AssertionError("앵커와 href는 한 번의 스크립트로 함께 읽어야 합니다")
+
+
+def clip(no, title):
+    return {"index": no, "title": title, "views": no * 10, "url": f"https://tv.naver.com/v/{no}",
+            "duration": "1:00", "duration_seconds": 60}
+
+
+def test_state_record_follows_anchor_order_and_ids():
+    state = state_records_by_id([clip(1, "상태1"), clip(2, "상태2"), clip(99, "추천")])
+    driver = FakeDriver([FakeAnchor("https://tv.naver.com/v/2"), FakeAnchor("https://tv.naver.com/v/3", "앵커3"),
+                         FakeAnchor("https://tv.naver.com/v/1"), FakeAnchor("https://tv.naver.com/v/2")])
+    out = records_from_anchors_and_state(driver, state)
+    assert [r["url"].rsplit("/", 1)[1] for r in out] == ["2", "3", "1"]
+    assert [r["title"] for r in out] == ["상태2", "앵커3", "상태1"]
+    assert all("index" not in r for r in out)
+
+
+def test_start_skips_already_extracted_anchors():
+    state = state_records_by_id([clip(1, "상태1"), clip(2, "상태2")])
+    driver = FakeDriver([FakeAnchor("https://tv.naver.com/v/1"), FakeAnchor("https://tv.naver.com/v/2")])
+    out = records_from_anchors_and_state(driver, state, start=1)
+    assert [r["title"] for r in out] == ["상태2"]
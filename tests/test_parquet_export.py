@@ -0,0 +1,28 @@
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from parquet_export import append_round, read_history
+
+
+def records(prefix: str, n: int):
+    return [{"index": i + 1, "title": f"{prefix} {i}", "views": 100 + i,
+             "url": f"https://www.youtube.com/watch?v={prefix}{i:08d}", "duration": "1:00", "duration_seconds": 60}
+            for i in range(n)]
+
+
+def test_same_second_rounds_of_two_channels_are_both_kept(tmp_path):
+    saved_at = "2026-10-17 12:00:00"
+    append_round(str(tmp_path), "youtube", "채널 A/1", records("aaa", 3), saved_at)
+    append_round(str(tmp_path), "youtube", "채널 B", records("bbb", 2), saved_at)
+
+    df = read_history(str(tmp_path), platform="youtube")
+    assert sorted(df.groupby("channel", observed=True).size().items()) == [("채널 A/1", 3), ("채널 B", 2)]
+
+
+def test_same_channel_twice_in_one_second_keeps_both_rounds(tmp_path):
+    saved_at = "2026-10-17 12:00:00"
+    append_round(str(tmp_path), "kakao", "채널", records("ccc", 2), saved_at)
+    append_round(str(tmp_path), "kakao", "채널", records("ccc", 2), saved_at)
+
+    assert len(read_history(str(tmp_path), channel="채널")) == 4
@@ -0,0 +1,48 @@
+import pytest
+
+from parsing import parse_duration_to_seconds, parse_durations_batch, parse_views_batch, parse_views_generic
+
+
+VIEW_INPUTS = [
+    "조회수 1,234회", "조회수 1.2만회", "조회수 3억회", "1.2천회", "재생수 12,345", "재생 4.5만", "98765",
+    # 쉼표 숫자 + 억/만/천 (단건 파서는 단위를 무시하고 숫자만 읽음)
+    "조회수 1,234만회", "1,234억", "12,345천회", "조회수 1,000.5만회",
+    "1,234 views", "1.2K views", "2.3M views", "1.1B views", "1 view",
+    "No views", "no views", "조회수 없음", "조회수없음", "조회수 정보 없음",
+    "", "   ", None, "LIVE", "실시간", "조회수", "abc",
+]
+
+DURATION_INPUTS = [
+    "1:02:03", "10:00:00", "12:34", "0:05", " \n 3:07 \n", "1 : 02 : 03",
+    "LIVE", "live", "실시간", "PREMIERE", "예정", "SHORTS", "", None, "1:2", "1:02:3", "123",
+]
+
+
+def as_list(series):
+    return [None if v is None or v != v else int(v) for v in series.astype(object).where(series.notna(), None)]
+
+
+@pytest.mark.parametrize("text", VIEW_INPUTS)
+def test_views_batch_matches_scalar(text):
+    assert as_list(parse_views_batch([text])) == [parse_views_generic(text)]
+
+
+@pytest.mark.parametrize("text", DURATION_INPUTS)
+def test_durations_batch_matches_scalar(text):
+    assert as_list(parse_durations_batch([text])) == [parse_duration_to_seconds(text)]
+
+
+def test_batch_keeps_order_and_duplicates():
+    values = VIEW_INPUTS + list(reversed(VIEW_INPUTS))
+    assert as_list(parse_views_batch(values)) == [parse_views_generic(v) for v in values]
+    durations = DURATION_INPUTS * 2
+    assert as_list(parse_durations_batch(durations)) == [parse_duration_to_seconds(v) for v in durations]
+
+
+def test_known_values():
+    assert parse_views_generic("조회수 1.2만회") == 12_000
+    assert parse_views_generic("2.3M views") == 2_300_000
+    assert parse_views_generic("No views") == 0
+    assert parse_views_generic(None) is None
+    assert parse_duration_to_seconds("1:02:03") == 3723
+    assert parse_duration_to_seconds("LIVE") is None
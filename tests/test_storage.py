@@ -0,0 +1,55 @@
+import pandas as pd
+import pytest
+
+from storage import export_csv, latest_catalog, open_store, save_round, view_history
+
+
+def rec(i, views=100, title=None):
+    # index는 목록 위치이므로 레코드마다 넣지 않음 (save_round가 순서대로 매김)
+    return {"title": title or f"영상 {i}", "views": views, "url": f"https://tv.kakao.com/channel/1/cliplink/{1000 + i}",
+            "duration": "1:00", "duration_seconds": 60}
+
+
+@pytest.fixture
+def conn(tmp_path):
+    c = open_store(str(tmp_path / "crawl.db"))
+    yield c
+    c.close()
+
+
+def test_same_saved_at_replaces_the_round(conn):
+    save_round(conn, "kakao", "채널", [rec(1, views=100), rec(2)], "2026-01-01 00:00:00")
+    save_round(conn, "kakao", "채널", [rec(1, views=120), rec(2)], "2026-01-01 00:00:00")
+    assert conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0] == 2
+    assert view_history(conn, "kakao", "1001") == [{"saved_at": "2026-01-01 00:00:00", "views": 120}]
+
+
+def test_rounds_append_history_and_keep_first_seen(conn):
+    save_round(conn, "kakao", "채널", [rec(1, views=100)], "2026-01-01 00:00:00")
+    save_round(conn, "kakao", "채널", [rec(1, views=150, title="새 제목")], "2026-01-02 00:00:00")
+    assert [h["views"] for h in view_history(conn, "kakao", "1001")] == [100, 150]
+    first_seen, last_seen, title = conn.execute(
+        "SELECT first_seen, last_seen, title FROM videos WHERE video_id = '1001'").fetchone()
+    assert (first_seen, last_seen, title) == ("2026-01-01 00:00:00", "2026-01-02 00:00:00", "새 제목")
+
+
+def test_latest_catalog_returns_only_the_last_round(conn):
+    save_round(conn, "kakao", "채널", [rec(1), rec(2), rec(3)], "2026-01-01 00:00:00")
+    # 2번 영상 삭제, 4번 영상이 맨 앞에 추가
+    save_round(conn, "kakao", "채널", [rec(4, views=5), rec(1, views=130), rec(3, views=300)], "2026-01-02 00:00:00")
+    save_round(conn, "kakao", "다른 채널", [rec(9)], "2026-01-03 00:00:00")
+
+    catalog = latest_catalog(conn, "kakao", "채널")
+    assert [(r["index"], r["url"][-4:], r["views"]) for r in catalog] == [(1, "1004", 5), (2, "1001", 130),
+                                                                          (3, "1003", 300)]
+    assert {r["saved_at"] for r in catalog} == {"2026-01-02 00:00:00"}
+    assert latest_catalog(conn, "youtube", "채널") == []
+
+
+def test_export_csv_matches_latest_catalog(conn, tmp_path):
+    save_round(conn, "kakao", "채널", [rec(1), {**rec(2), "views": None}], "2026-01-01 00:00:00")
+    path = str(tmp_path / "out.csv")
+    assert export_csv(conn, "kakao", "채널", path) == 2
+    df = pd.read_csv(path)
+    assert df.columns.tolist() == ["index", "title", "views", "url", "duration", "duration_seconds", "saved_at"]
+    assert df["views"].isna().tolist() == [False, True]
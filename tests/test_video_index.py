@@ -0,0 +1,88 @@
+import json
+
+import video_index
+from video_index import (PARTIAL_ROUND_MIN, changes_path, diff_catalog, is_partial_round, load_index, read_changes,
+                         summarize_changes, update_index)
+
+
+def rec(i, title=None, views=100):
+    return {"index": i, "title": title or f"영상 {i}", "views": views,
+            "url": f"https://www.youtube.com/watch?v=vid{i:08d}"}
+
+
+def vid(i):
+    return f"vid{i:08d}"
+
+
+def test_diff_catalog_reports_each_kind_of_change():
+    previous = {vid(1): {"title": "영상 1", "views": 100}, vid(2): {"title": "영상 2", "views": 100},
+                vid(3): {"title": "영상 3", "views": 100}}
+    records = [rec(1, views=150), rec(2, title="새 제목"), rec(4), rec(4), {"title": "ID 없음", "url": "https://x"}]
+    changes = diff_catalog(previous, records)
+    assert [c["id"] for c in changes["new"]] == [vid(4)]
+    assert [c["id"] for c in changes["removed"]] == [vid(3)]
+    assert changes["retitled"] == [{"id": vid(2), "before": "영상 2", "after": "새 제목"}]
+    assert changes["views"] == [{"id": vid(1), "before": 100, "after": 150, "delta": 50}]
+
+
+def test_unread_views_are_not_a_change_and_keep_the_old_value(tmp_path):
+    path = str(tmp_path / "index.json")
+    update_index(path, "youtube", "채널", [rec(1, views=100)], "2026-01-01 00:00:00")
+    changes = update_index(path, "youtube", "채널", [rec(1, views=None)], "2026-01-02 00:00:00")
+    assert changes["views"] == []
+    entry = load_index(path)["youtube|채널"][vid(1)]
+    assert entry["views"] == 100
+    assert entry["first_seen"] == "2026-01-01 00:00:00"
+    assert entry["last_seen"] == "2026-01-02 00:00:00"
+
+
+def test_summary_shows_signed_net_views():
+    changes = {"new": [], "removed": [], "retitled": [], "views": [{"delta": -30}, {"delta": 10}, {"delta": None}]}
+    assert summarize_changes(changes).endswith("조회수 변경 3개 (-20회)")
+
+
+def test_is_partial_round_thresholds(monkeypatch):
+    previous = {vid(i): {} for i in range(PARTIAL_ROUND_MIN)}
+    assert not is_partial_round(None, {})
+    assert is_partial_round(previous, {vid(0): {}})
+    assert not is_partial_round(previous, {vid(i): {} for i in range(PARTIAL_ROUND_MIN // 2)})
+    small = {vid(i): {} for i in range(PARTIAL_ROUND_MIN - 1)}
+    assert not is_partial_round(small, {})
+    monkeypatch.setattr(video_index, "PARTIAL_ROUND_RATIO", 0.9)
+    assert is_partial_round(previous, {vid(i): {} for i in range(PARTIAL_ROUND_MIN - 2)})
+
+
+def test_partial_round_keeps_unseen_entries(tmp_path):
+    path = str(tmp_path / "index.json")
+    full = [rec(i) for i in range(1, 21)]
+    first = update_index(path, "youtube", "채널", full, "2026-01-01 00:00:00")
+    assert first["initial"] and len(first["new"]) == 20
+
+    partial = update_index(path, "youtube", "채널", full[:5], "2026-01-02 00:00:00")
+    assert partial["partial"] is True and partial["unseen"] == 15
+    assert partial["removed"] == []
+    assert partial["total"] == 20
+    assert len(load_index(path)["youtube|채널"]) == 20
+
+    # 충분히 긴 목록이면 빠진 영상을 삭제로 기록
+    full_again = update_index(path, "youtube", "채널", full[:15], "2026-01-03 00:00:00")
+    assert "partial" not in full_again
+    assert [c["id"] for c in full_again["removed"]] == [vid(i) for i in range(16, 21)]
+
+
+def test_read_changes_filters_by_channel_and_since(tmp_path):
+    path = str(tmp_path / "index.json")
+    update_index(path, "youtube", "A", [rec(1)], "2026-01-01 00:00:00")
+    update_index(path, "kakao", "B", [rec(2)], "2026-01-02 00:00:00")
+    update_index(path, "youtube", "A", [rec(1), rec(3)], "2026-01-03 00:00:00")
+    with open(changes_path(path), "a", encoding="utf-8") as f:
+        f.write("{깨진 줄\n")
+
+    assert [c["saved_at"] for c in read_changes(path)] == ["2026-01-01 00:00:00", "2026-01-02 00:00:00",
+                                                            "2026-01-03 00:00:00"]
+    assert [c["channel"] for c in read_changes(path, since="2026-01-01 00:00:00")] == ["B", "A"]
+    latest = read_changes(path, platform="youtube", channel="A", since="2026-01-02 00:00:00")
+    assert len(latest) == 1 and [c["id"] for c in latest[0]["new"]] == [vid(3)]
+    assert read_changes(str(tmp_path / "missing.json")) == []
+    with open(changes_path(path), encoding="utf-8") as f:
+        assert json.loads(f.readline())["initial"] is True
@@ -0,0 +1,184 @@
+import pytest
+
+from storage import open_store
+from work_queue import RedisQueue, RespStore, SQLiteQueue, open_queue, run_worker, serve_resp
+
+
+JOBS = [{"platform": "youtube", "name": "채널A", "url": None}]
+RECORDS = [{"index": 1, "title": "영상", "views": 10, "url": "https://www.youtube.com/watch?v=abcdefghijk"}]
+
+
+@pytest.fixture
+def resp_server():
+    server = serve_resp(port=0)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def queue_spec(request, tmp_path):
+    if request.param == "sqlite":
+        return f"sqlite:{tmp_path / 'queue.db'}"
+    server = request.getfixturevalue("resp_server")
+    return f"redis://127.0.0.1:{server.server_address[1]}"
+
+
+def expire_lease(q, job_id):
+    if isinstance(q, SQLiteQueue):
+        q.conn.execute("UPDATE jobs SET lease_expires = 0 WHERE id = ?", (job_id,))
+    else:
+        q.r.call("ZADD", q.key("leases"), "XX", 0, job_id)
+
+
+def snapshot_count(store_path) -> int:
+    conn = open_store(str(store_path))
+    try:
+        return conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_worker_saves_and_completes(queue_spec, tmp_path):
+    q = open_queue(queue_spec)
+    q.enqueue(JOBS)
+    result = run_worker(queue_spec, str(tmp_path / "crawl.db"), lease=5, worker_id="w1",
+                        collect=lambda job: {"ok": True, "records": RECORDS, "error": None, "elapsed": 0.1})
+    assert (result["done"], result["failed"], result["lost"]) == (1, 0, 0)
+    assert q.stats()["done"] == 1
+    assert snapshot_count(tmp_path / "crawl.db") == 1
+    q.close()
+
+
+def test_worker_discards_result_after_losing_lease(queue_spec, tmp_path):
+    q = open_queue(queue_spec)
+    q.enqueue(JOBS)
+
+    def collect(job):
+        # 수집 중 임대가 만료되어 다른 워커가 같은 작업을 다시 임대
+        other = open_queue(queue_spec)
+        expire_lease(other, job["id"])
+        assert other.claim("w2", lease=5)["id"] == job["id"]
+        other.close()
+        return {"ok": True, "records": RECORDS, "error": None, "elapsed": 0.1}
+
+    result = run_worker(queue_spec, str(tmp_path / "crawl.db"), lease=5, worker_id="w1", collect=collect)
+    assert (result["done"], result["lost"]) == (0, 1)
+    assert snapshot_count(tmp_path / "crawl.db") == 0
+    assert q.stats()["leased"] == 1
+    q.close()
+
+
+def test_redis_heartbeat_ignores_reassigned_job(resp_server):
+    spec = f"redis://127.0.0.1:{resp_server.server_address[1]}"
+    q = open_queue(spec)
+    assert isinstance(q, RedisQueue)
+    q.enqueue(JOBS)
+    job = q.claim("w1", lease=5)
+    expire_lease(q, job["id"])
+    assert q.claim("w2", lease=5)["id"] == job["id"]
+    assert not q.heartbeat(job["id"], "w1", lease=5)
+    assert q.heartbeat(job["id"], "w2", lease=5)
+    q.close()
+
+
+def test_claim_heartbeat_complete(queue_spec):
+    q = open_queue(queue_spec)
+    q.enqueue(JOBS + [{"platform": "kakao", "name": "채널B", "url": "https://tv.kakao.com/channel/1"}])
+    a = q.claim("w1", lease=5)
+    b = q.claim("w2", lease=5)
+    assert (a["name"], a["attempts"]) == ("채널A", 1)
+    assert (b["name"], b["url"]) == ("채널B", "https://tv.kakao.com/channel/1")
+    assert q.claim("w3", lease=5) is None
+    assert q.heartbeat(a["id"], "w1", lease=5)
+    assert not q.heartbeat(a["id"], "w2", lease=5)
+    assert not q.complete(a["id"], "w2", 1.0)
+    assert q.complete(a["id"], "w1", 1.0)
+    assert not q.complete(a["id"], "w1", 1.0)
+    assert not q.heartbeat(a["id"], "w1", lease=5)
+    assert q.stats() == {"queued": 0, "leased": 1, "done": 1, "failed": 0}
+    q.close()
+
+
+def test_expired_lease_is_requeued_then_failed_after_max_attempts(queue_spec):
+    q = open_queue(queue_spec)
+    q.enqueue(JOBS, max_attempts=2)
+    first = q.claim("w1", lease=5)
+    expire_lease(q, first["id"])
+    second = q.claim("w2", lease=5)
+    assert (second["id"], second["attempts"]) == (first["id"], 2)
+    assert not q.complete(first["id"], "w1", 1.0)
+    expire_lease(q, second["id"])
+    assert q.claim("w3", lease=5) is None
+    assert q.stats()["failed"] == 1
+    q.close()
+
+
+def test_fail_requeues_until_max_attempts(queue_spec):
+    q = open_queue(queue_spec)
+    q.enqueue(JOBS, max_attempts=2)
+    job = q.claim("w1", lease=5)
+    assert q.fail(job["id"], "w1", "오류 1")
+    assert q.stats()["queued"] == 1
+    job = q.claim("w1", lease=5)
+    assert not q.fail(job["id"], "w2", "남의 작업")
+    assert q.fail(job["id"], "w1", "오류 2")
+    assert q.stats() == {"queued": 0, "leased": 0, "done": 0, "failed": 1}
+    assert q.claim("w1", lease=5) is None
+    q.close()
+
+
+def test_redis_duplicate_pending_entries_are_dropped(resp_server):
+    q = open_queue(f"redis://127.0.0.1:{resp_server.server_address[1]}")
+    q.enqueue(JOBS)
+    job_id = q.r.call("LRANGE", q.key("pending"), 0, -1)[0]
+    q.r.call("RPUSH", q.key("pending"), job_id)  # 반환 도중 중단되어 생긴 중복 항목
+
+    job = q.claim("w1", lease=5)
+    assert q.claim("w2", lease=5) is None  # 임대 중인 작업의 중복 → 버림
+    assert q.r.call("LRANGE", q.key("processing"), 0, -1) == [job_id]
+    assert q.complete(job["id"], "w1", 1.0)
+    assert q.r.call("LRANGE", q.key("processing"), 0, -1) == []
+
+    q.r.call("RPUSH", q.key("pending"), job_id)  # 완료된 작업의 중복 → 버림
+    assert q.claim("w2", lease=5) is None
+    assert q.stats()["done"] == 1
+    q.close()
+
+
+def test_redis_orphan_in_processing_is_requeued(resp_server):
+    q = open_queue(f"redis://127.0.0.1:{resp_server.server_address[1]}")
+    q.enqueue(JOBS)
+    # 임대를 걸기 전에 워커가 죽은 상태: processing에만 있고 임대 없음
+    job_id = q.r.call("LMOVE", q.key("pending"), q.key("processing"), "LEFT", "RIGHT")
+    q.sweep_orphans(lease=0)
+    assert q.r.call("ZSCORE", q.key("leases"), job_id) is None  # 한 번 본 것으로는 임대를 걸지 않음
+    q.sweep_orphans(lease=0)
+    assert q.r.call("ZSCORE", q.key("leases"), job_id) is not None
+    q.reap_expired()
+    assert q.r.call("LRANGE", q.key("pending"), 0, -1) == [job_id]
+    assert q.r.call("LRANGE", q.key("processing"), 0, -1) == []
+    assert q.claim("w1", lease=5)["id"] == job_id
+    q.close()
+
+
+def test_resp_store_zadd_flags_and_lrem():
+    store = RespStore()
+    run = store.execute
+    assert run("ZADD", ["z", "XX", "CH", "1", "a"]) == 0 and run("ZSCORE", ["z", "a"]) is None
+    assert run("ZADD", ["z", "NX", "1", "a"]) == 1
+    assert run("ZADD", ["z", "NX", "2", "a"]) == 0 and run("ZSCORE", ["z", "a"]) == "1.0"
+    assert run("ZADD", ["z", "XX", "CH", "2", "a"]) == 1
+    assert run("ZADD", ["z", "XX", "CH", "2", "a"]) == 0
+    assert run("ZADD", ["z", "XX", "3", "a"]) == 0 and run("ZSCORE", ["z", "a"]) == "3.0"
+    assert run("ZRANGEBYSCORE", ["z", "-inf", "3"]) == ["a"]
+    assert run("ZREM", ["z", "a"]) == 1 and run("ZREM", ["z", "a"]) == 0
+
+    run("RPUSH", ["l", "x", "y", "x", "x"])
+    assert run("LREM", ["l", "1", "x"]) == 1 and run("LRANGE", ["l", "0", "-1"]) == ["y", "x", "x"]
+    assert run("LREM", ["l", "-1", "x"]) == 1 and run("LRANGE", ["l", "0", "-1"]) == ["y", "x"]
+    run("RPUSH", ["l", "x"])
+    assert run("LREM", ["l", "0", "x"]) == 2 and run("LRANGE", ["l", "0", "-1"]) == ["y"]
+    assert run("LMOVE", ["l", "m", "LEFT", "RIGHT"]) == "y" and run("LMOVE", ["l", "m", "LEFT", "RIGHT"]) is None
+    with pytest.raises(ValueError):
+        run("EVAL", [])
@@ -0,0 +1,80 @@
+import os
+
+import pytest
+import requests
+
+from checkpoint import load_checkpoint
+from youtube_fixture_server import (SYNTHETIC_HANDLE, SYNTHETIC_NAME, make_synthetic_fixtures, serve_fixtures,
+                                    synthetic_video, verify_synthetic)
+from youtube_http import collect_channel_videos_http, create_session, probe_first_page_http
+
+
+N_VIDEOS = 95  # 30개씩 4페이지 (첫 페이지 HTML + continuation 3개)
+
+
+@pytest.fixture
+def serve():
+    servers = []
+
+    def start(fixtures):
+        server, base_url = serve_fixtures(fixtures)
+        servers.append(server)
+        return base_url
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def session():
+    s = create_session(retries=0)
+    yield s
+    s.close()
+
+
+def video_id(i: int) -> str:
+    return synthetic_video(i)["richItemRenderer"]["content"]["videoRenderer"]["videoId"]
+
+
+def test_collects_every_continuation_page(serve, session):
+    base_url = serve(make_synthetic_fixtures(N_VIDEOS))
+    records = collect_channel_videos_http(SYNTHETIC_NAME, session=session, base_url=base_url)
+    assert verify_synthetic(records, N_VIDEOS) is None
+
+
+def test_known_ids_stop_after_first_fully_known_page(serve, session):
+    base_url = serve(make_synthetic_fixtures(N_VIDEOS))
+    known = {video_id(i) for i in range(31, N_VIDEOS + 1)}
+    records = collect_channel_videos_http(SYNTHETIC_NAME, channel_url=base_url + SYNTHETIC_HANDLE, session=session,
+                                          base_url=base_url, known_ids=known)
+    # 1페이지(새 영상) + 2페이지(모두 알려진 영상)까지만 요청
+    assert [r["index"] for r in records] == list(range(1, 61))
+    assert verify_synthetic(records, 60) is None
+
+
+def test_resumes_from_checkpoint_token(serve, session, tmp_path):
+    path = str(tmp_path / "youtube-fixture.json")
+    fixtures = make_synthetic_fixtures(N_VIDEOS)
+    broken = {"pages": fixtures["pages"],
+              "continuations": {k: v for k, v in fixtures["continuations"].items() if k != "TOKEN_2"}}
+    base_url = serve(broken)
+    with pytest.raises(requests.HTTPError):
+        collect_channel_videos_http(SYNTHETIC_NAME, session=session, base_url=base_url, checkpoint_path=path)
+    state = load_checkpoint(path)
+    assert state["continuation"] == "TOKEN_2"
+    assert len(state["records"]) == 60
+
+    # 동영상 탭 페이지 없이 continuation만 제공: 토큰부터 이어서 받아야 함
+    base_url = serve({"pages": {}, "continuations": fixtures["continuations"]})
+    records = collect_channel_videos_http(SYNTHETIC_NAME, session=session, base_url=base_url, checkpoint_path=path)
+    assert verify_synthetic(records, N_VIDEOS) is None
+    assert not os.path.exists(path)
+
+
+def test_probe_reads_only_the_first_page(serve, session):
+    fixtures = make_synthetic_fixtures(N_VIDEOS)
+    base_url = serve({"pages": fixtures["pages"], "continuations": {}})
+    records = probe_first_page_http(session, base_url + SYNTHETIC_HANDLE, size=10)
+    assert verify_synthetic(records, 10) is None
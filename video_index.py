@@ -0,0 +1,193 @@
+"""
+영상 ID 기준 영구 색인 + 라운드 간 변경분(change set) 계산.
+
+영상은 URL이 아니라 플랫폼 내 고유 ID(parsing.extract_video_id: watch?v=<id>, /cliplink/<id>, /v/<id>)로 식별합니다.
+색인(video_index.json)에는 채널별로 영상마다 마지막으로 확인한 제목/조회수/길이/URL/목록 위치와 처음/마지막 확인 시각을
+저장합니다. 라운드가 끝날 때마다 update_index()가 새 목록을 색인과 한 번씩만 훑어(O(n)) 다음 변경분을 계산합니다.
+
+- new:      이번 라운드에 처음 나타난 영상
+- removed:  이전 라운드에는 있었지만 이번 목록에 없는 영상
+- retitled: 제목이 바뀐 영상 (이전/새 제목)
+- views:    조회수가 바뀐 영상 (이전/새 조회수와 증가분)
+
+변경분은 <색인>.changes.jsonl에 라운드마다 한 줄씩 추가되므로, 후속 작업은 전체 목록을 다시 읽고 비교하는 대신
+이 파일의 새 줄만 읽으면 됩니다. 색인이 처음 만들어지는 라운드는 initial=true로 표시합니다.
+
+목록이 중간에 끊긴 라운드(이번 영상 수가 이전 색인의 PARTIAL_ROUND_RATIO 미만)는 partial=true로 표시하고,
+removed를 비운 채 이번에 보이지 않은 영상을 색인에 그대로 남깁니다. (부분 수집을 대량 삭제로 기록하지 않도록)
+
+확인:
+  python video_index.py video_index.json                 # 채널별 색인 크기
+  python video_index.py video_index.json --changes 5     # 최근 변경분 5개 요약
+"""
+
+import argparse
+import json
+from typing import Dict, List, Optional
+
+from csv_output import atomic_write_text
+from parsing import extract_video_id
+
+
+VIDEO_INDEX_PATH = "video_index.json"
+PARTIAL_ROUND_RATIO = 0.5    # 이번 영상 수가 이전 색인의 이 비율 미만이면 부분 라운드로 판단
+PARTIAL_ROUND_MIN = 10       # 이전 색인이 이보다 작으면 부분 라운드 판단을 하지 않음
+
+
+def index_key(platform: str, channel: str) -> str:
+    return f"{platform}|{channel}"
+
+
+def changes_path(index_path: str) -> str:
+    return index_path + ".changes.jsonl"
+
+
+def load_index(path: str) -> Dict[str, Dict[str, Dict]]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_index(path: str, index: Dict[str, Dict[str, Dict]]):
+    atomic_write_text(path, lambda f: json.dump(index, f, ensure_ascii=False))
+
+
+def diff_catalog(previous: Dict[str, Dict], records: List[Dict]) -> Dict[str, List[Dict]]:
+    """
+    이전 색인(ID → 항목)과 이번 라운드 레코드를 비교합니다. 레코드 한 번 + 이전 색인 한 번만 훑습니다.
+    ID를 추출할 수 없는 레코드는 건너뜁니다.
+    반환: {'new', 'removed', 'retitled', 'views'} (각 항목은 id를 포함한 dict 목록)
+    """
+    changes: Dict[str, List[Dict]] = {"new": [], "removed": [], "retitled": [], "views": []}
+    current = set()
+    for r in records:
+        vid = extract_video_id(r.get("url"))
+        if not vid or vid in current:
+            continue
+        current.add(vid)
+        old = previous.get(vid)
+        if old is None:
+            changes["new"].append({"id": vid, "title": r.get("title"), "url": r.get("url"), "views": r.get("views")})
+            continue
+        if (r.get("title") or "") != (old.get("title") or ""):
+            changes["retitled"].append({"id": vid, "before": old.get("title"), "after": r.get("title")})
+        before, after = old.get("views"), r.get("views")
+        if after is not None and before != after:
+            changes["views"].append({"id": vid, "before": before, "after": after,
+                                     "delta": after - before if before is not None else None})
+    for vid, old in previous.items():
+        if vid not in current:
+            changes["removed"].append({"id": vid, "title": old.get("title"), "url": old.get("url")})
+    return changes
+
+
+def index_entries(previous: Dict[str, Dict], records: List[Dict], saved_at: str) -> Dict[str, Dict]:
+    """
+    이번 라운드 목록으로 채널 색인을 새로 만듭니다. (처음 확인 시각은 유지, 조회수를 읽지 못한 영상은 이전 값 유지)
+    """
+    entries: Dict[str, Dict] = {}
+    for pos, r in enumerate(records, 1):
+        vid = extract_video_id(r.get("url"))
+        if not vid or vid in entries:
+            continue
+        old = previous.get(vid) or {}
+        views = r.get("views") if r.get("views") is not None else old.get("views")
+        entries[vid] = {"title": r.get("title"), "views": views, "duration": r.get("duration"),
+                        "duration_seconds": r.get("duration_seconds"), "url": r.get("url"),
+                        "position": r.get("index") or pos, "first_seen": old.get("first_seen") or saved_at,
+                        "last_seen": saved_at}
+    return entries
+
+
+def summarize_changes(changes: Dict) -> str:
+    net = sum(c["delta"] for c in changes["views"] if c.get("delta"))
+    return (f"신규 {len(changes['new'])}개, 삭제 {len(changes['removed'])}개, 제목 변경 {len(changes['retitled'])}개, "
+            f"조회수 변경 {len(changes['views'])}개 ({net:+,}회)")
+
+
+def is_partial_round(previous: Optional[Dict[str, Dict]], entries: Dict[str, Dict]) -> bool:
+    return bool(previous) and len(previous) >= PARTIAL_ROUND_MIN and len(entries) < len(previous) * PARTIAL_ROUND_RATIO
+
+
+def update_index(path: str, platform: str, channel: str, records: List[Dict], saved_at: str) -> Dict:
+    """
+    라운드 결과로 색인을 갱신하고 변경분을 <색인>.changes.jsonl에 한 줄 추가합니다. 반환: 변경분
+    부분 라운드면 removed를 비우고, 보이지 않은 영상은 이전 항목 그대로 색인에 남깁니다.
+    """
+    index = load_index(path)
+    key = index_key(platform, channel)
+    previous = index.get(key)
+    changes = diff_catalog(previous or {}, records)
+    entries = index_entries(previous or {}, records, saved_at)
+    partial = is_partial_round(previous, entries)
+    unseen = 0
+    if partial:
+        unseen = len(changes["removed"])
+        changes["removed"] = []
+        for vid, old in previous.items():
+            entries.setdefault(vid, old)
+        print(f"⚠️ 영상 색인({platform} | {channel}): 이번 목록 {len(records)}개가 이전 {len(previous)}개보다 크게 적어 "
+              f"부분 라운드로 처리합니다. (미확인 {unseen}개는 삭제로 기록하지 않음)")
+    index[key] = entries
+    save_index(path, index)
+
+    change_set = {"platform": platform, "channel": channel, "saved_at": saved_at, "initial": previous is None,
+                  "total": len(entries), **changes}
+    if partial:
+        change_set.update(partial=True, unseen=unseen)
+    with open(changes_path(path), "a", encoding="utf-8") as f:
+        f.write(json.dumps(change_set, ensure_ascii=False) + "\n")
+    label = "생성" if previous is None else "변경분"
+    print(f"영상 색인 {label}({platform} | {channel}): {summarize_changes(changes)} → {changes_path(path)}")
+    return change_set
+
+
+def read_changes(path: str, platform: Optional[str] = None, channel: Optional[str] = None,
+                 since: Optional[str] = None) -> List[Dict]:
+    """
+    변경분 기록을 읽습니다. since(saved_at 문자열)가 주어지면 그 이후 라운드만 반환합니다.
+    """
+    out: List[Dict] = []
+    try:
+        with open(changes_path(path), encoding="utf-8") as f:
+            for line in f:
+                try:
+                    c = json.loads(line)
+                except ValueError:
+                    continue
+                if platform and c.get("platform") != platform:
+                    continue
+                if channel and c.get("channel") != channel:
+                    continue
+                if since and (c.get("saved_at") or "") <= since:
+                    continue
+                out.append(c)
+    except FileNotFoundError:
+        pass
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="영상 ID 색인/변경분 확인")
+    parser.add_argument("index", nargs="?", default=VIDEO_INDEX_PATH)
+    parser.add_argument("--changes", type=int, default=0, help="최근 변경분 N개 요약")
+    parser.add_argument("--since", default=None, help="이 시각(YYYY-MM-DD HH:MM:SS) 이후 변경분만")
+    args = parser.parse_args()
+    if args.changes or args.since:
+        changes = read_changes(args.index, since=args.since)
+        for c in changes[-args.changes:] if args.changes else changes:
+            tag = " (색인 생성)" if c.get("initial") else f" (부분 라운드, 미확인 {c['unseen']}개)" if c.get("partial") else ""
+            print(f"{c['saved_at']} {c['platform']} | {c['channel']} | 총 {c['total']}개 | {summarize_changes(c)}{tag}")
+            for item in c["retitled"]:
+                print(f"  · 제목 변경 {item['id']}: {item['before']} → {item['after']}")
+        return
+    for key, entries in sorted(load_index(args.index).items()):
+        last = max((e.get("last_seen") or "" for e in entries.values()), default="-")
+        print(f"{key:<40} 영상 {len(entries)}개 (마지막 확인 {last})")
+
+
+if __name__ == "__main__":
+    main()
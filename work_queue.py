@@ -0,0 +1,658 @@
+"""
+여러 노드가 채널 목록을 나눠 수집하기 위한 작업 큐 (코디네이터/워커).
+
+채널 하나가 작업 하나입니다. 워커는 작업을 임대(lease)하고, 수집하는 동안 하트비트로 임대를 연장하며,
+끝나면 결과를 공용 저장소(storage.py)에 기록하고 완료 처리합니다. 임대가 만료된 작업(워커 비정상 종료)은
+다시 대기열로 돌아가고, 실패한 작업은 max_attempts까지 재시도합니다.
+
+백엔드:
+- sqlite:<경로>            한 호스트의 여러 워커 프로세스 (WAL + BEGIN IMMEDIATE로 임대를 원자적으로 처리)
+- redis://<호스트>:<포트>  여러 호스트 (Redis 6.2+ 또는 이 모듈의 serve-resp 대역 서버, LMOVE/ZADD NX·XX 사용)
+
+실행 예:
+  python work_queue.py serve-resp --port 6380                                  # 대역 서버 (여러 호스트 공유용)
+  python work_queue.py enqueue channels.csv --queue redis://127.0.0.1:6380
+  python work_queue.py worker --queue redis://127.0.0.1:6380 --store crawl.db --processes 2
+  python work_queue.py stats --queue sqlite:queue.db
+  python work_queue.py demo --processes 1,2,4 --jobs 40 --job-seconds 0.5     # 워커 수에 따른 처리량 측정
+"""
+
+import argparse
+import multiprocessing as mp
+import os
+import socket
+import socketserver
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from batch_crawl import close_worker_driver, crawl_channel, init_worker, load_channel_list
+from storage import open_store, save_round
+
+
+DEFAULT_LEASE = 120.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+# ---------------------------------------------------------------------------
+# SQLite 백엔드
+# ---------------------------------------------------------------------------
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    platform      TEXT NOT NULL,
+    name          TEXT NOT NULL,
+    url           TEXT,
+    state         TEXT NOT NULL DEFAULT 'queued',
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    max_attempts  INTEGER NOT NULL,
+    owner         TEXT,
+    lease_expires REAL,
+    last_error    TEXT,
+    elapsed       REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_state ON jobs (state, lease_expires);
+"""
+
+
+class SQLiteQueue:
+    def __init__(self, path: str):
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SQLITE_SCHEMA)
+
+    def enqueue(self, jobs: List[Dict], max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> int:
+        self.conn.execute("BEGIN IMMEDIATE")
+        self.conn.executemany(
+            "INSERT INTO jobs (platform, name, url, max_attempts) VALUES (?, ?, ?, ?)",
+            [(j["platform"], j["name"], j.get("url"), max_attempts) for j in jobs],
+        )
+        self.conn.execute("COMMIT")
+        return len(jobs)
+
+    def claim(self, owner: str, lease: float = DEFAULT_LEASE) -> Optional[Dict]:
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 만료된 임대는 재시도 횟수가 남아 있으면 대기열로, 아니면 실패로
+            self.conn.execute("UPDATE jobs SET state = CASE WHEN attempts < max_attempts THEN 'queued' ELSE 'failed' END, "
+                              "last_error = COALESCE(last_error, '임대 만료'), owner = NULL "
+                              "WHERE state = 'leased' AND lease_expires < ?", (now,))
+            row = self.conn.execute("SELECT id, platform, name, url, attempts FROM jobs WHERE state = 'queued' "
+                                    "ORDER BY id LIMIT 1").fetchone()
+            if row is None:
+                self.conn.execute("COMMIT")
+                return None
+            self.conn.execute("UPDATE jobs SET state = 'leased', owner = ?, lease_expires = ?, attempts = attempts + 1 "
+                              "WHERE id = ?", (owner, now + lease, row[0]))
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return {"id": row[0], "platform": row[1], "name": row[2], "url": row[3], "attempts": row[4] + 1}
+
+    def heartbeat(self, job_id, owner: str, lease: float = DEFAULT_LEASE) -> bool:
+        cur = self.conn.execute("UPDATE jobs SET lease_expires = ? WHERE id = ? AND owner = ? AND state = 'leased'",
+                                (time.time() + lease, job_id, owner))
+        return cur.rowcount == 1
+
+    def complete(self, job_id, owner: str, elapsed: float) -> bool:
+        cur = self.conn.execute("UPDATE jobs SET state = 'done', owner = NULL, elapsed = ?, last_error = NULL "
+                                "WHERE id = ? AND owner = ? AND state = 'leased'", (elapsed, job_id, owner))
+        return cur.rowcount == 1
+
+    def fail(self, job_id, owner: str, error: str) -> bool:
+        cur = self.conn.execute("UPDATE jobs SET state = CASE WHEN attempts < max_attempts THEN 'queued' ELSE 'failed' END, "
+                                "owner = NULL, last_error = ? WHERE id = ? AND owner = ? AND state = 'leased'",
+                                (error, job_id, owner))
+        return cur.rowcount == 1
+
+    def stats(self) -> Dict[str, int]:
+        out = {"queued": 0, "leased": 0, "done": 0, "failed": 0}
+        for state, n in self.conn.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state"):
+            out[state] = n
+        return out
+
+    def clear(self):
+        self.conn.execute("DELETE FROM jobs")
+
+    def close(self):
+        self.conn.close()
+
+
+# ---------------------------------------------------------------------------
+# Redis(RESP) 백엔드
+# ---------------------------------------------------------------------------
+
+class RespClient:
+    """
+    Redis 직렬화 프로토콜(RESP)로 명령을 보내는 최소 클라이언트.
+    """
+
+    def __init__(self, host: str, port: int, timeout: float = 10):
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.file = self.sock.makefile("rb")
+
+    def call(self, *args):
+        parts = [f"*{len(args)}\r\n".encode()]
+        for a in args:
+            b = a if isinstance(a, bytes) else str(a).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(b), b))
+        self.sock.sendall(b"".join(parts))
+        return self.read_reply()
+
+    def read_reply(self):
+        line = self.file.readline()
+        if not line:
+            raise ConnectionError("RESP 서버 연결이 끊어졌습니다.")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest.decode()
+        if kind == b"-":
+            raise RuntimeError(f"RESP 오류: {rest.decode()}")
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            n = int(rest)
+            if n < 0:
+                return None
+            data = self.file.read(n + 2)[:-2]
+            return data.decode("utf-8")
+        if kind == b"*":
+            n = int(rest)
+            return None if n < 0 else [self.read_reply() for _ in range(n)]
+        raise RuntimeError(f"알 수 없는 RESP 응답: {line!r}")
+
+    def close(self):
+        try:
+            self.file.close()
+            self.sock.close()
+        except OSError:
+            pass
+
+
+class RedisQueue:
+    """
+    키 구성: <prefix>:pending(대기 ID 리스트), <prefix>:processing(임대 중 ID 리스트),
+    <prefix>:leases(ID→만료 시각 정렬 집합), <prefix>:job:<id>(작업 해시), <prefix>:next_id, <prefix>:ids(전체 ID 리스트)
+
+    - 임대: LMOVE로 pending → processing을 한 명령으로 옮기므로 어느 시점에 워커가 죽어도 작업이 사라지지 않습니다.
+      이어서 ZADD NX로 임대를 잡은 워커만 작업을 처리합니다. (이미 임대가 있으면 중복 항목이므로 버림)
+    - 하트비트: 소유자를 확인한 뒤 ZADD XX CH 한 명령으로 임대가 남아 있을 때만 연장합니다. (만료 처리된 임대를 되살리지 않음)
+    - 만료/완료: ZREM의 반환값(1=내가 제거)으로 한 번만 처리합니다.
+    - processing에 있는데 임대가 없는 작업(임대/반환 도중 비정상 종료)은 sweep_orphans()가 임대를 새로 걸어
+      만료 후 다시 대기열로 돌려보냅니다. (임대를 거는 중인 작업과 겹치지 않도록 두 번 연속 발견된 것만)
+    """
+
+    def __init__(self, host: str, port: int, prefix: str = "crawl"):
+        self.r = RespClient(host, port)
+        self.p = prefix
+        self.orphans: set = set()
+
+    def key(self, *parts) -> str:
+        return ":".join([self.p, *map(str, parts)])
+
+    def enqueue(self, jobs: List[Dict], max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> int:
+        for j in jobs:
+            job_id = self.r.call("INCR", self.key("next_id"))
+            self.r.call("HSET", self.key("job", job_id), "platform", j["platform"], "name", j["name"],
+                        "url", j.get("url") or "", "state", "queued", "attempts", 0, "max_attempts", max_attempts)
+            self.r.call("RPUSH", self.key("ids"), job_id)
+            self.r.call("RPUSH", self.key("pending"), job_id)
+        return len(jobs)
+
+    def sweep_orphans(self, lease: float = DEFAULT_LEASE):
+        """
+        processing에 남았지만 임대가 없는 작업에 임대를 걸어 둡니다. (만료되면 reap_expired가 대기열로 돌려보냄)
+        """
+        seen = set()
+        for job_id in self.r.call("LRANGE", self.key("processing"), 0, -1) or []:
+            if self.r.call("ZSCORE", self.key("leases"), job_id) is not None:
+                continue
+            if job_id not in self.orphans:
+                seen.add(job_id)
+            elif self.r.call("HGET", self.key("job", job_id), "state") in ("done", "failed"):
+                self.r.call("LREM", self.key("processing"), 1, job_id)
+            else:
+                self.r.call("ZADD", self.key("leases"), "NX", time.time() + lease, job_id)
+        self.orphans = seen
+
+    def reap_expired(self):
+        for job_id in self.r.call("ZRANGEBYSCORE", self.key("leases"), "-inf", time.time()) or []:
+            if self.r.call("ZREM", self.key("leases"), job_id) == 1:
+                self.requeue_or_fail(job_id, "임대 만료")
+
+    def requeue_or_fail(self, job_id, error: str):
+        # 대기열에 먼저 넣고 processing에서 뺍니다. (중간에 죽으면 중복 항목이 생길 뿐 작업은 사라지지 않음)
+        job = self.job(job_id)
+        if int(job.get("attempts") or 0) < int(job.get("max_attempts") or DEFAULT_MAX_ATTEMPTS):
+            self.r.call("HSET", self.key("job", job_id), "state", "queued", "owner", "", "last_error", error)
+            self.r.call("RPUSH", self.key("pending"), job_id)
+        else:
+            self.r.call("HSET", self.key("job", job_id), "state", "failed", "owner", "", "last_error", error)
+        self.r.call("LREM", self.key("processing"), 1, job_id)
+
+    def job(self, job_id) -> Dict:
+        flat = self.r.call("HGETALL", self.key("job", job_id)) or []
+        return dict(zip(flat[::2], flat[1::2]))
+
+    def claim(self, owner: str, lease: float = DEFAULT_LEASE) -> Optional[Dict]:
+        self.sweep_orphans(lease)
+        self.reap_expired()
+        while True:
+            job_id = self.r.call("LMOVE", self.key("pending"), self.key("processing"), "LEFT", "RIGHT")
+            if job_id is None:
+                return None
+            stale = self.r.call("HGET", self.key("job", job_id), "state") in ("done", "failed")
+            if stale or self.r.call("ZADD", self.key("leases"), "NX", time.time() + lease, job_id) != 1:
+                # 이미 끝났거나 다른 워커가 임대 중인 중복 항목
+                self.r.call("LREM", self.key("processing"), 1, job_id)
+                continue
+            attempts = self.r.call("HINCRBY", self.key("job", job_id), "attempts", 1)
+            self.r.call("HSET", self.key("job", job_id), "state", "leased", "owner", owner)
+            job = self.job(job_id)
+            return {"id": job_id, "platform": job["platform"], "name": job["name"], "url": job.get("url") or None,
+                    "attempts": attempts}
+
+    def owns(self, job_id, owner: str) -> bool:
+        return self.r.call("HGET", self.key("job", job_id), "owner") == owner
+
+    def heartbeat(self, job_id, owner: str, lease: float = DEFAULT_LEASE) -> bool:
+        # 만료 후 다른 워커가 다시 임대한 작업은 연장하지 않음 / XX: 임대가 남아 있을 때만 갱신, CH: 갱신했으면 1
+        if not self.owns(job_id, owner):
+            return False
+        return self.r.call("ZADD", self.key("leases"), "XX", "CH", time.time() + lease, job_id) == 1
+
+    def complete(self, job_id, owner: str, elapsed: float) -> bool:
+        if not self.owns(job_id, owner) or self.r.call("ZREM", self.key("leases"), job_id) != 1:
+            return False
+        self.r.call("HSET", self.key("job", job_id), "state", "done", "owner", "", "elapsed", f"{elapsed:.3f}")
+        self.r.call("LREM", self.key("processing"), 1, job_id)
+        return True
+
+    def fail(self, job_id, owner: str, error: str) -> bool:
+        if not self.owns(job_id, owner) or self.r.call("ZREM", self.key("leases"), job_id) != 1:
+            return False
+        self.requeue_or_fail(job_id, error)
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        out = {"queued": 0, "leased": 0, "done": 0, "failed": 0}
+        for job_id in self.r.call("LRANGE", self.key("ids"), 0, -1) or []:
+            state = self.r.call("HGET", self.key("job", job_id), "state")
+            out[state] = out.get(state, 0) + 1
+        return out
+
+    def clear(self):
+        ids = self.r.call("LRANGE", self.key("ids"), 0, -1) or []
+        keys = [self.key("job", i) for i in ids] + [self.key(k) for k in ("pending", "processing", "leases", "next_id", "ids")]
+        self.r.call("DEL", *keys)
+
+    def close(self):
+        self.r.close()
+
+
+def open_queue(spec: str):
+    """
+    'sqlite:<경로>' 또는 'redis://<호스트>:<포트>' 형식의 큐를 엽니다.
+    """
+    if spec.startswith("redis://"):
+        host, _, port = spec[len("redis://"):].rstrip("/").partition(":")
+        return RedisQueue(host or "127.0.0.1", int(port or 6379))
+    if spec.startswith("sqlite:"):
+        return SQLiteQueue(spec[len("sqlite:"):])
+    raise ValueError(f"알 수 없는 큐 형식: {spec} (sqlite:<경로> 또는 redis://<호스트>:<포트>)")
+
+
+# ---------------------------------------------------------------------------
+# RESP 대역 서버 (Redis가 없는 환경에서 여러 호스트가 공유)
+# ---------------------------------------------------------------------------
+
+class RespStore:
+    """
+    워커 큐에 필요한 Redis 명령 일부를 메모리에서 처리합니다. (명령 단위로 원자적)
+    """
+
+    def __init__(self):
+        self.data: Dict[str, object] = {}
+        self.lock = threading.Lock()
+
+    def execute(self, cmd: str, args: List[str]):
+        handler = getattr(self, "cmd_" + cmd.lower(), None)
+        if handler is None:
+            raise ValueError(f"ERR unknown command '{cmd}'")
+        with self.lock:
+            return handler(*args)
+
+    def cmd_ping(self, *args):
+        return "PONG"
+
+    def cmd_incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+    def cmd_rpush(self, key, *values):
+        lst = self.data.setdefault(key, [])
+        lst.extend(values)
+        return len(lst)
+
+    def cmd_lpop(self, key):
+        lst = self.data.get(key) or []
+        return lst.pop(0) if lst else None
+
+    def cmd_lmove(self, src, dst, wherefrom, whereto):
+        lst = self.data.get(src) or []
+        if not lst:
+            return None
+        value = lst.pop(0 if wherefrom.upper() == "LEFT" else -1)
+        target = self.data.setdefault(dst, [])
+        if whereto.upper() == "LEFT":
+            target.insert(0, value)
+        else:
+            target.append(value)
+        return value
+
+    def cmd_lrem(self, key, count, value):
+        lst = self.data.get(key) or []
+        count, removed = int(count), 0
+        order = range(len(lst) - 1, -1, -1) if count < 0 else range(len(lst))
+        hits = [i for i in order if lst[i] == value][:abs(count) or None]
+        for i in sorted(hits, reverse=True):
+            del lst[i]
+            removed += 1
+        return removed
+
+    def cmd_llen(self, key):
+        return len(self.data.get(key) or [])
+
+    def cmd_lrange(self, key, start, stop):
+        lst = self.data.get(key) or []
+        start, stop = int(start), int(stop)
+        return lst[start:(None if stop == -1 else stop + 1)]
+
+    def cmd_hset(self, key, *pairs):
+        h = self.data.setdefault(key, {})
+        added = sum(1 for f in pairs[::2] if f not in h)
+        h.update(zip(pairs[::2], pairs[1::2]))
+        return added
+
+    def cmd_hget(self, key, field):
+        return (self.data.get(key) or {}).get(field)
+
+    def cmd_hgetall(self, key):
+        return [x for kv in (self.data.get(key) or {}).items() for x in kv]
+
+    def cmd_hincrby(self, key, field, amount):
+        h = self.data.setdefault(key, {})
+        h[field] = str(int(h.get(field, 0)) + int(amount))
+        return int(h[field])
+
+    def cmd_zadd(self, key, *args):
+        # 옵션 NX/XX/CH + 점수/멤버 한 쌍만 지원
+        flags = {a.upper() for a in args[:-2]}
+        score, member = args[-2:]
+        z = self.data.setdefault(key, {})
+        exists = member in z
+        if ("NX" in flags and exists) or ("XX" in flags and not exists):
+            return 0
+        changed = not exists or z[member] != float(score)
+        z[member] = float(score)
+        return int(changed) if "CH" in flags else int(not exists)
+
+    def cmd_zscore(self, key, member):
+        score = (self.data.get(key) or {}).get(member)
+        return None if score is None else repr(score)
+
+    def cmd_zrem(self, key, member):
+        return 1 if (self.data.get(key) or {}).pop(member, None) is not None else 0
+
+    def cmd_zrangebyscore(self, key, lo, hi):
+        lo = float("-inf") if lo == "-inf" else float(lo)
+        hi = float("inf") if hi == "+inf" else float(hi)
+        z = self.data.get(key) or {}
+        return [m for m, s in sorted(z.items(), key=lambda kv: kv[1]) if lo <= s <= hi]
+
+    def cmd_del(self, *keys):
+        return sum(1 for k in keys if self.data.pop(k, None) is not None)
+
+
+def encode_reply(value) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, bool) or isinstance(value, int):
+        return b":%d\r\n" % int(value)
+    if isinstance(value, list):
+        return b"*%d\r\n" % len(value) + b"".join(encode_reply(v) for v in value)
+    if isinstance(value, str) and value == "PONG":
+        return b"+PONG\r\n"
+    b = str(value).encode("utf-8")
+    return b"$%d\r\n%s\r\n" % (len(b), b)
+
+
+def make_resp_handler(store: RespStore):
+    class RespHandler(socketserver.StreamRequestHandler):
+        disable_nagle_algorithm = True
+
+        def read_command(self) -> Optional[List[str]]:
+            line = self.rfile.readline()
+            if not line:
+                return None
+            if not line.startswith(b"*"):
+                return line.decode().split()
+            args = []
+            for _ in range(int(line[1:-2])):
+                n = int(self.rfile.readline()[1:-2])
+                args.append(self.rfile.read(n + 2)[:-2].decode("utf-8"))
+            return args
+
+        def handle(self):
+            while True:
+                args = self.read_command()
+                if args is None:
+                    return
+                if not args:
+                    continue
+                try:
+                    reply = encode_reply(store.execute(args[0], args[1:]))
+                except Exception as e:
+                    reply = f"-{e}\r\n".encode("utf-8")
+                self.wfile.write(reply)
+
+    return RespHandler
+
+
+def serve_resp(host: str = "127.0.0.1", port: int = 6380) -> socketserver.ThreadingTCPServer:
+    """
+    RESP 대역 서버를 백그라운드 스레드로 시작합니다. 종료는 server.shutdown()
+    """
+    socketserver.ThreadingTCPServer.allow_reuse_address = True
+    server = socketserver.ThreadingTCPServer((host, port), make_resp_handler(RespStore()))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# ---------------------------------------------------------------------------
+# 워커
+# ---------------------------------------------------------------------------
+
+def run_worker(queue_spec: str, store_path: Optional[str] = None, lease: float = DEFAULT_LEASE,
+               collect: Optional[Callable[[Dict], Dict]] = None, worker_id: Optional[str] = None) -> Dict:
+    """
+    큐가 빌 때까지 작업을 임대해 수집하고 결과를 저장소에 기록합니다.
+    collect(job)은 batch_crawl.crawl_channel과 같은 결과 dict({'ok','records','error','elapsed'})를 반환해야 합니다.
+    수집 중 하트비트가 실패했거나 저장 직전 임대를 다시 확인해 잃었으면(만료 후 다른 워커가 임대) 결과를 버립니다.
+    """
+    owner = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    queue = open_queue(queue_spec)
+    store = open_store(store_path) if store_path else None
+    collect = collect or crawl_channel
+    done = failed = lost = 0
+    try:
+        while True:
+            job = queue.claim(owner, lease=lease)
+            if job is None:
+                break
+            stop = threading.Event()
+            expired = threading.Event()
+            # 하트비트는 별도 연결로 보냄 (수집 중에도 임대 연장)
+            beat_queue = open_queue(queue_spec)
+
+            def beat():
+                while not stop.wait(lease / 3):
+                    if not beat_queue.heartbeat(job["id"], owner, lease=lease):
+                        expired.set()
+                        return
+
+            beater = threading.Thread(target=beat, daemon=True)
+            beater.start()
+            try:
+                res = collect(job)
+            finally:
+                stop.set()
+                beater.join()
+                beat_queue.close()
+            # 저장 직전 임대 재확인 (하트비트로 연장까지)
+            if expired.is_set() or not queue.heartbeat(job["id"], owner, lease=lease):
+                lost += 1
+                print(f"[{owner}] 임대 만료로 결과를 버립니다: {job['platform']} | {job['name']}")
+                continue
+            if res.get("ok"):
+                if store is not None:
+                    save_round(store, job["platform"], job["name"], res["records"],
+                               time.strftime("%Y-%m-%d %H:%M:%S"))
+                if queue.complete(job["id"], owner, res.get("elapsed", 0.0)):
+                    done += 1
+                    print(f"[{owner}] 완료: {job['platform']} | {job['name']} | {len(res['records'])}개 | {res.get('elapsed', 0):.1f}초")
+                else:
+                    lost += 1
+                    print(f"[{owner}] 완료 처리 실패(임대 만료): {job['platform']} | {job['name']}")
+            elif queue.fail(job["id"], owner, res.get("error") or "알 수 없는 오류"):
+                failed += 1
+                print(f"[{owner}] 실패({job['attempts']}회차): {job['platform']} | {job['name']} | {res.get('error')}")
+            else:
+                lost += 1
+                print(f"[{owner}] 실패 기록 건너뜀(임대 만료): {job['platform']} | {job['name']}")
+    finally:
+        queue.close()
+        if store is not None:
+            store.close()
+    return {"owner": owner, "done": done, "failed": failed, "lost": lost}
+
+
+def browser_worker_main(queue_spec: str, store_path: Optional[str], lease: float, headless: bool, lightweight: bool,
+                        start_lock):
+    init_worker(start_lock, headless, lightweight)
+    try:
+        run_worker(queue_spec, store_path, lease=lease)
+    finally:
+        # Process 자식은 os._exit로 끝나므로 브라우저를 여기서 직접 종료
+        close_worker_driver()
+
+
+def start_worker_processes(n: int, target, args: tuple) -> List[mp.Process]:
+    procs = [mp.Process(target=target, args=args) for _ in range(n)]
+    for p in procs:
+        p.start()
+    return procs
+
+
+# ---------------------------------------------------------------------------
+# 처리량 데모 (브라우저 대신 고정 시간이 걸리는 작업)
+# ---------------------------------------------------------------------------
+
+def simulated_collect(job: Dict, seconds: float) -> Dict:
+    time.sleep(seconds)
+    return {"ok": True, "records": [], "error": None, "elapsed": seconds}
+
+
+def demo_worker_main(queue_spec: str, seconds: float):
+    run_worker(queue_spec, collect=lambda job: simulated_collect(job, seconds))
+
+
+def run_demo(queue_spec: str, process_counts: List[int], jobs: int, seconds: float):
+    print(f"처리량 데모: 작업 {jobs}개 × {seconds}초, 큐 {queue_spec}")
+    base = None
+    for n in process_counts:
+        queue = open_queue(queue_spec)
+        queue.clear()
+        queue.enqueue([{"platform": "youtube", "name": f"demo-{i}", "url": None} for i in range(jobs)])
+        queue.close()
+        started = time.perf_counter()
+        for p in start_worker_processes(n, demo_worker_main, (queue_spec, seconds)):
+            p.join()
+        elapsed = time.perf_counter() - started
+        queue = open_queue(queue_spec)
+        stats = queue.stats()
+        queue.close()
+        rate = stats["done"] / elapsed
+        base = base or rate
+        print(f"워커 {n:>2}개: {elapsed:6.2f}초, {rate:6.2f} 작업/초 (워커 1개 대비 {rate / base:.2f}배) | {stats}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="분산 수집 작업 큐")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("serve-resp", help="RESP(Redis 호환) 대역 서버 실행")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=6380)
+
+    p = sub.add_parser("enqueue", help="채널 목록을 작업으로 등록")
+    p.add_argument("channels")
+    p.add_argument("--queue", default="sqlite:queue.db")
+    p.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS)
+
+    p = sub.add_parser("worker", help="작업을 임대해 수집 (큐가 비면 종료)")
+    p.add_argument("--queue", default="sqlite:queue.db")
+    p.add_argument("--store", default="crawl.db", help="결과를 기록할 SQLite 저장소")
+    p.add_argument("--processes", type=int, default=1, help="이 노드에서 띄울 워커 프로세스(브라우저) 수")
+    p.add_argument("--lease", type=float, default=DEFAULT_LEASE)
+    p.add_argument("--show-browser", action="store_true")
+
+    p = sub.add_parser("stats", help="작업 상태별 개수")
+    p.add_argument("--queue", default="sqlite:queue.db")
+
+    p = sub.add_parser("demo", help="워커 수에 따른 처리량 측정 (브라우저 없이 고정 시간 작업)")
+    p.add_argument("--queue", default="sqlite:queue_demo.db")
+    p.add_argument("--processes", default="1,2,4")
+    p.add_argument("--jobs", type=int, default=40)
+    p.add_argument("--job-seconds", type=float, default=0.5)
+
+    args = parser.parse_args()
+    if args.command == "serve-resp":
+        server = serve_resp(args.host, args.port)
+        print(f"RESP 대역 서버 실행 중: redis://{args.host}:{args.port} (Ctrl+C로 종료)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            server.shutdown()
+    elif args.command == "enqueue":
+        queue = open_queue(args.queue)
+        n = queue.enqueue(load_channel_list(args.channels), max_attempts=args.max_attempts)
+        print(f"작업 {n}개 등록: {args.queue} | {queue.stats()}")
+        queue.close()
+    elif args.command == "worker":
+        with mp.Manager() as manager:
+            procs = start_worker_processes(args.processes, browser_worker_main,
+                                           (args.queue, args.store, args.lease, not args.show_browser, True,
+                                            manager.Lock()))
+            for proc in procs:
+                proc.join()
+        queue = open_queue(args.queue)
+        print(f"워커 종료 | {queue.stats()}")
+        queue.close()
+    elif args.command == "stats":
+        queue = open_queue(args.queue)
+        print(queue.stats())
+        queue.close()
+    elif args.command == "demo":
+        run_demo(args.queue, [int(x) for x in args.processes.split(",")], args.jobs, args.job_seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
+import json
 import time
 from datetime import datetime
 import re
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, Iterator, List, Dict, Optional, Set, Tuple
 
 import pandas as pd
 import undetected_chromedriver as uc
@@ -10,15 +11,43 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-
-def infinite_scroll(driver, scroll_count):
+from browser import capture_response_bodies, drain_network_stats, lightweight_collection
+from browser_pool import BrowserPool
+from change_probe import PROBE_SIZE, collect_with_probe
+from channel_cache import collect_with_channel_cache, lookup_channel_url
+from checkpoint import checkpoint_path, checkpointing_stop_when, clear_checkpoint, load_checkpoint, merge_resumed
+from csv_output import manifest_path, write_csv_if_changed
+from incremental import FRONTIER_SCRIPT, make_frontier_check, merge_with_cache, plan_round, records_from_frame
+from memory_watchdog import MemoryWatchdog, maintain
+from overlays import dismiss_overlays
+from page_loader import count_items, observe_scroll_until_no_new, scroll_and_wait_for_new
+from parquet_export import append_round, require_pyarrow
+from parsing import extract_video_id, parse_duration_to_seconds, parse_views_generic
+from storage import latest_catalog, open_store, save_round
+from streaming import clear_partial_csv, drain, make_partial_csv_sink, make_store_sink, scroll_step, stream_new_items
+from video_index import update_index
+from youtube_data import records_from_payloads
+from youtube_http import (collect_channel_videos_http, create_session, probe_first_page_http, resume_from_checkpoint,
+                          search_channel_url, videos_tab_url)
+
+
+def infinite_scroll(driver, scroll_count, item_selector: Optional[str] = None, idle_timeout: float = 3.0):
     """
     지정된 횟수만큼 페이지를 아래로 스크롤하여 동적 콘텐츠를 로드합니다.
 
     :param driver: Selenium WebDriver 인스턴스
     :param scroll_count: 스크롤할 횟수
+    :param item_selector: 지정하면 고정 2초 대신 해당 항목이 새로 추가될 때까지만 대기합니다.
+    :param idle_timeout: item_selector 지정 시 최대 대기 시간 (초)
     """
     print(f"{scroll_count}회 스크롤을 시작합니다.")
+    if item_selector:
+        count = 0
+        for i in range(scroll_count):
+            res = scroll_and_wait_for_new(driver, item_selector, count, idle_timeout=idle_timeout)
+            count = int(res.get("count") or 0)
+            print(f"{i + 1}회 스크롤 완료. 항목 {count}개 ({res.get('elapsedMs')}ms)")
+        return
     for i in range(scroll_count):
         # 현재 문서의 높이를 가져와서 해당 높이만큼 스크롤
         driver.execute_script("window.scrollTo(0, document.documentElement.scrollHeight);")
@@ -27,7 +56,8 @@ def infinite_scroll(driver, scroll_count):
         print(f"{i + 1}회 스크롤 완료.")
 
 
-def smart_scroll_until_no_new(driver, item_selector: str, max_scrolls: int = 30, pause: float = 1.5):
+def smart_scroll_until_no_new(driver, item_selector: str, max_scrolls: int = 30, pause: float = 1.5, stop_when: Optional[Callable[[], bool]] = None,
+                              use_observer: bool = True, idle_timeout: float = 3.0):
     """
     스크롤을 반복하여 새로운 아이템이 더 이상 로드되지 않을 때까지 시도합니다.
 
@@ -35,10 +65,22 @@ def smart_scroll_until_no_new(driver, item_selector: str, max_scrolls: int = 30,
     :param item_selector: 수집 대상 요소의 CSS 선택자 (예: 'ytd-rich-grid-media')
     :param max_scrolls: 최대 스크롤 횟수
     :param pause: 스크롤 간 대기 시간 (초)
+    :param stop_when: 스크롤 전마다 호출되며 True를 반환하면 즉시 종료 (증분 수집의 프런티어 검사 등)
+    :param use_observer: True이면 MutationObserver로 새 항목이 실제로 추가될 때까지만 대기 (실패 시 고정 대기 방식)
+    :param idle_timeout: use_observer 모드에서 새 항목이 없다고 판단하는 유휴 시간 (초)
     """
+    if use_observer:
+        try:
+            observe_scroll_until_no_new(driver, item_selector, max_scrolls=max_scrolls, idle_timeout=idle_timeout, stop_when=stop_when)
+            return
+        except Exception as e:
+            print(f"이벤트 기반 스크롤 실패 → 고정 대기 스크롤로 대체: {e}")
     last_count = 0
     stagnant_rounds = 0
     for i in range(max_scrolls):
+        if stop_when and stop_when():
+            print("중단 조건 충족. 스크롤 종료.")
+            break
         driver.execute_script("window.scrollTo(0, document.documentElement.scrollHeight);")
         time.sleep(pause)
         items = driver.find_elements(By.CSS_SELECTOR, item_selector)
@@ -55,76 +97,6 @@ def smart_scroll_until_no_new(driver, item_selector: str, max_scrolls: int = 30,
             break
 
 
-def parse_duration_to_seconds(text: str) -> Optional[int]:
-    if not text:
-        return None
-    t = re.sub(r"\s+", "", text).upper()
-    if any(k in t for k in ["LIVE", "실시간", "스트리밍", "PREMIERE", "예정"]):
-        return None
-    # expected HH:MM:SS or MM:SS
-    m = re.match(r"^(?:(\d+):)?(\d{1,2}):(\d{2})$", t)
-    if not m:
-        return None
-    h = int(m.group(1) or 0)
-    m_ = int(m.group(2))
-    s = int(m.group(3))
-    return h * 3600 + m_ * 60 + s
-
-
-def parse_korean_views(text: str) -> Optional[int]:
-    """
-    다양한 조회수 표기 문자열을 정수로 변환합니다.
-    예: '조회수 1,234회', '조회수 2.3만회', '1.2천회', '1,234 views', '1.2K views', '2.3M views', 'No views'
-    변환 실패 시 None 반환.
-    """
-    if not text:
-        return None
-    raw = text.strip()
-    lower = raw.lower()
-
-    # 명시적인 0 처리
-    if any(k in lower for k in ["no views", "조회수 없음", "조회수없음"]):
-        return 0
-
-    # 공통 정리
-    t = raw
-    t = t.replace("조회수", "").replace("회", "").strip()
-    t = re.sub(r"\s+", "", t)
-
-    # 한국어 단위: 억, 만, 천
-    m = re.match(r"^([0-9]+(?:\.[0-9]+)?)(억|만|천)?$", t)
-    if m:
-        num = float(m.group(1))
-        unit = m.group(2)
-        if unit == "억":
-            num *= 100_000_000
-        elif unit == "만":
-            num *= 10_000
-        elif unit == "천":
-            num *= 1_000
-        return int(num)
-
-    # 영어 단위: K, M, B
-    m_en = re.match(r"^([0-9]+(?:\.[0-9]+)?)([KMBkmb])?$", re.sub(r"[^0-9KMBkmb\.]", "", lower))
-    if m_en:
-        num = float(m_en.group(1))
-        unit = (m_en.group(2) or '').upper()
-        if unit == 'K':
-            num *= 1_000
-        elif unit == 'M':
-            num *= 1_000_000
-        elif unit == 'B':
-            num *= 1_000_000_000
-        return int(num)
-
-    # 숫자만 추출 (쉼표 포함)
-    m2 = re.search(r"([0-9][0-9,]*)", raw)
-    if m2:
-        return int(m2.group(1).replace(",", ""))
-
-    return None
-
-
 def extract_views_text_from_card(card) -> Optional[str]:
     """
     카드 요소에서 조회수 텍스트를 최대한 다양한 방법으로 추출합니다.
@@ -284,6 +256,200 @@ def extract_title_and_url_from_card(card) -> Tuple[Optional[str], Optional[str],
     return None, None, "not-found"
 
 
+# 채널 동영상 탭의 한 번 로드 분량 (증분 수집에서 '한 페이지'로 사용)
+YOUTUBE_PAGE_SIZE = 30
+
+# 카드 전체를 한 번의 execute_script로 읽어오는 스크립트.
+# 선택 우선순위는 extract_title_and_url_from_card / extract_views_text_from_card /
+# extract_duration_from_card와 동일하게 유지하고, 숫자 변환은 파이썬 파서가 담당합니다.
+BULK_CARD_SCRIPT = r"""
+const cards = Array.prototype.slice.call(document.querySelectorAll(arguments[0]), arguments[1] || 0);
+const text = (el) => el ? (el.textContent || '').replace(/\s+/g, ' ').trim() : '';
+const out = [];
+for (const card of cards) {
+  const q = (sel) => card.querySelector(sel);
+  const thumb = q('a#thumbnail');
+  const titleLink = q('a#video-title');
+  let title = '', href = '', method = 'not-found';
+  const fromLink = (name, a) => {
+    if (title || !a) return;
+    const t = (a.getAttribute('title') || text(a)).trim();
+    if (t) { title = t; href = a.href || ''; method = name; }
+  };
+  fromLink('a#video-title', titleLink);
+  if (!title) {
+    const ft = text(q('yt-formatted-string#video-title'));
+    if (ft) {
+      const la = thumb || q("a[href*='watch']");
+      title = ft; href = la ? (la.href || '') : ''; method = 'yt-formatted-string#video-title + thumbnail';
+    }
+  }
+  fromLink('a#video-title-link', q('a#video-title-link'));
+  fromLink('h3 a', q('h3 a'));
+  if (!title && thumb) {
+    const aria = (thumb.getAttribute('aria-label') || '').trim();
+    const m = aria.match(/^([^,|]+)/);
+    title = m ? m[1].trim() : aria;
+    href = thumb.href || '';
+    method = title ? 'thumbnail aria-label' : 'not-found';
+  }
+  const meta = [];
+  card.querySelectorAll('#metadata-line span.inline-metadata-item, ytd-video-meta-block span')
+    .forEach((sp) => { const t = text(sp); if (t) meta.push(t); });
+  const overlay = q('ytd-thumbnail-overlay-time-status-renderer span#text')
+    || q('ytd-thumbnail-overlay-time-status-renderer #text')
+    || q('ytd-thumbnail-overlay-time-status-renderer');
+  out.push({
+    title: title, href: href, method: method, meta: meta,
+    duration: text(overlay),
+    thumb_aria: thumb ? (thumb.getAttribute('aria-label') || '') : '',
+    title_aria: titleLink ? (titleLink.getAttribute('aria-label') || '') : '',
+  });
+}
+return JSON.stringify(out);
+"""
+
+
+def extract_cards_bulk(driver, item_selector: str = "ytd-rich-grid-media", start: int = 0) -> Optional[List[Dict]]:
+    """
+    페이지 내 스크립트 한 번으로 모든 카드(start번째부터)의 제목/URL/조회수/길이 원문을 JSON 배열로 가져옵니다.
+    스크립트 실행에 실패하면 None을 반환하여 호출 측이 카드별 추출로 대체하도록 합니다.
+    """
+    try:
+        raw = driver.execute_script(BULK_CARD_SCRIPT, item_selector, start)
+        items = json.loads(raw) if raw else []
+    except Exception as e:
+        print(f"일괄 카드 추출 실패 → 카드별 추출로 대체합니다: {e}")
+        return None
+    return items
+
+
+# 추출이 끝난 카드를 그리드에서 제거하는 스크립트. arguments: itemSelector, processed(앞에서부터 추출을 마친 카드 수), keep
+# 추출한 카드 중 마지막 keep개는 남겨 그리드 높이/스크롤 위치와 다음 페이지 로딩(continuation) 트리거를 유지합니다.
+# 반환: {removed, pruned(누적 제거 수), live(남은 카드 수), nodes(문서 전체 노드 수), heap(JS 힙 바이트)}
+PRUNE_PROCESSED_SCRIPT = r"""
+const [selector, processed, keep] = arguments;
+const cards = document.querySelectorAll(selector);
+const upto = Math.min(processed, cards.length) - keep;
+let removed = 0;
+for (let i = 0; i < upto; i++) {
+  const item = cards[i].closest('ytd-rich-item-renderer') || cards[i];
+  item.remove();
+  removed++;
+}
+window.__acPruned = (window.__acPruned || 0) + removed;
+return {
+  removed: removed, pruned: window.__acPruned, live: document.querySelectorAll(selector).length,
+  nodes: document.getElementsByTagName('*').length,
+  heap: performance.memory ? performance.memory.usedJSHeapSize : null,
+};
+"""
+
+
+def views_text_to_int(views_text: Optional[str]) -> Optional[int]:
+    """
+    조회수 원문('조회수 1.2만회', '1.2K views' 등)을 정수로 변환합니다.
+    """
+    return parse_views_generic(views_text)
+
+
+def fields_from_bulk_item(item: Dict) -> Tuple[Optional[str], Optional[str], str, Optional[str], Optional[str], Optional[int]]:
+    """
+    extract_cards_bulk 결과 항목 하나를 카드별 추출과 같은 형태로 변환합니다.
+    반환: (title, url, method, views_text, duration_str, duration_seconds)
+    """
+    title = (item.get("title") or "").strip() or None
+    href = item.get("href") or None
+    method = f"bulk:{item.get('method') or 'not-found'}"
+
+    views_text = None
+    for txt in item.get("meta") or []:
+        if ("조회수" in txt) or ("views" in txt.lower()):
+            views_text = txt
+            break
+    if views_text is None:
+        for aria in (item.get("thumb_aria") or "", item.get("title_aria") or ""):
+            m = re.search(r"(조회수\s*[^\s]+회|[0-9][0-9,\.]*\s+views)", aria, flags=re.IGNORECASE)
+            if m:
+                views_text = m.group(1)
+                break
+
+    duration_str, duration_sec = None, None
+    raw = re.sub(r"\s+", "", item.get("duration") or "")
+    seconds = parse_duration_to_seconds(raw)
+    if seconds is not None:
+        duration_str, duration_sec = raw, seconds
+    else:
+        m = re.search(r"(\d{1,2}:\d{2}(?::\d{2})?)", item.get("thumb_aria") or "")
+        if m:
+            duration_str = m.group(1)
+            duration_sec = parse_duration_to_seconds(duration_str)
+
+    return title, href, method, views_text, duration_str, duration_sec
+
+
+def fields_from_card(driver, card, settle: float) -> Tuple[Optional[str], Optional[str], str, Optional[str], Optional[str], Optional[int]]:
+    """
+    카드 WebElement 하나에서 요소별 WebDriver 호출로 필드를 추출합니다. (일괄 추출 실패 시 대체 경로)
+    반환: (title, url, method, views_text, duration_str, duration_seconds)
+    """
+    # 카드 가시화 → 지연 로딩된 메타데이터를 유도
+    try:
+        driver.execute_script("arguments[0].scrollIntoView({block:'center'});", card)
+        time.sleep(settle)
+    except Exception:
+        pass
+    title, href, tmethod = extract_title_and_url_from_card(card)
+    views_text = extract_views_text_from_card(card)
+    duration_str, duration_sec = extract_duration_from_card(card)
+    return title, href, tmethod, views_text, duration_str, duration_sec
+
+
+def card_field_getters(driver, item_selector: str, bulk: bool = True, settle: float = 0.15) -> List:
+    """
+    카드별 필드 추출 함수 목록을 반환합니다.
+    bulk=True이면 일괄 추출 결과를 사용하고, 실패 시 기존 카드별 추출 경로로 대체합니다.
+    """
+    if bulk:
+        items = extract_cards_bulk(driver, item_selector)
+        if items is not None:
+            print(f"일괄 추출된 카드 수: {len(items)}")
+            return [lambda it=it: fields_from_bulk_item(it) for it in items]
+    cards = driver.find_elements(By.CSS_SELECTOR, item_selector)
+    print(f"카드별 추출 대상 카드 수: {len(cards)}")
+    return [lambda c=c: fields_from_card(driver, c, settle) for c in cards]
+
+
+def records_from_card_getters(getters: List, verbose: bool = True) -> List[Dict]:
+    """
+    card_field_getters 결과를 수집 레코드 목록으로 변환합니다. (verbose=False이면 카드별 로그 생략)
+    같은 영상(watch?v= ID 기준)이 여러 카드로 보이면 첫 카드만 남깁니다.
+    """
+    results: List[Dict] = []
+    seen_ids = set()
+    for idx, get_fields in enumerate(getters, 1):
+        try:
+            title, href, tmethod, vtxt, dstr, dsec = get_fields()
+            vid = extract_video_id(href)
+            if vid and vid in seen_ids:
+                continue
+            seen_ids.add(vid)
+            views = views_text_to_int(vtxt)
+            results.append({
+                "index": len(results) + 1,
+                "title": title or "",
+                "views": int(views) if views is not None else None,
+                "url": href,
+                "duration": dstr,
+                "duration_seconds": dsec,
+            })
+            if verbose:
+                print(f"- [{len(results)}] {title} | 조회수: {views} | 길이: {dstr} | {tmethod}")
+        except Exception as e:
+            print(f"카드 수집 실패 [{idx}]: {e}")
+    return results
+
+
 def wait_for(driver, by, value, timeout: int = 15):
     return WebDriverWait(driver, timeout).until(EC.presence_of_element_located((by, value)))
 
@@ -296,25 +462,10 @@ def wait_click_xpath(driver, xpath: str, timeout: int = 15):
 
 def try_dismiss_overlays(driver):
     """
-    쿠키 동의/로그인 유도 등 클릭을 방해하는 오버레이를 닫습니다.
-    실패해도 예외를 던지지 않습니다.
-    """
-    candidates = [
-        # 쿠키 동의 (KR/EN 변형)
-        "//button[.//span[contains(., '동의')]]",
-        "//button[normalize-space()='동의함']",
-        "//button[contains(., 'I agree')]",
-        "//button[contains(., 'Accept all')]",
-        # 로그인 유도 닫기 X
-        "//button[@aria-label='닫기' or @aria-label='Close']",
-    ]
-    for xp in candidates:
-        try:
-            el = WebDriverWait(driver, 2).until(EC.element_to_be_clickable((By.XPATH, xp)))
-            el.click()
-            print(f"오버레이를 닫았습니다: {xp}")
-        except Exception:
-            pass
+    쿠키 동의/로그인 유도 등 클릭을 방해하는 오버레이를 한 번의 페이지 내 조회로 닫습니다.
+    보이는 후보가 없으면 대기 없이 반환하며, 실패해도 예외를 던지지 않습니다. (패턴: overlays.OVERLAY_PATTERNS["youtube"])
+    """
+    dismiss_overlays(driver, "youtube")
 
 
 def nav_to_videos_tab(driver):
@@ -367,13 +518,15 @@ def nav_to_videos_tab(driver):
         return False
 
 
-def scrape_channel_and_play_lowest(channel_name: str, save_csv: bool = False, play_seconds: int = 20, close_on_finish: bool = True) -> List[Dict]:
+def scrape_channel_and_play_lowest(channel_name: str, save_csv: bool = False, play_seconds: int = 20, close_on_finish: bool = True, bulk: bool = True) -> List[Dict]:
     """
     1) 유튜브 접속 → 채널명 검색
     2) 해당 채널로 이동 후 '동영상' 탭 진입
     3) 모든 동영상의 제목/조회수/URL 수집
     4) 조회수 가장 낮은 동영상을 클릭하여 재생
     5) 수집 데이터 반환, 옵션으로 CSV 저장
+
+    bulk=True이면 카드 정보를 페이지 내 스크립트 한 번으로 일괄 추출합니다. (실패 시 카드별 추출)
     """
     print("브라우저를 초기화합니다 (undetected-chromedriver)...")
     driver = uc.Chrome()
@@ -442,39 +595,20 @@ def scrape_channel_and_play_lowest(channel_name: str, save_csv: bool = False, pl
         print("스크롤을 종료합니다.")
 
         print("영상 정보 수집을 시작합니다.")
-        cards = driver.find_elements(By.CSS_SELECTOR, "ytd-rich-grid-media")
-        print(f"감지된 카드 수: {len(cards)}")
+        getters = card_field_getters(driver, "ytd-rich-grid-media", bulk=bulk, settle=0.25)
+        print(f"감지된 카드 수: {len(getters)}")
 
         scraped: List[Dict] = []
-        for idx, card in enumerate(cards, 1):
+        for idx, get_fields in enumerate(getters, 1):
             try:
-                # 카드 가시화 → 지연 로딩된 메타데이터를 유도
-                try:
-                    driver.execute_script("arguments[0].scrollIntoView({block:'center'});", card)
-                    time.sleep(0.25)
-                except Exception:
-                    pass
-
-                title, href, tmethod = extract_title_and_url_from_card(card)
-
-                # 조회수 텍스트 다양한 방식으로 추출
-                views_text = extract_views_text_from_card(card)
+                title, href, tmethod, views_text, duration_str, duration_sec = get_fields()
                 if views_text is None:
                     print(f"  · [{idx}] 조회수 텍스트를 찾지 못했습니다. 다른 형식일 수 있습니다.")
-
-                # 길이 추출
-                duration_str, duration_sec = extract_duration_from_card(card)
                 if duration_sec is None:
                     print(f"  · [{idx}] 재생 길이 추출 실패 → 기본값 미설정")
 
                 # 숫자 변환 (한글/영문 혼합 처리)
-                vt = views_text or ""
-                if "views" in vt.lower() and "조회수" not in vt:
-                    # '1,234 views' → 숫자만 추출 후 한국어 포맷으로 위임
-                    mnum = re.search(r"([0-9][0-9,\.]*)\s*[KMBkmb]?", vt)
-                    if mnum:
-                        vt = mnum.group(1)
-                views_val = parse_korean_views(vt)
+                views_val = views_text_to_int(views_text)
                 if title and (views_val is not None):
                     scraped.append({"index": idx, "title": title, "views": views_val, "url": href, "duration": duration_str, "duration_seconds": duration_sec})
                     url_msg = href if href else "URL 없음"
@@ -558,13 +692,84 @@ def scrape_channel_and_play_lowest(channel_name: str, save_csv: bool = False, pl
             driver.quit()
 
 
-def collect_channel_videos(driver, channel_name: str) -> List[Dict]:
-    print(f"채널 '{channel_name}'의 모든 동영상 정보를 수집합니다.")
-    # 채널로 이동하여 동영상 탭 표시
-    print("채널 이동 및 동영상 탭 로드 중...")
-    # 재사용: 검색 → 채널 클릭 → 동영상 탭 이동
-    # 아래는 scrape_channel_and_play_lowest와 유사한 흐름이므로 간단화하여 호출
-    # 1) 메인 이동 → 검색
+def records_from_network_capture(driver, item_selector: str = "ytd-rich-grid-media") -> Optional[List[Dict]]:
+    """
+    스크롤 중 페이지가 받아온 youtubei/v1/browse 응답과 window.ytInitialData에서 레코드를 만듭니다.
+    DOM은 로드된 카드의 영상 ID와 대조하는 데만 사용합니다.
+    캡처를 쓸 수 없거나 DOM에 있는 영상이 응답에서 빠져 있으면 None (→ DOM 추출로 대체)
+    """
+    try:
+        bodies = capture_response_bodies(driver, "/youtubei/v1/browse")
+    except Exception as e:
+        print(f"네트워크 캡처 실패 → DOM 추출로 대체: {e}")
+        return None
+    payloads: List[Dict] = []
+    try:
+        initial = driver.execute_script("return window.ytInitialData ? JSON.stringify(window.ytInitialData) : null;")
+        if initial:
+            payloads.append(json.loads(initial))
+    except Exception as e:
+        print(f"ytInitialData 읽기 실패: {e}")
+    payloads.extend(bodies)
+    records = records_from_payloads(payloads)
+
+    total, hrefs = driver.execute_script(FRONTIER_SCRIPT, item_selector, 1_000_000)
+    dom_ids = {vid for vid in (extract_video_id(h) for h in hrefs) if vid}
+    net_ids = {extract_video_id(r["url"]) for r in records}
+    missing = dom_ids - net_ids
+    print(f"네트워크 캡처: 응답 {len(bodies)}개 → 레코드 {len(records)}개 | DOM 카드 {total}개, 응답에 없는 카드 {len(missing)}개")
+    if not records or missing:
+        print("네트워크 캡처 결과가 DOM과 일치하지 않습니다 → DOM 추출로 대체")
+        return None
+    return records
+
+
+# 체크포인트용: 그리드 끝의 continuation 토큰과 InnerTube 설정 (토큰부터 HTTP로 재개할 때 사용)
+CONTINUATION_STATE_SCRIPT = r"""
+const conts = document.querySelectorAll('ytd-rich-grid-renderer ytd-continuation-item-renderer');
+const el = conts[conts.length - 1];
+const d = el && (el.data || (el.__data && el.__data.data));
+let token = null;
+try { token = d.continuationEndpoint.continuationCommand.token || null; } catch (e) {}
+const cfg = (window.ytcfg && typeof ytcfg.get === 'function') ? ytcfg : null;
+return [token, cfg ? cfg.get('INNERTUBE_API_KEY') : null, cfg ? cfg.get('INNERTUBE_CLIENT_VERSION') : null];
+"""
+
+
+def youtube_checkpoint_snapshot(driver, item_selector: str) -> Dict:
+    """
+    지금까지 로드된 카드의 레코드와 다음 페이지 continuation 토큰을 체크포인트 상태로 만듭니다.
+    """
+    items = extract_cards_bulk(driver, item_selector) or []
+    records = records_from_card_getters([lambda it=it: fields_from_bulk_item(it) for it in items], verbose=False)
+    token, api_key, client_version = driver.execute_script(CONTINUATION_STATE_SCRIPT)
+    return {"records": records, "items": len(items), "continuation": token, "api_key": api_key,
+            "client_version": client_version}
+
+
+def resume_with_continuation(resumed: Dict, checkpoint_path: str) -> Optional[List[Dict]]:
+    """
+    체크포인트에 continuation 토큰이 있으면 스크롤 없이 토큰부터 HTTP로 남은 목록만 받아 이어 붙입니다. 실패 시 None
+    """
+    if not resumed.get("continuation"):
+        return None
+    session = create_session()
+    try:
+        records = resume_from_checkpoint(session, resumed, checkpoint_path=checkpoint_path)
+    except Exception as e:
+        print(f"continuation 토큰으로 재개 실패 → 목록을 다시 내려가며 수집: {type(e).__name__}: {e}")
+        return None
+    finally:
+        session.close()
+    clear_checkpoint(checkpoint_path)
+    print(f"체크포인트 재개 완료: {len(records)}개")
+    return records
+
+
+def open_channel_by_search(driver, channel_name: str):
+    """
+    유튜브 메인에서 채널명을 검색하고 채널 페이지로 이동합니다.
+    """
     driver.get("https://www.youtube.com/")
     wait_for(driver, By.NAME, "search_query")
     sb = driver.find_element(By.NAME, "search_query")
@@ -582,45 +787,177 @@ def collect_channel_videos(driver, channel_name: str) -> List[Dict]:
         el = WebDriverWait(driver, 8).until(EC.element_to_be_clickable((By.XPATH, "//ytd-channel-renderer//a[@id='main-link']")))
         el.click()
     WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "tabsContent")))
-    ok = nav_to_videos_tab(driver)
+
+
+def open_videos_tab_url(driver, channel_url: str) -> bool:
+    """
+    채널 URL의 /videos 탭으로 바로 이동합니다. (검색 단계 생략)
+    """
+    target = videos_tab_url(channel_url)
+    print(f"채널 동영상 탭으로 직접 이동: {target}")
+    driver.get(target)
+    try_dismiss_overlays(driver)
+    try:
+        WebDriverWait(driver, 12).until(EC.presence_of_element_located((By.TAG_NAME, "ytd-rich-grid-renderer")))
+        return True
+    except Exception:
+        print("동영상 그리드 감지 실패.")
+        return False
+
+
+def collect_channel_videos(driver, channel_name: str, bulk: bool = True, known_ids: Optional[Set[str]] = None,
+                           network_capture: bool = False, channel_url: Optional[str] = None,
+                           checkpoint_path: Optional[str] = None, prune: bool = False) -> List[Dict]:
+    """
+    channel_url이 주어지면 검색 없이 해당 채널의 /videos 탭으로 바로 이동합니다.
+
+    known_ids가 주어지면 증분 모드로 동작합니다: 목록 끝의 한 페이지가 모두 알려진 ID이면 스크롤을 멈추고
+    그때까지 로드된 앞부분만 반환합니다. (캐시와의 병합은 호출 측에서 merge_with_cache로 수행)
+
+    network_capture=True이면 카드를 다시 읽지 않고 스크롤 중 수신한 browse 응답 JSON에서 레코드를 만듭니다.
+    (build_chrome_options(performance_log=True)로 만든 브라우저 필요, 실패 시 DOM 추출로 대체)
+
+    checkpoint_path가 주어지면 스크롤 중 주기적으로 레코드와 continuation 토큰을 저장하고(checkpoint.py),
+    다음 호출에서 토큰부터 HTTP로 이어서 수집합니다. (토큰 재개 실패 시 다시 스크롤하고 체크포인트 레코드를 병합)
+
+    prune=True이면 스크롤마다 새 카드를 추출한 뒤 추출한 카드를 그리드에서 제거합니다. (stream_channel_grid,
+    업로드가 수천 개인 채널에서 DOM/렌더러 메모리를 일정하게 유지, 네트워크 캡처/주기적 체크포인트는 사용하지 않음)
+    """
+    print(f"채널 '{channel_name}'의 모든 동영상 정보를 수집합니다.")
+    resumed = load_checkpoint(checkpoint_path)
+    if resumed:
+        records = resume_with_continuation(resumed, checkpoint_path)
+        if records is not None:
+            return records
+        resumed = load_checkpoint(checkpoint_path) or resumed
+    # 채널로 이동하여 동영상 탭 표시
+    print("채널 이동 및 동영상 탭 로드 중...")
+    if not channel_url:
+        # 검색 → 채널 클릭 (동영상 탭 이동은 아래에서)
+        open_channel_by_search(driver, channel_name)
+    if network_capture:
+        # 검색/채널 홈 단계의 응답은 버림 (동영상 탭 진입 이후 응답만 사용)
+        try:
+            drain_network_stats(driver)
+        except Exception as e:
+            print(f"performance 로그를 사용할 수 없습니다 → DOM 추출: {e}")
+            network_capture = False
+    ok = open_videos_tab_url(driver, channel_url) if channel_url else nav_to_videos_tab(driver)
     if not ok:
         raise RuntimeError("동영상 탭 로드 실패")
     time.sleep(1)
 
+    if prune:
+        print("스크롤마다 새 카드를 추출하고 추출한 카드는 그리드에서 제거합니다.")
+        if checkpoint_path:
+            print("경고: 카드 정리(prune) 모드에서는 주기적 체크포인트를 저장하지 않습니다. (기존 체크포인트 병합만 수행)")
+        records = drain(stream_channel_grid(driver, bulk=bulk, known_ids=known_ids, prune=True), [])
+        records = merge_resumed(records, resumed)
+        clear_checkpoint(checkpoint_path)
+        return records
+
     # 모든 동영상이 로드될 때까지 스마트 스크롤
     print("모든 동영상을 로드하기 위해 스크롤을 시작합니다.")
-    smart_scroll_until_no_new(driver, "ytd-rich-grid-media", max_scrolls=100, pause=1.0)
-    cards = driver.find_elements(By.CSS_SELECTOR, "ytd-rich-grid-media")
-    print(f"수집 대상 카드 수: {len(cards)}")
-    results: List[Dict] = []
-    for idx, card in enumerate(cards, 1):
-        try:
-            try:
-                driver.execute_script("arguments[0].scrollIntoView({block:'center'});", card)
-                time.sleep(0.15)
-            except Exception:
-                pass
-            title, href, tmethod = extract_title_and_url_from_card(card)
-            vtxt = extract_views_text_from_card(card)
-            vt = vtxt or ""
-            if "views" in vt.lower() and "조회수" not in vt:
-                mnum = re.search(r"([0-9][0-9,\.]*)\s*[KMBkmb]?", vt)
-                if mnum:
-                    vt = mnum.group(1)
-            views = parse_korean_views(vt)
-            dstr, dsec = extract_duration_from_card(card)
-            results.append({
-                "index": idx,
-                "title": title or "",
-                "views": int(views) if views is not None else None,
-                "url": href,
-                "duration": dstr,
-                "duration_seconds": dsec,
-            })
-            print(f"- [{idx}] {title} | 조회수: {views} | 길이: {dstr} | {tmethod}")
-        except Exception as e:
-            print(f"카드 수집 실패 [{idx}]: {e}")
-    return results
+    stop_when = make_frontier_check(driver, "ytd-rich-grid-media", known_ids, YOUTUBE_PAGE_SIZE) if known_ids else None
+    if checkpoint_path:
+        stop_when = checkpointing_stop_when(checkpoint_path,
+                                            lambda: youtube_checkpoint_snapshot(driver, "ytd-rich-grid-media"), stop_when)
+    smart_scroll_until_no_new(driver, "ytd-rich-grid-media", max_scrolls=100, pause=1.0, stop_when=stop_when)
+    records = None
+    if network_capture:
+        records = records_from_network_capture(driver, "ytd-rich-grid-media")
+        if records is not None:
+            for r in records:
+                print(f"- [{r['index']}] {r['title']} | 조회수: {r['views']} | 길이: {r['duration']} | network")
+    if records is None:
+        getters = card_field_getters(driver, "ytd-rich-grid-media", bulk=bulk, settle=0.15)
+        print(f"수집 대상 카드 수: {len(getters)}")
+        records = records_from_card_getters(getters)
+    records = merge_resumed(records, resumed)
+    clear_checkpoint(checkpoint_path)
+    return records
+
+
+def records_from_new_cards(driver, item_selector: str, start: int, bulk: bool = True) -> List[Dict]:
+    """
+    start번째 이후 카드만 레코드로 변환합니다. (스트리밍 수집에서 새로 로드된 부분만 읽기 위해 사용)
+    """
+    items = extract_cards_bulk(driver, item_selector, start) if bulk else None
+    if items is not None:
+        getters = [lambda it=it: fields_from_bulk_item(it) for it in items]
+    else:
+        cards = driver.find_elements(By.CSS_SELECTOR, item_selector)[start:]
+        getters = [lambda c=c: fields_from_card(driver, c, 0.15) for c in cards]
+    return records_from_card_getters(getters, verbose=False)
+
+
+def stream_channel_grid(driver, item_selector: str = "ytd-rich-grid-media", bulk: bool = True,
+                        known_ids: Optional[Set[str]] = None, max_scrolls: int = 100, prune: bool = False,
+                        keep: int = YOUTUBE_PAGE_SIZE) -> Iterator[List[Dict]]:
+    """
+    이미 열린 동영상 탭에서 스크롤할 때마다 새로 로드된 카드만 추출해 레코드 배치를 yield합니다.
+
+    prune=True이면 추출을 마친 카드를 그리드에서 제거하고 마지막 keep개만 남깁니다. 카드 수천 개가 DOM에 쌓이지 않으므로
+    렌더러 메모리와 단계별 카드 조회 시간이 채널 크기와 관계없이 거의 일정합니다.
+    (항목 수는 제거한 수를 더한 누적 수로 세고, keep 기본값은 증분 수집의 프런티어 검사가 마지막 한 페이지를 볼 수 있는 크기)
+    """
+    stop_when = make_frontier_check(driver, item_selector, known_ids, YOUTUBE_PAGE_SIZE) if known_ids else None
+    scroll = scroll_step(driver, item_selector)
+    if not prune:
+        yield from stream_new_items(driver, item_selector,
+                                    lambda start: records_from_new_cards(driver, item_selector, start, bulk=bulk),
+                                    scroll, max_steps=max_scrolls, stop_when=stop_when)
+        return
+
+    driver.execute_script("window.__acPruned = 0;")
+    progress = {"pruned": 0}
+
+    def count() -> int:
+        return progress["pruned"] + count_items(driver, item_selector)
+
+    def extract(start: int) -> List[Dict]:
+        # 누적 위치 start를 남아 있는 카드 기준 위치로 변환 (이미 추출한 카드가 다시 읽히면 ID 중복 제거로 걸러짐)
+        live_start = max(0, start - progress["pruned"])
+        records = records_from_new_cards(driver, item_selector, live_start, bulk=bulk)
+        res = driver.execute_script(PRUNE_PROCESSED_SCRIPT, item_selector, live_start + len(records), keep) or {}
+        progress["pruned"] = int(res.get("pruned") or progress["pruned"])
+        heap = res.get("heap")
+        print(f"카드 정리: {res.get('removed')}개 제거 (누적 {progress['pruned']}개), 남은 카드 {res.get('live')}개, "
+              f"노드 {res.get('nodes')}개" + (f", JS 힙 {heap / 1e6:.1f}MB" if heap else ""))
+        return records
+
+    yield from stream_new_items(driver, item_selector, extract, lambda total: scroll(total - progress["pruned"]),
+                                max_steps=max_scrolls, stop_when=stop_when, count=count)
+
+
+def iter_channel_video_batches(driver, channel_name: str, bulk: bool = True, known_ids: Optional[Set[str]] = None,
+                               channel_url: Optional[str] = None, max_scrolls: int = 100,
+                               prune: bool = False) -> Iterator[List[Dict]]:
+    """
+    collect_channel_videos의 스트리밍 버전: 동영상 탭으로 이동한 뒤 스크롤할 때마다 새로 로드된 카드만 추출해
+    레코드 배치를 yield합니다. (index는 채널 전체 기준으로 이어짐, streaming.drain으로 sink에 바로 기록)
+    """
+    print(f"채널 '{channel_name}'의 동영상을 스트리밍으로 수집합니다.")
+    if not channel_url:
+        open_channel_by_search(driver, channel_name)
+    ok = open_videos_tab_url(driver, channel_url) if channel_url else nav_to_videos_tab(driver)
+    if not ok:
+        raise RuntimeError("동영상 탭 로드 실패")
+    yield from stream_channel_grid(driver, bulk=bulk, known_ids=known_ids, max_scrolls=max_scrolls, prune=prune)
+
+
+def probe_channel_first_page(driver, channel_name: str, channel_url: Optional[str] = None,
+                             size: int = PROBE_SIZE) -> List[Dict]:
+    """
+    동영상 탭 첫 화면만 열어(스크롤 없음) 최신 size개 레코드를 반환합니다. (change_probe 변경 감지용)
+    """
+    if not channel_url:
+        open_channel_by_search(driver, channel_name)
+    ok = open_videos_tab_url(driver, channel_url) if channel_url else nav_to_videos_tab(driver)
+    if not ok:
+        raise RuntimeError("동영상 탭 로드 실패")
+    WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, "ytd-rich-grid-media")))
+    return records_from_new_cards(driver, "ytd-rich-grid-media", 0)[:size]
 
 
 def play_videos_sequence(driver, videos: List[Dict], base_videos_url: Optional[str] = None):
@@ -667,60 +1004,206 @@ def play_videos_sequence(driver, videos: List[Dict], base_videos_url: Optional[s
             print(f"  · 재생 중 오류: {e}")
 
 
-def run_loop(channel_name: str, csv_path: str = "youtube_channel_videos.csv"):
+def run_loop(channel_name: str, csv_path: str = "youtube_channel_videos.csv", incremental: bool = False, full_resync_every: int = 10,
+             lightweight: bool = False, network_capture: bool = False, collector: str = "browser",
+             store_path: Optional[str] = None, parquet_dir: Optional[str] = None,
+             channel_cache_path: Optional[str] = None, profile_dir: Optional[str] = None,
+             checkpoint_dir: Optional[str] = None, streaming: bool = False, prune: bool = False,
+             memory_log: Optional[str] = None, video_index_path: Optional[str] = None,
+             probe_path: Optional[str] = None):
+    """
+    incremental=True이면 이전 라운드 목록을 기준으로 새 영상이 있는 앞부분만 수집해 캐시와 병합하고,
+    full_resync_every 라운드마다 삭제된 영상 반영을 위해 전체 재수집합니다.
+    network_capture=True이면 스크롤 중 수신한 browse 응답 JSON에서 목록을 만듭니다.
+    collector="http"이면 목록 수집은 브라우저 없이 HTTP로 하고, 브라우저는 재생에만 사용합니다.
+    store_path가 주어지면 CSV 대신 SQLite 저장소(storage.py)에 라운드별 조회수 스냅샷을 추가합니다.
+    parquet_dir가 주어지면 라운드마다 날짜별 Parquet 데이터셋(parquet_export.py)에도 추가합니다.
+    channel_cache_path가 주어지면 검색으로 찾은 채널 URL을 캐시해 다음 라운드부터 검색 없이 /videos 탭으로 이동합니다.
+    profile_dir가 주어지면 브라우저 프로필(캐시/쿠키)을 그 폴더에 유지하고, 브라우저가 죽으면 새로 띄워 중단된 단계를 다시 실행합니다.
+    checkpoint_dir가 주어지면 긴 목록 수집의 진행 상황을 그 폴더에 저장하고, 중단 후 다음 시도(브라우저 교체 후 재시도 포함)에서 이어서 수집합니다.
+    streaming=True이면 스크롤마다 새로 로드된 카드만 추출해 배치 단위로 부분 CSV(<csv>.partial.csv) 또는 저장소에 바로 기록합니다.
+    (브라우저 수집 경로에만 적용, 재생 목록은 수집이 끝난 뒤 같은 브라우저로 재생)
+    prune=True이면 추출을 마친 카드를 그리드에서 제거하며 스크롤해 업로드가 많은 채널에서도 렌더러 메모리를 일정하게 유지합니다.
+    memory_log가 주어지면 브라우저 프로세스 트리 RSS/CPU와 렌더러 JS 힙을 그 CSV에 시계열로 기록하고, 라운드 사이에
+    임계값(memory_watchdog.py)을 넘으면 탭 또는 브라우저를 새로 띄운 뒤 같은 위치(URL)로 돌아갑니다.
+    video_index_path가 주어지면 영상 ID 기준 색인(video_index.py)을 갱신하고 라운드 간 변경분(신규/삭제/제목 변경/조회수 증감)을
+    <색인>.changes.jsonl에 추가합니다.
+    probe_path가 주어지면 라운드마다 먼저 목록 첫 화면의 최신 영상 ID/조회수 지문만 확인하고(change_probe.py),
+    마지막 전체 수집 때와 같으면 캐시된 목록을 그대로 사용해 전체 스크롤 수집을 생략합니다.
+    """
     # 브라우저 옵션 설정(배경 스로틀링 완화, 창 크기 고정)
     print("브라우저를 초기화합니다 (지속 실행 모드)...")
-    options = uc.ChromeOptions()
-    options.add_argument("--window-size=1600,1000")
-    options.add_argument("--disable-background-timer-throttling")
-    options.add_argument("--disable-backgrounding-occluded-windows")
-    options.add_argument("--disable-renderer-backgrounding")
-    driver = uc.Chrome(options=options)
+    pool = BrowserPool(profile_root=profile_dir, name="youtube", performance_log=network_capture).start()
+    watchdog = MemoryWatchdog(memory_log).start() if memory_log else None
+    if watchdog is not None:
+        pool.run(watchdog.attach, label="메모리 확인")
+    session = create_session() if collector == "http" else None
+    ckpt = checkpoint_path(checkpoint_dir, "youtube", channel_name) if checkpoint_dir else None
+    if ckpt and (streaming or prune):
+        print("경고: 스트리밍/카드 정리(prune) 모드에서는 체크포인트를 저장하지 않습니다. (중단 시 이어서 수집하지 않음)")
+
+    resolved: Dict[str, Optional[str]] = {"url": None}
+    round_at: Dict[str, Optional[str]] = {"saved_at": None}
+
+    def stream_sinks() -> List[Callable[[List[Dict]], None]]:
+        # 브라우저 교체 후 재시도하면 sink를 새로 만들어 부분 CSV를 처음부터 다시 씁니다.
+        saved_at = round_at["saved_at"] or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if store is not None:
+            return [make_store_sink(store, "youtube", channel_name, saved_at)]
+        return [make_partial_csv_sink(csv_path, saved_at)]
+
+    def collect_from(url: Optional[str], known_ids: Optional[Set[str]]) -> List[Dict]:
+        if session is not None:
+            # 검색 결과 URL을 캐시에 넘기기 위해 채널 검색을 여기서 수행
+            url = url or search_channel_url(session, channel_name)
+            resolved["url"] = url
+            return collect_channel_videos_http(channel_name, channel_url=url, session=session, known_ids=known_ids,
+                                               checkpoint_path=ckpt)
+
+        def step(driver) -> List[Dict]:
+            with lightweight_collection(driver, enabled=lightweight):
+                if streaming:
+                    records = drain(iter_channel_video_batches(driver, channel_name, known_ids=known_ids, channel_url=url,
+                                                               prune=prune), stream_sinks())
+                else:
+                    records = collect_channel_videos(driver, channel_name, known_ids=known_ids,
+                                                     network_capture=network_capture, channel_url=url,
+                                                     checkpoint_path=ckpt, prune=prune)
+            resolved["url"] = driver.current_url
+            return records
+
+        return pool.run(step, label="목록 수집")
+
+    def collect(known_ids: Optional[Set[str]] = None) -> List[Dict]:
+        return collect_with_channel_cache(channel_cache_path, "youtube", channel_name,
+                                          lambda url: collect_from(url, known_ids), lambda: resolved["url"])
+
+    def probe() -> List[Dict]:
+        # 마지막 전체 수집에서 확인한 채널 URL(없으면 채널 URL 캐시, 그것도 없으면 검색)의 첫 화면만 확인
+        url = resolved["url"] or (lookup_channel_url(channel_cache_path, "youtube", channel_name)
+                                  if channel_cache_path else None)
+        if session is not None:
+            return probe_first_page_http(session, url or search_channel_url(session, channel_name), size=PROBE_SIZE)
+        return pool.run(lambda driver: probe_channel_first_page(driver, channel_name, channel_url=url), label="변경 감지")
+
+    store = open_store(store_path) if store_path else None
+    if parquet_dir:
+        require_pyarrow()
 
     try:
-        try:
-            df = pd.read_csv(csv_path)
-            print(f"기존 CSV '{csv_path}'를 불러왔습니다. 행 수: {len(df)}")
-        except FileNotFoundError:
-            print(f"CSV '{csv_path}'가 없습니다. 먼저 정보 수집을 진행합니다.")
-            vids = collect_channel_videos(driver, channel_name)
-            saved_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            df = pd.DataFrame(vids)
-            df["saved_at"] = saved_at
-            df.to_csv(csv_path, index=False, encoding="utf-8-sig")
-            print(f"초기 수집 CSV 저장 완료: {csv_path}")
+        if store is not None:
+            cached = latest_catalog(store, "youtube", channel_name)
+            if cached:
+                print(f"저장소 '{store_path}'에서 최신 목록을 불러왔습니다. 행 수: {len(cached)}")
+            else:
+                print(f"저장소 '{store_path}'에 '{channel_name}' 기록이 없습니다. 먼저 정보 수집을 진행합니다.")
+                round_at["saved_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                cached = collect()
+                save_round(store, "youtube", channel_name, cached, round_at["saved_at"])
+        else:
+            try:
+                df = pd.read_csv(csv_path)
+                print(f"기존 CSV '{csv_path}'를 불러왔습니다. 행 수: {len(df)}")
+            except FileNotFoundError:
+                print(f"CSV '{csv_path}'가 없습니다. 먼저 정보 수집을 진행합니다.")
+                vids = collect()
+                write_csv_if_changed(vids, csv_path, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+                clear_partial_csv(csv_path)
+                print(f"초기 수집 CSV 저장 완료: {csv_path}")
+                df = pd.DataFrame(vids)
+            cached = records_from_frame(df)
 
         print("무한 반복 재생 루프를 시작합니다. (Ctrl+C로 종료)")
+        round_no = 0
         while True:
-            # 매 라운드 시작 시 최신 목록 전체 재수집 → 신규 업로드 자동 반영
-            vids = collect_channel_videos(driver, channel_name)
-            saved_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            df = pd.DataFrame(vids)
-            df["saved_at"] = saved_at
-            df.to_csv(csv_path, index=False, encoding="utf-8-sig")
-            print(f"CSV 업데이트 완료(재수집): {csv_path} | 총 {len(df)}개")
-
-            base_videos_url = driver.current_url
-            videos = df.to_dict(orient="records")
+            round_no += 1
+            # 매 라운드 시작 시 최신 목록 재수집 → 신규 업로드 자동 반영 (증분 모드면 앞부분만)
+            known_ids = plan_round(round_no, cached, incremental, full_resync_every)
+            round_at["saved_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+            def full_crawl() -> List[Dict]:
+                fresh = collect(known_ids)
+                return merge_with_cache(fresh, cached) if known_ids is not None else fresh
+
+            vids, skipped = collect_with_probe(probe_path, "youtube", channel_name, cached, probe, full_crawl)
+            cached = vids
+            # 스트리밍 모드는 배치를 기록한 시각(라운드 시작)을 그대로 사용해 저장소 스냅샷이 겹치지 않게 합니다.
+            saved_at = round_at["saved_at"] if streaming else datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            if store is not None and skipped:
+                print(f"첫 페이지 변화 없음 → 저장소 기록 생략: {store_path}")
+            elif store is not None:
+                # 저장소는 조회수 스냅샷만 추가하므로 라운드 종료 후 다시 쓰지 않습니다.
+                n = save_round(store, "youtube", channel_name, vids, saved_at)
+                print(f"저장소 기록 완료(재수집): {store_path} | 총 {n}개")
+            elif write_csv_if_changed(vids, csv_path, saved_at):
+                print(f"CSV 업데이트 완료(재수집): {csv_path} | 총 {len(vids)}개")
+            else:
+                print(f"목록 변경 없음 → CSV 쓰기 생략(재수집): {csv_path} | 총 {len(vids)}개")
+            if store is None:
+                clear_partial_csv(csv_path)
+            videos = [dict(v, saved_at=saved_at) for v in vids]
+            if parquet_dir and not skipped:
+                append_round(parquet_dir, "youtube", channel_name, vids, saved_at)
+                print(f"Parquet 이력 추가: {parquet_dir}")
+            if video_index_path and not skipped:
+                update_index(video_index_path, "youtube", channel_name, vids, saved_at)
+
             print(f"이번 라운드 재생 대상: {len(videos)}개 (1번부터 순서대로)")
-            play_videos_sequence(driver, videos, base_videos_url=base_videos_url)
+            # 재생 중 브라우저가 교체되면 새 브라우저의 current_url은 빈 페이지이므로 목록 URL을 미리 확보
+            base_url = resolved["url"]
+            pool.run(lambda driver: play_videos_sequence(driver, videos, base_videos_url=base_url), label="재생")
 
-            # 라운드 종료 후 저장 시간 갱신
-            saved_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            df["saved_at"] = saved_at
-            df.to_csv(csv_path, index=False, encoding="utf-8-sig")
-            print(f"CSV 업데이트 완료(라운드 완료): {csv_path}")
+            if store is None:
+                # 라운드 종료 시각은 매니페스트에만 기록 (내용이 같으면 CSV는 다시 쓰지 않음)
+                write_csv_if_changed(vids, csv_path, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+                print(f"라운드 완료 시각 기록: {manifest_path(csv_path)}")
+            maintain(pool, watchdog)
 
     except KeyboardInterrupt:
         print("사용자 인터럽트 감지. 종료합니다.")
     finally:
-        try:
-            driver.quit()
-        except Exception:
-            pass
+        if session is not None:
+            session.close()
+        if store is not None:
+            store.close()
+        if watchdog is not None:
+            watchdog.stop()
+        pool.close()
 
 
 if __name__ == "__main__":
     # 무한 반복: CSV 없으면 수집 후 모든 영상 순차 재생, 라운드마다 CSV 갱신
     CHANNEL_NAME = "조선대학교 SW중심사업단"
-    run_loop(CHANNEL_NAME, csv_path="youtube_channel_videos.csv")
+    # 증분 모드: 이전 라운드 이후 새로 올라온 영상만 수집하고 10라운드마다 전체 재수집
+    INCREMENTAL = False
+    # 경량 수집: 목록 수집 중에는 이미지/미디어/폰트 요청 차단 (재생 시에는 해제)
+    LIGHTWEIGHT = False
+    # 네트워크 캡처: 스크롤 중 수신한 browse 응답 JSON에서 목록 생성 (DOM은 대조용)
+    NETWORK_CAPTURE = False
+    # 목록 수집기: "browser"(기본) 또는 "http"(브라우저 없이 ytInitialData + continuation, 브라우저는 재생 전용)
+    COLLECTOR = "browser"
+    # 저장소: "crawl.db"처럼 지정하면 CSV 대신 SQLite에 조회수 이력 기록 (CSV는 python storage.py ... --export)
+    STORE_PATH = None
+    # 분석용 Parquet 이력: "view_history"처럼 지정하면 라운드마다 날짜별 파티션에 추가 (pyarrow 필요)
+    PARQUET_DIR = None
+    # 채널 URL 캐시: "channel_cache.json"처럼 지정하면 검색으로 찾은 채널 URL을 저장해 다음 라운드부터 검색 생략 (None이면 매번 검색)
+    CHANNEL_CACHE_PATH = None
+    # 브라우저 프로필 폴더: "chrome_profiles"처럼 지정하면 캐시/쿠키를 유지해 재시작을 빠르게 하고, 브라우저가 죽으면 교체 후 재시도 (None이면 임시 프로필)
+    PROFILE_DIR = None
+    # 체크포인트 폴더: "checkpoints"처럼 지정하면 긴 목록 수집 중 진행 상황을 저장해 브라우저 충돌/재시작 후 이어서 수집 (None이면 사용 안 함)
+    CHECKPOINT_DIR = None
+    # 스트리밍 수집: 스크롤/더보기마다 새 배치를 부분 CSV(<csv>.partial.csv) 또는 저장소에 바로 기록 (중단되어도 부분 결과 유지)
+    STREAMING = False
+    # 추출 후 카드 정리: 스크롤마다 추출한 카드를 그리드에서 제거해 업로드 수천 개 채널에서도 렌더러 메모리 일정 유지
+    PRUNE = False
+    # 메모리 감시: "memory_log.csv"처럼 지정하면 브라우저 RSS/CPU·JS 힙을 기록하고 임계값 초과 시 라운드 사이에 탭/브라우저 재활용
+    MEMORY_LOG = None
+    # 영상 ID 색인: "video_index.json"처럼 지정하면 라운드마다 신규/삭제/제목 변경/조회수 증감을 계산해 <색인>.changes.jsonl에 추가 (None이면 사용 안 함)
+    VIDEO_INDEX_PATH = None
+    # 변경 감지: "probe_fingerprints.json"처럼 지정하면 첫 화면 최신 10개가 그대로일 때 전체 수집 생략 (6회 연속 생략 후에는 전체 수집)
+    PROBE_PATH = None
+    run_loop(CHANNEL_NAME, csv_path="youtube_channel_videos.csv", incremental=INCREMENTAL, full_resync_every=10,
+             lightweight=LIGHTWEIGHT, network_capture=NETWORK_CAPTURE, collector=COLLECTOR, store_path=STORE_PATH,
+             parquet_dir=PARQUET_DIR, channel_cache_path=CHANNEL_CACHE_PATH, profile_dir=PROFILE_DIR,
+             checkpoint_dir=CHECKPOINT_DIR, streaming=STREAMING, prune=PRUNE, memory_log=MEMORY_LOG,
+             video_index_path=VIDEO_INDEX_PATH, probe_path=PROBE_PATH)
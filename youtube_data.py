@@ -0,0 +1,178 @@
+"""
+YouTube 내부 JSON(ytInitialData, youtubei/v1/browse 응답)에서 영상 레코드를 추출하는 도우미.
+
+렌더링된 DOM을 다시 읽는 대신 페이지가 이미 받아온 구조화 데이터를 그대로 사용합니다.
+브라우저 네트워크 캡처(youtube_auto_crawl)와 브라우저 없는 HTTP 수집기가 함께 사용합니다.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional
+
+from parsing import parse_duration_to_seconds, parse_views_generic
+
+
+def text_of(node: Any) -> str:
+    """
+    {'simpleText': ...} / {'runs': [{'text': ...}]} / {'content': ...} 형태의 텍스트 노드를 문자열로 변환합니다.
+    """
+    if not node:
+        return ""
+    if isinstance(node, str):
+        return node
+    if isinstance(node, dict):
+        if "simpleText" in node:
+            return str(node["simpleText"])
+        if "runs" in node:
+            return "".join(str(r.get("text", "")) for r in node["runs"] if isinstance(r, dict))
+        if "content" in node:
+            return str(node["content"])
+    return ""
+
+
+def iter_dicts_with_key(obj: Any, key: str) -> Iterator[Any]:
+    """
+    중첩 JSON을 문서 순서대로 훑으며 key에 해당하는 값을 모두 돌려줍니다. (찾은 값 내부로는 내려가지 않음)
+    """
+    stack = [obj]
+    while stack:
+        cur = stack.pop()
+        if isinstance(cur, dict):
+            if key in cur:
+                yield cur[key]
+                rest = [v for k, v in cur.items() if k != key]
+            else:
+                rest = list(cur.values())
+            stack.extend(reversed(rest))
+        elif isinstance(cur, list):
+            stack.extend(reversed(cur))
+
+
+def selected_videos_tab(data: Dict) -> Optional[Dict]:
+    """
+    채널 페이지 데이터에서 선택된 탭이 '동영상' 탭이면 그 내용을 반환합니다.
+    (홈/재생목록 탭의 추천 영상이 섞이지 않도록 선택된 탭으로 한정)
+    """
+    for tab in iter_dicts_with_key(data, "tabRenderer"):
+        if not isinstance(tab, dict) or not tab.get("selected"):
+            continue
+        url = (((tab.get("endpoint") or {}).get("commandMetadata") or {}).get("webCommandMetadata") or {}).get("url", "")
+        if url.rstrip("/").endswith("/videos"):
+            return tab.get("content") or {}
+        return None
+    return None
+
+
+def scope_payload(payload: Dict) -> Optional[Any]:
+    """
+    페이지 전체 응답(탭 구조 포함)이면 선택된 동영상 탭으로, 이어보기(continuation) 응답이면 그대로 반환합니다.
+    """
+    if not isinstance(payload, dict):
+        return None
+    if "onResponseReceivedActions" in payload or "onResponseReceivedEndpoints" in payload:
+        return payload.get("onResponseReceivedActions") or payload.get("onResponseReceivedEndpoints")
+    if "contents" in payload:
+        return selected_videos_tab(payload["contents"])
+    return None
+
+
+def fields_from_video_renderer(r: Dict) -> Optional[Dict]:
+    vid = r.get("videoId")
+    if not vid:
+        return None
+    title = text_of(r.get("title")) or text_of(((r.get("title") or {}).get("accessibility") or {}).get("accessibilityData", {}).get("label"))
+    views_text = text_of(r.get("viewCountText")) or text_of(r.get("shortViewCountText"))
+    duration = text_of(r.get("lengthText"))
+    if not duration:
+        for overlay in iter_dicts_with_key(r.get("thumbnailOverlays") or [], "thumbnailOverlayTimeStatusRenderer"):
+            duration = text_of((overlay or {}).get("text"))
+            if duration:
+                break
+    return {"video_id": vid, "title": title.strip(), "views_text": views_text, "duration": duration.strip() or None}
+
+
+def fields_from_lockup(r: Dict) -> Optional[Dict]:
+    if r.get("contentType") not in (None, "LOCKUP_CONTENT_TYPE_VIDEO"):
+        return None
+    vid = r.get("contentId")
+    if not vid:
+        return None
+    meta = ((r.get("metadata") or {}).get("lockupMetadataViewModel") or {})
+    title = text_of(meta.get("title"))
+    views_text = ""
+    for part in iter_dicts_with_key(meta.get("metadata") or {}, "text"):
+        t = text_of(part)
+        if "조회수" in t or "view" in t.lower():
+            views_text = t
+            break
+    duration = ""
+    for badge in iter_dicts_with_key(r.get("contentImage") or {}, "thumbnailBadgeViewModel"):
+        t = text_of((badge or {}).get("text"))
+        if parse_duration_to_seconds(t) is not None:
+            duration = t
+            break
+    return {"video_id": vid, "title": title.strip(), "views_text": views_text, "duration": duration or None}
+
+
+def iter_video_fields(scope: Any) -> Iterator[Dict]:
+    """
+    범위(탭 내용/이어보기 응답) 안의 영상 항목을 문서 순서대로 돌려줍니다.
+    """
+    stack = [scope]
+    while stack:
+        cur = stack.pop()
+        if isinstance(cur, dict):
+            if isinstance(cur.get("videoRenderer"), dict):
+                f = fields_from_video_renderer(cur["videoRenderer"])
+                if f:
+                    yield f
+                continue
+            if isinstance(cur.get("lockupViewModel"), dict):
+                f = fields_from_lockup(cur["lockupViewModel"])
+                if f:
+                    yield f
+                continue
+            stack.extend(reversed(list(cur.values())))
+        elif isinstance(cur, list):
+            stack.extend(reversed(cur))
+
+
+def find_continuation_token(scope: Any) -> Optional[str]:
+    """
+    범위 안의 마지막 continuationItemRenderer 토큰(다음 페이지)을 반환합니다.
+    """
+    token = None
+    for item in iter_dicts_with_key(scope, "continuationItemRenderer"):
+        cmd = (((item or {}).get("continuationEndpoint") or {}).get("continuationCommand") or {})
+        if cmd.get("token"):
+            token = cmd["token"]
+    return token
+
+
+def record_from_fields(f: Dict, index: int) -> Dict:
+    duration = f.get("duration")
+    views = parse_views_generic(f.get("views_text") or "")
+    return {
+        "index": index,
+        "title": f.get("title") or "",
+        "views": int(views) if views is not None else None,
+        "url": f"https://www.youtube.com/watch?v={f['video_id']}",
+        "duration": duration,
+        "duration_seconds": parse_duration_to_seconds(duration) if duration else None,
+    }
+
+
+def records_from_payloads(payloads: List[Dict]) -> List[Dict]:
+    """
+    ytInitialData/browse 응답 목록(수신 순서)에서 중복 없는 영상 레코드를 만듭니다.
+    """
+    out: List[Dict] = []
+    seen = set()
+    for payload in payloads:
+        scope = scope_payload(payload)
+        if scope is None:
+            continue
+        for f in iter_video_fields(scope):
+            if f["video_id"] in seen:
+                continue
+            seen.add(f["video_id"])
+            out.append(record_from_fields(f, len(out) + 1))
+    return out
@@ -0,0 +1,251 @@
+"""
+youtube_http 수집기를 네트워크 없이 검증/측정하기 위한 로컬 대역(stand-in) 서버.
+
+기록해 둔(또는 합성한) 채널 페이지 HTML과 continuation 응답 JSON을 그대로 되돌려 줍니다.
+- GET  /results?search_query=...   → 채널 검색 결과 페이지
+- GET  /<채널 경로>/videos          → 동영상 탭 페이지 (ytInitialData 내장)
+- POST /youtubei/v1/browse          → 요청 본문의 continuation 토큰에 해당하는 응답
+
+픽스처 형식(JSON): {"pages": {"/@handle/videos": "<html>", "/results": "<html>"}, "continuations": {"토큰": {...}}}
+
+실행 예:
+  python youtube_fixture_server.py                      # 합성 채널로 수집기 결과 검증 + 시간 측정
+  python youtube_fixture_server.py --videos 3000 --runs 5
+  python youtube_fixture_server.py --record https://www.youtube.com/@handle --out fixtures/handle.json
+  python youtube_fixture_server.py --fixtures fixtures/handle.json --serve --port 8765
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from youtube_data import find_continuation_token, scope_payload
+from youtube_http import (YOUTUBE_BASE_URL, collect_channel_videos_http, create_session, extract_initial_data,
+                          extract_innertube_config, fetch_continuation, videos_tab_url)
+
+
+SYNTHETIC_HANDLE = "/@fixture_channel"
+SYNTHETIC_NAME = "픽스처 채널"
+
+
+def page_html(initial_data: Dict, api_key: str = "FIXTURE_KEY", client_version: str = "2.20240101.00.00") -> str:
+    return (
+        "<html><head><script>ytcfg.set({"
+        f"\"INNERTUBE_API_KEY\":\"{api_key}\",\"INNERTUBE_CLIENT_VERSION\":\"{client_version}\""
+        "});</script></head><body><script>var ytInitialData = "
+        + json.dumps(initial_data, ensure_ascii=False)
+        + ";</script></body></html>"
+    )
+
+
+def synthetic_video(i: int) -> Dict:
+    views = (i * 7919) % 2_000_000
+    views_text = f"조회수 {views / 10000:.1f}만회" if views >= 10000 else f"조회수 {views:,}회"
+    minutes, seconds = divmod(60 + (i * 37) % 3600, 60)
+    return {"richItemRenderer": {"content": {"videoRenderer": {
+        "videoId": f"vid{i:08d}",
+        "title": {"runs": [{"text": f"테스트 영상 {i}"}]},
+        "viewCountText": {"simpleText": views_text},
+        "lengthText": {"simpleText": f"{minutes}:{seconds:02d}"},
+    }}}}
+
+
+def continuation_item(token: str) -> Dict:
+    return {"continuationItemRenderer": {"continuationEndpoint": {"continuationCommand": {"token": token}}}}
+
+
+def make_synthetic_fixtures(n_videos: int = 300, page_size: int = 30, handle: str = SYNTHETIC_HANDLE,
+                            name: str = SYNTHETIC_NAME) -> Dict:
+    """
+    n_videos개 영상을 page_size씩 나눈 합성 채널 픽스처를 만듭니다. (첫 페이지는 HTML, 나머지는 continuation)
+    """
+    items = [synthetic_video(i) for i in range(1, n_videos + 1)]
+    chunks = [items[i:i + page_size] for i in range(0, len(items), page_size)] or [[]]
+    tokens = [f"TOKEN_{k}" for k in range(1, len(chunks))]
+
+    def with_token(chunk: List[Dict], k: int) -> List[Dict]:
+        return chunk + ([continuation_item(tokens[k])] if k < len(tokens) else [])
+
+    tabs = [
+        {"tabRenderer": {"selected": False, "title": "홈",
+                         "endpoint": {"commandMetadata": {"webCommandMetadata": {"url": f"{handle}/featured"}}}}},
+        {"tabRenderer": {"selected": True, "title": "동영상",
+                         "endpoint": {"commandMetadata": {"webCommandMetadata": {"url": f"{handle}/videos"}}},
+                         "content": {"richGridRenderer": {"contents": with_token(chunks[0], 0)}}}},
+    ]
+    initial = {"contents": {"twoColumnBrowseResultsRenderer": {"tabs": tabs}}}
+    search = {"contents": {"sectionListRenderer": {"contents": [{"channelRenderer": {
+        "title": {"simpleText": name},
+        "navigationEndpoint": {"browseEndpoint": {"canonicalBaseUrl": handle}},
+    }}]}}}
+    continuations = {
+        tokens[k - 1]: {"onResponseReceivedActions": [{"appendContinuationItemsAction": {
+            "continuationItems": with_token(chunks[k], k)}}]}
+        for k in range(1, len(chunks))
+    }
+    return {
+        "pages": {f"{handle}/videos": page_html(initial), "/results": page_html(search)},
+        "continuations": continuations,
+    }
+
+
+def record_fixtures(channel_url: str, max_pages: int = 200) -> Dict:
+    """
+    실제 채널의 동영상 탭 페이지와 continuation 응답을 픽스처로 기록합니다. (네트워크 필요)
+    """
+    session = create_session()
+    target = videos_tab_url(channel_url)
+    html = session.get(target, timeout=10).text
+    api_key, client_version = extract_innertube_config(html)
+    data = extract_initial_data(html) or {}
+    continuations = {}
+    token = find_continuation_token(scope_payload(data))
+    while token and len(continuations) < max_pages:
+        payload = fetch_continuation(session, token, api_key, client_version)
+        continuations[token] = payload
+        token = find_continuation_token(scope_payload(payload))
+    session.close()
+    path = urlsplit(target).path
+    print(f"기록 완료: {path} | continuation {len(continuations)}개")
+    return {"pages": {path: html}, "continuations": continuations}
+
+
+def make_handler(fixtures: Dict):
+    pages = fixtures.get("pages", {})
+    continuations = fixtures.get("continuations", {})
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def send_body(self, status: int, body: bytes, content_type: str):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            path = urlsplit(self.path).path.rstrip("/")
+            html = pages.get(path)
+            if html is None:
+                self.send_body(404, b"not found", "text/plain")
+                return
+            self.send_body(200, html.encode("utf-8"), "text/html; charset=utf-8")
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                token = json.loads(self.rfile.read(length) or b"{}").get("continuation")
+            except ValueError:
+                token = None
+            payload = continuations.get(token)
+            if urlsplit(self.path).path != "/youtubei/v1/browse" or payload is None:
+                self.send_body(404, b"{}", "application/json")
+                return
+            self.send_body(200, json.dumps(payload, ensure_ascii=False).encode("utf-8"), "application/json")
+
+        def log_message(self, format, *args):
+            pass
+
+    return FixtureHandler
+
+
+def serve_fixtures(fixtures: Dict, host: str = "127.0.0.1", port: int = 0) -> Tuple[ThreadingHTTPServer, str]:
+    """
+    픽스처 서버를 백그라운드 스레드로 시작합니다. 반환: (서버, 기준 URL) — 종료는 server.shutdown()
+    """
+    server = ThreadingHTTPServer((host, port), make_handler(fixtures))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def verify_synthetic(records: List[Dict], n_videos: int, base_url: str = YOUTUBE_BASE_URL) -> Optional[str]:
+    """
+    합성 픽스처 수집 결과가 기대값과 같은지 검사합니다. 문제가 없으면 None, 있으면 설명 문자열.
+    """
+    if len(records) != n_videos:
+        return f"레코드 수 불일치: {len(records)} != {n_videos}"
+    for i, r in enumerate(records, 1):
+        src = synthetic_video(i)["richItemRenderer"]["content"]["videoRenderer"]
+        minutes, seconds = map(int, src["lengthText"]["simpleText"].split(":"))
+        expected = {
+            "index": i,
+            "title": f"테스트 영상 {i}",
+            "url": f"{base_url}/watch?v={src['videoId']}",
+            "duration": src["lengthText"]["simpleText"],
+            "duration_seconds": minutes * 60 + seconds,
+        }
+        got = {k: r.get(k) for k in expected}
+        if got != expected or r.get("views") is None:
+            return f"[{i}] 불일치: {got} != {expected}"
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YouTube HTTP 수집기용 로컬 픽스처 서버")
+    parser.add_argument("--fixtures", default=None, help="기록된 픽스처 JSON (없으면 합성 채널 사용)")
+    parser.add_argument("--videos", type=int, default=300, help="합성 채널 영상 수")
+    parser.add_argument("--runs", type=int, default=3, help="수집 반복 횟수 (시간 측정)")
+    parser.add_argument("--record", default=None, help="이 채널 URL을 기록해 --out에 저장 (네트워크 필요)")
+    parser.add_argument("--out", default="youtube_fixtures.json")
+    parser.add_argument("--serve", action="store_true", help="검증 없이 서버만 실행")
+    parser.add_argument("--port", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.record:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(record_fixtures(args.record), f, ensure_ascii=False)
+        print(f"픽스처 저장: {args.out}")
+        return
+
+    if args.fixtures:
+        with open(args.fixtures, encoding="utf-8") as f:
+            fixtures = json.load(f)
+    else:
+        fixtures = make_synthetic_fixtures(args.videos)
+    server, base_url = serve_fixtures(fixtures, port=args.port)
+    print(f"픽스처 서버 시작: {base_url} (페이지 {len(fixtures['pages'])}개, continuation {len(fixtures['continuations'])}개)")
+
+    if args.serve:
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.shutdown()
+        return
+
+    session = create_session()
+    try:
+        timings = []
+        records: List[Dict] = []
+        for _ in range(args.runs):
+            started = time.perf_counter()
+            if args.fixtures:
+                path = next(p for p in fixtures["pages"] if p.endswith("/videos"))
+                records = collect_channel_videos_http("", channel_url=base_url + path, session=session, base_url=base_url)
+            else:
+                records = collect_channel_videos_http(SYNTHETIC_NAME, session=session, base_url=base_url)
+            timings.append(time.perf_counter() - started)
+    finally:
+        session.close()
+        server.shutdown()
+
+    best = min(timings)
+    print(f"\n수집 {len(records)}개 | 최소 {best:.3f}초, 평균 {sum(timings) / len(timings):.3f}초 "
+          f"({len(records) / best:.0f} 영상/초)")
+    if not args.fixtures:
+        problem = verify_synthetic(records, args.videos)
+        print("검증 통과: 합성 채널의 모든 레코드가 기대값과 일치합니다." if problem is None else f"검증 실패: {problem}")
+        if problem is not None:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""
+브라우저 없이 HTTP만으로 YouTube 채널의 동영상 목록을 수집합니다.
+
+채널 '동영상' 탭 HTML에 내장된 ytInitialData를 읽고, continuation 토큰으로 youtubei/v1/browse를
+반복 호출해 나머지 페이지를 가져옵니다. 연결은 requests.Session(HTTPAdapter 풀)으로 재사용합니다.
+반환 레코드는 youtube_auto_crawl.collect_channel_videos와 같은 형식입니다.
+(index, title, views, url, duration, duration_seconds)
+
+오프라인 테스트/벤치마크는 youtube_fixture_server.py를 사용합니다.
+"""
+
+import json
+import re
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import quote_plus
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from checkpoint import clear_checkpoint, extend_records, load_checkpoint, make_checkpointer, merge_resumed
+from youtube_data import find_continuation_token, iter_dicts_with_key, iter_video_fields, records_from_payloads, scope_payload
+
+
+YOUTUBE_BASE_URL = "https://www.youtube.com"
+YOUTUBE_PAGE_SIZE = 30
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+                  "Chrome/124.0 Safari/537.36",
+    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+}
+# 쿠키 동의 페이지로 리다이렉트되지 않도록 하는 동의 쿠키
+CONSENT_COOKIES = {"SOCS": "CAI", "CONSENT": "YES+"}
+
+RE_INITIAL_DATA = re.compile(r"(?:var\s+ytInitialData|window\[\"ytInitialData\"\])\s*=\s*(\{.+?\})\s*;\s*</script>", re.S)
+RE_API_KEY = re.compile(r"\"INNERTUBE_API_KEY\"\s*:\s*\"([^\"]+)\"")
+RE_CLIENT_VERSION = re.compile(r"\"INNERTUBE_CLIENT_VERSION\"\s*:\s*\"([^\"]+)\"")
+
+
+def create_session(pool_size: int = 10, retries: int = 2) -> requests.Session:
+    """
+    연결 풀과 재시도가 설정된 세션을 만듭니다. (여러 채널/페이지 요청에서 TCP/TLS 연결 재사용)
+    """
+    session = requests.Session()
+    retry = Retry(total=retries, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=frozenset(["GET", "POST"]))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    for name, value in CONSENT_COOKIES.items():
+        session.cookies.set(name, value)
+    return session
+
+
+def extract_initial_data(html: str) -> Optional[Dict]:
+    m = RE_INITIAL_DATA.search(html)
+    if not m:
+        return None
+    try:
+        return json.loads(m.group(1))
+    except ValueError:
+        return None
+
+
+def extract_innertube_config(html: str) -> Tuple[Optional[str], str]:
+    """
+    페이지의 ytcfg에서 (API 키, 클라이언트 버전)을 읽습니다.
+    """
+    key = RE_API_KEY.search(html)
+    ver = RE_CLIENT_VERSION.search(html)
+    return (key.group(1) if key else None), (ver.group(1) if ver else "2.20240101.00.00")
+
+
+def videos_tab_url(channel_url: str) -> str:
+    base = re.sub(r"/(featured|videos|shorts|streams|playlists|community|about).*$", "", channel_url.split("?")[0])
+    return base.rstrip("/") + "/videos"
+
+
+def search_channel_url(session: requests.Session, channel_name: str, base_url: str = YOUTUBE_BASE_URL,
+                       timeout: float = 10) -> Optional[str]:
+    """
+    채널 검색 결과(ytInitialData)에서 이름이 일치하는 채널(없으면 첫 채널)의 URL을 찾습니다.
+    """
+    url = f"{base_url}/results?search_query={quote_plus(channel_name)}&sp=EgIQAg%253D%253D"
+    resp = session.get(url, timeout=timeout)
+    resp.raise_for_status()
+    data = extract_initial_data(resp.text)
+    if not data:
+        return None
+    first = None
+    for ch in iter_dicts_with_key(data, "channelRenderer"):
+        path = (((ch or {}).get("navigationEndpoint") or {}).get("browseEndpoint") or {}).get("canonicalBaseUrl")
+        if not path:
+            continue
+        title = ((ch.get("title") or {}).get("simpleText") or "").strip()
+        if title == channel_name:
+            return base_url + path
+        first = first or base_url + path
+    return first
+
+
+def fetch_continuation(session: requests.Session, token: str, api_key: Optional[str], client_version: str,
+                       base_url: str = YOUTUBE_BASE_URL, timeout: float = 10) -> Dict:
+    url = f"{base_url}/youtubei/v1/browse?prettyPrint=false"
+    if api_key:
+        url += f"&key={api_key}"
+    body = {
+        "context": {"client": {"clientName": "WEB", "clientVersion": client_version, "hl": "ko", "gl": "KR"}},
+        "continuation": token,
+    }
+    resp = session.post(url, json=body, timeout=timeout)
+    resp.raise_for_status()
+    return resp.json()
+
+
+def follow_continuations(session: requests.Session, token: Optional[str], api_key: Optional[str], client_version: str,
+                         base_url: str = YOUTUBE_BASE_URL, max_pages: int = 200, known_ids: Optional[Set[str]] = None,
+                         last_payload: Optional[Dict] = None, on_page: Optional[Callable[[List[Dict], Optional[str]], None]] = None,
+                         timeout: float = 10) -> List[Dict]:
+    """
+    token부터 다음 페이지 응답을 차례로 받아 반환합니다. 페이지마다 on_page(지금까지 받은 응답, 다음 토큰)를 호출합니다.
+    known_ids가 주어지면 직전 페이지가 모두 알려진 ID일 때 다음 페이지를 요청하지 않습니다. (증분 모드)
+    """
+    payloads: List[Dict] = []
+    while token and len(payloads) < max_pages:
+        last = payloads[-1] if payloads else last_payload
+        if known_ids and last is not None:
+            ids = [f["video_id"] for f in iter_video_fields(scope_payload(last))]
+            if len(ids) >= YOUTUBE_PAGE_SIZE and all(vid in known_ids for vid in ids[-YOUTUBE_PAGE_SIZE:]):
+                print(f"이전 라운드에서 본 영상 {YOUTUBE_PAGE_SIZE}개 연속 확인 → 증분 수집 중단")
+                break
+        payload = fetch_continuation(session, token, api_key, client_version, base_url=base_url, timeout=timeout)
+        payloads.append(payload)
+        token = find_continuation_token(scope_payload(payload))
+        if on_page:
+            on_page(payloads, token)
+    return payloads
+
+
+def resume_from_checkpoint(session: requests.Session, state: Dict, base_url: str = YOUTUBE_BASE_URL,
+                           max_pages: int = 200, checkpoint_path: Optional[str] = None, timeout: float = 10) -> List[Dict]:
+    """
+    체크포인트의 continuation 토큰부터 남은 페이지만 HTTP로 받아 체크포인트 레코드 뒤에 이어 붙입니다.
+    """
+    prior = state.get("records") or []
+    print(f"체크포인트에서 재개: 레코드 {len(prior)}개 이후 continuation 토큰부터 HTTP로 수집")
+    progress = {"payloads": [], "token": state["continuation"], "pages": int(state.get("pages") or 0)}
+    save = None
+    if checkpoint_path:
+        save = make_checkpointer(checkpoint_path, lambda: {
+            "records": extend_records(prior, records_from_payloads(progress["payloads"])),
+            "continuation": progress["token"], "api_key": state.get("api_key"),
+            "client_version": state.get("client_version"), "pages": progress["pages"]})
+
+    def on_page(payloads: List[Dict], token: Optional[str]):
+        progress.update(payloads=payloads, token=token, pages=progress["pages"] + 1)
+        if save:
+            save()
+
+    try:
+        follow_continuations(session, state["continuation"], state.get("api_key"),
+                             state.get("client_version") or "2.20240101.00.00", base_url=base_url,
+                             max_pages=max_pages, on_page=on_page, timeout=timeout)
+    except Exception:
+        if save and progress["payloads"]:
+            save(force=True)
+        raise
+    return extend_records(prior, records_from_payloads(progress["payloads"]))
+
+
+def probe_first_page_http(session: requests.Session, channel_url: str, size: int = YOUTUBE_PAGE_SIZE,
+                          timeout: float = 10) -> List[Dict]:
+    """
+    '동영상' 탭 첫 응답(ytInitialData)만 받아 최신 size개 레코드를 반환합니다. (continuation 요청 없음, 변경 감지용)
+    """
+    resp = session.get(videos_tab_url(channel_url), timeout=timeout)
+    resp.raise_for_status()
+    data = extract_initial_data(resp.text)
+    if not data:
+        raise RuntimeError("ytInitialData를 찾지 못했습니다.")
+    return records_from_payloads([data])[:size]
+
+
+def collect_channel_videos_http(channel_name: str, channel_url: Optional[str] = None,
+                                session: Optional[requests.Session] = None, base_url: str = YOUTUBE_BASE_URL,
+                                max_pages: int = 200, known_ids: Optional[Set[str]] = None,
+                                timeout: float = 10, checkpoint_path: Optional[str] = None) -> List[Dict]:
+    """
+    channel_url(없으면 채널명 검색)의 '동영상' 탭 목록을 HTTP로 수집합니다.
+    known_ids가 주어지면 한 페이지가 모두 알려진 ID일 때 다음 페이지를 요청하지 않습니다. (증분 모드)
+    checkpoint_path가 주어지면 진행 상황(레코드 + 다음 토큰)을 주기적으로, 그리고 실패 시 저장하고
+    다음 호출에서 그 토큰부터 이어서 수집합니다. 정상 종료되면 체크포인트를 지웁니다.
+    """
+    own_session = session is None
+    session = session or create_session()
+    started = time.perf_counter()
+    try:
+        resumed = load_checkpoint(checkpoint_path)
+        if resumed and resumed.get("continuation"):
+            try:
+                records = resume_from_checkpoint(session, resumed, base_url=base_url, max_pages=max_pages,
+                                                 checkpoint_path=checkpoint_path, timeout=timeout)
+                clear_checkpoint(checkpoint_path)
+                print(f"HTTP 수집 완료(재개): {len(records)}개, {time.perf_counter() - started:.2f}초")
+                return records
+            except requests.HTTPError as e:
+                # 토큰 만료 등: 처음부터 다시 수집 (체크포인트 레코드는 마지막에 병합)
+                print(f"체크포인트 토큰으로 재개 실패 → 처음부터 수집: {e}")
+        if not channel_url:
+            print(f"채널 '{channel_name}' 검색 (HTTP)...")
+            channel_url = search_channel_url(session, channel_name, base_url=base_url, timeout=timeout)
+            if not channel_url:
+                raise RuntimeError(f"채널 '{channel_name}'을(를) 찾지 못했습니다.")
+        target = videos_tab_url(channel_url)
+        print(f"동영상 탭 요청: {target}")
+        resp = session.get(target, timeout=timeout)
+        resp.raise_for_status()
+        data = extract_initial_data(resp.text)
+        if not data:
+            raise RuntimeError("ytInitialData를 찾지 못했습니다. (동의 페이지 또는 UI 변경 가능성)")
+        api_key, client_version = extract_innertube_config(resp.text)
+
+        progress = {"payloads": [data], "token": find_continuation_token(scope_payload(data))}
+        save = None
+        if checkpoint_path:
+            save = make_checkpointer(checkpoint_path, lambda: {
+                "records": records_from_payloads(progress["payloads"]), "continuation": progress["token"],
+                "api_key": api_key, "client_version": client_version, "pages": len(progress["payloads"])})
+
+        def on_page(payloads: List[Dict], token: Optional[str]):
+            progress.update(payloads=[data] + payloads, token=token)
+            if save:
+                save()
+
+        try:
+            follow_continuations(session, progress["token"], api_key, client_version, base_url=base_url,
+                                 max_pages=max_pages - 1, known_ids=known_ids, last_payload=data, on_page=on_page,
+                                 timeout=timeout)
+        except Exception:
+            if save:
+                save(force=True)
+            raise
+        pages = len(progress["payloads"])
+        records = merge_resumed(records_from_payloads(progress["payloads"]), resumed)
+        clear_checkpoint(checkpoint_path)
+    finally:
+        if own_session:
+            session.close()
+    elapsed = time.perf_counter() - started
+    print(f"HTTP 수집 완료: {len(records)}개, 페이지 {pages}개, {elapsed:.2f}초")
+    return records